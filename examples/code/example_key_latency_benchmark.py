@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+"""Benchmarks how quickly the dut's UI responds to the remote:
+1. Presses GUIDE PRESSES times, returning to the starting screen with BACK after each
+2. Times each press from the key being sent to the first video frame in which the
+   guide region changes
+3. Logs the latency distribution, and writes key_latency_benchmark.csv and
+   key_latency_summary.csv to the test log directory
+4. Exits with test success if the screen responded to every press
+"""
+
+import sys
+from os import path
+
+# Since this test is in a sub-directory we need to add the directory above
+# so we can import the framework correctly
+MY_PATH = path.abspath(__file__)
+MY_DIR = path.dirname(MY_PATH)
+sys.path.append(path.join(MY_DIR,'../../'))
+from framework.core.testControl import testController
+from framework.core.keyLatencyBenchmark import keyLatencyBenchmark
+from framework.core.rcCodes import rcCode as rc
+
+# Number of key presses to measure
+PRESSES = 20
+# Screen region watched, (left, top, right, bottom), or a region name from the platform's screen regions
+REGION = (0, 0, 1920, 1080)
+
+
+class KeyLatencyBenchmark(testController):
+
+    def __init__(self):
+        super().__init__(testName='key_latency_benchmark', qcId='1')
+
+    def testFunction(self):
+        """Press the key repeatedly and check the screen responded each time.
+
+        Returns:
+            bool: True if a screen change was detected for every press.
+        """
+        self.log.stepStart(f'Press GUIDE {PRESSES} times', 'The screen changes after every press')
+        benchmark = keyLatencyBenchmark(self.commonRemote, self.capture, REGION,
+                                        log=self.log, outputPath=self.testLogPath)
+        benchmark.run(rc.GUIDE, PRESSES, resetKey=rc.BACK)
+        result = benchmark.getReport()['GUIDE']['detected'] == PRESSES
+        self.log.stepResult(result, 'Key to screen latency')
+        return result
+
+# This is what the script will run when executed
+if __name__ == '__main__':
+    TEST = KeyLatencyBenchmark()
+    TEST.run()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2023 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+"""Benchmarks how long the dut takes to become ready after a power cycle:
+1. Powers the dut off and on CYCLES times
+2. Times the first console output, bootloader, kernel and login prompt from the console,
+   and the first ping reply and SSH banner from the network
+3. Logs the latency distribution of each stage, and writes power_cycle_benchmark.csv
+   and power_cycle_summary.csv to the test log directory
+4. Exits with test success if the dut reached SSH on every cycle
+"""
+
+import sys
+from os import path
+
+# Since this test is in a sub-directory we need to add the directory above
+# so we can import the framework correctly
+MY_PATH = path.abspath(__file__)
+MY_DIR = path.dirname(MY_PATH)
+sys.path.append(path.join(MY_DIR,'../../'))
+from framework.core.testControl import testController
+from framework.core.powerCycleBenchmark import powerCycleBenchmark
+
+# Number of power cycles to measure
+CYCLES = 10
+
+
+class PowerCycleBenchmark(testController):
+
+    def __init__(self):
+        super().__init__(testName='power_cycle_benchmark', qcId='1')
+
+    def testFunction(self):
+        """Run the power cycles and check the dut became ready on each.
+
+        Returns:
+            bool: True if SSH was reached on every cycle.
+        """
+        self.log.stepStart(f'Power cycle the dut {CYCLES} times', 'SSH is reached on every cycle')
+        benchmark = powerCycleBenchmark(self.powerControl, self.session, host=self.dut.getField('ip'),
+                                        log=self.log, outputPath=self.testLogPath)
+        benchmark.run(CYCLES)
+        result = benchmark.getReport()['ssh']['reached'] == CYCLES
+        self.log.stepResult(result, 'Power cycle to ready')
+        return result
+
+# This is what the script will run when executed
+if __name__ == '__main__':
+    TEST = PowerCycleBenchmark()
+    TEST.run()
@@ -174,6 +174,26 @@ class sshConsole(consoleInterface):
             self.log.error(f"Failed to write to SSH console - {e}")
             return False
     
+    def exec_command(self, command: str, combine_stderr: bool = True) -> tuple:
+        """Run a command on a dedicated exec channel, leaving the interactive shell free.
+
+        The command's output is not scraped from the shell, so no prompt matching is needed.
+        The channel's flow control window provides backpressure if the output isn't read.
+
+        Args:
+            command (str): Command to run on the host.
+            combine_stderr (bool): Interleave stderr into stdout. Defaults to True.
+
+        Returns:
+            tuple: (stdin, stdout) file objects for the channel. stdout.readline() returns str.
+        """
+        if not self.is_open:
+            self.open()
+        channel = self.console.get_transport().open_session()
+        channel.set_combine_stderr(combine_stderr)
+        channel.exec_command(command)
+        return channel.makefile_stdin('wb'), channel.makefile('r')
+
     def open_interactive_shell(self) -> None:
         """Open an interactive shell session."""
         # Open an interactive shell
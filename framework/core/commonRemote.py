@@ -30,9 +30,12 @@
 #* ******************************************************************************
 
 import time
-import yaml
+import threading
 import os
+from concurrent.futures import ThreadPoolExecutor
 from framework.core.logModule import logModule
+from framework.core.keyMapCache import DEFAULT_CACHE_DIR, compileKeyMaps, loadKeyMaps
+from framework.core.keyScheduler import keyScheduler
 from framework.core.rcCodes import rcCode as rc
 from framework.core.remoteControllerModules import remoteArduino, \
                                                    remoteKeySimulator, \
@@ -47,13 +50,14 @@ class remoteControllerMapping():
 
         Args:
             log (logModule): log class
-            mappingConfig (dict): mapping dictionary
+            mappingConfig (dict): mapping dictionary, compiled by compileKeyMaps if it isn't already
         """
         self.log = log
         self.currentMap = None
-        self.maps = mappingConfig
+        self.currentCodes = None
+        self.maps = compileKeyMaps( mappingConfig, log )
         try:
-            defaultMap = mappingConfig[0]["name"]
+            defaultMap = self.maps[0]["name"]
         except:
             defaultMap = None
         self.setKeyMap( defaultMap )
@@ -67,17 +71,13 @@ class remoteControllerMapping():
         Returns:
             str: Translated key via map or None on failure
         """
-        if self.currentMap == None:
+        if self.currentCodes == None:
             #self.log.info("No map defined")
             return key
-        if not key in self.currentMap["codes"]:
-            self.log.error("remoteControllerMapping.get() map=[{}] not found".format(self.currentMap["name"]))
-            return None
-            
-        prefix = self.currentMap.get("prefix")
-        returnedKey=self.currentMap["codes"].get(key)
-        if prefix:
-            returnedKey = prefix + returnedKey
+        # The prefix is already applied to the compiled codes
+        returnedKey = self.currentCodes.get(key)
+        if returnedKey == None:
+            self.log.error("remoteControllerMapping.get() key=[{}] not found in map=[{}]".format(key, self.currentMap["name"]))
         return returnedKey
 
     def getKeyMap(self):
@@ -99,15 +99,14 @@ class remoteControllerMapping():
         """
         if newMapName == None:
             return False
-        if self.maps == None:
+        if not self.maps:
             self.log.error("RemoteController keyMap [{}] not found".format(newMapName))
             return False
         found = False
-        if isinstance(self.maps, dict):
-            self.maps = list(self.maps.values())
         for x in self.maps:
             if x["name"] == newMapName:
                 self.currentMap = x
+                self.currentCodes = x["wireCodes"]
                 found = True
                 break
         if found == False:
@@ -129,6 +128,15 @@ class commonRemoteClass():
         keyMap = remoteConfig.get("map")
         self.remoteMap = remoteControllerMapping( log, rcMappingConfig )
         self.setKeyMap( keyMap )
+        # Key presses are timed on the monotonic clock, held keys auto-repeat every repeat_interval_ms
+        self.scheduler = keyScheduler( log, remoteConfig.get("repeat_interval_ms", 100) / 1000 )
+        # Keys sent with sendKeyAsync are queued, in order, for a single worker thread.
+        # Each queued run has its own cancel event, kept with its future.
+        self.__keyExecutor = None
+        self.__keyRuns = []
+        self.__keyLock = threading.Lock()
+        # The scheduler of the queued run on the worker thread
+        self.__runState = threading.local()
         self.type = remoteConfig.get("type")
         if self.type == "olimex":
             self.remoteController = remoteOlimex( self.log, remoteConfig )
@@ -145,6 +153,9 @@ class commonRemoteClass():
 
     def __decodeRemoteMapConfig(self):
         """Decode the remote map configuration file
+
+        The maps are compiled once and cached in the keymap_cache directory,
+        so unchanged files load without being parsed.
         """
         configFile = self.remoteConfig.get("config")
         if configFile == None:
@@ -155,11 +166,8 @@ class commonRemoteClass():
         if os.path.exists(fullPath) == False:
             print("config: file is required to run: ERROR, missing url=[{}]".format(fullPath))
             os._exit(1)
-        with open(configFile) as inputFile:
-            inputFile.seek(0, os.SEEK_SET)
-            config = yaml.full_load(inputFile)
-        keyDictionary = config.get('remoteMaps',{})
-        return keyDictionary
+        cacheDir = self.remoteConfig.get("keymap_cache", DEFAULT_CACHE_DIR)
+        return loadKeyMaps( fullPath, cacheDir, self.log )
 
     def sendKey(self, keycode:dict, delay:int=1, repeat:int=1, randomRepeat:int=0):
         """Send a key to the remoteCommander
@@ -181,9 +189,151 @@ class commonRemoteClass():
                 self.log.info( "sendKey[" + keycode.name + "] delay:[" +str(delay)+"]" )
 
         mappedCode = self.remoteMap.getMappedKey( keycode.name )
-        result = self.remoteController.sendKey( mappedCode, repeat, delay)
+        if mappedCode == None:
+            return False
+        # Presses are planned delay apart from the first, so the time each send takes doesn't add up
+        result = self.__sendPresses( [(mappedCode, 0, delay * 1000)] * repeat )
+        return result
+
+    def sendKeys(self, sequence:list):
+        """Send a sequence of keys, e.g. to navigate a menu or zap channels
+
+        Remotes that can, send the whole sequence in one operation over a single
+        connection. Other remotes send the keys one at a time. Either way the keys
+        are sent on the schedule the sequence sets out.
+
+        Args:
+            sequence (list): Keys to send, as (keycode, holdMs, gapMs) tuples, where holdMs is how long
+                             the key is held, auto-repeating, and gapMs the wait after it is released.
+                             A keycode on its own is sent without a hold or a wait.
+
+        Returns:
+            bool: True if every key was sent, False on the first failure
+        """
+        codes = []
+        for item in sequence:
+            keycode, holdMs, gapMs = item if isinstance(item, tuple) else (item, 0, 0)
+            mappedCode = self.remoteMap.getMappedKey( keycode.name )
+            if mappedCode == None:
+                self.log.error("sendKeys() key [{}] not mapped".format(keycode.name))
+                return False
+            codes.append((mappedCode, holdMs, gapMs))
+        self.log.info( "sendKeys[" + ", ".join(item[0].name if isinstance(item, tuple) else item.name for item in sequence) + "]" )
+        return self.__sendPresses( codes )
+
+    def sendKeyAsync(self, keycode:dict, delay:int=1, repeat:int=1, callback=None):
+        """Queue a key to be sent in the background, see sendKey
+
+        Keys are sent in the order they are queued, so the test can carry on, e.g.
+        checking the console, while they are pressed.
+
+        Args:
+            keycode (dict): Key value pair
+            delay (int, optional): Delay in seconds between repeats. Defaults to 1.
+            repeat (int, optional): How many key repeats. Defaults to 1.
+            callback (callable, optional): Called with the future when the key is done or cancelled. Defaults to None.
+
+        Returns:
+            Future: Result is True if the key was sent, False on failure or if stopped by cancelKeys
+        """
+        return self.__queueKeys( callback, self.sendKey, keycode, delay, repeat )
+
+    def sendKeysAsync(self, sequence:list, callback=None):
+        """Queue a sequence of keys to be sent in the background, see sendKeys
+
+        Args:
+            sequence (list): Keys to send, as (keycode, holdMs, gapMs) tuples
+            callback (callable, optional): Called with the future when the sequence is done or cancelled. Defaults to None.
+
+        Returns:
+            Future: Result is True if every key was sent, False on failure or if stopped by cancelKeys
+        """
+        return self.__queueKeys( callback, self.sendKeys, sequence )
+
+    def cancelKeys(self):
+        """Cancel the queued keys, and stop the key being sent before its next press
+
+        Only keys queued with sendKeyAsync or sendKeysAsync are stopped, keys sent
+        with sendKey or sendKeys aren't affected.
+
+        Returns:
+            int: Number of queued keys cancelled before they started
+        """
+        with self.__keyLock:
+            runs = self.__keyRuns
+            self.__keyRuns = []
+            # Each event only stops its own run, so setting it after the run has finished is harmless
+            for future, cancelEvent in runs:
+                cancelEvent.set()
+            cancelled = sum( 1 for future, cancelEvent in runs if future.cancel() )
+        self.log.info( "cancelKeys() cancelled [{}] queued keys".format(cancelled) )
+        return cancelled
+
+    def waitForKeys(self, timeout:float=None):
+        """Wait for the queued keys to be sent
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to None, no limit.
+
+        Returns:
+            bool: True if every queued key was sent, False on a failure, cancellation or timeout
+        """
+        with self.__keyLock:
+            futures = [ future for future, cancelEvent in self.__keyRuns ]
+        end = None if timeout == None else time.monotonic() + timeout
+        result = True
+        for future in futures:
+            try:
+                remaining = None if end == None else max(0, end - time.monotonic())
+                if future.result( remaining ) != True:
+                    result = False
+            except Exception:
+                result = False
         return result
 
+    def __queueKeys(self, callback, function, *args):
+        with self.__keyLock:
+            if self.__keyExecutor == None:
+                self.__keyExecutor = ThreadPoolExecutor( max_workers=1, thread_name_prefix="commonRemote" )
+            self.__keyRuns = [ run for run in self.__keyRuns if not run[0].done() ]
+            cancelEvent = threading.Event()
+            future = self.__keyExecutor.submit( self.__runQueued, cancelEvent, function, *args )
+            self.__keyRuns.append( (future, cancelEvent) )
+        if callback != None:
+            future.add_done_callback( callback )
+        return future
+
+    def __runQueued(self, cancelEvent, function, *args):
+        # The run's presses go through a scheduler that only its own cancel event stops
+        self.__runState.scheduler = self.scheduler.withCancelEvent( cancelEvent )
+        try:
+            return function( *args )
+        finally:
+            self.__runState.scheduler = None
+
+    def getKeyTimings(self):
+        """Get the planned and actual time of the recent key presses
+
+        Returns:
+            list: Per press, the "code", the "planned" and "actual" time it was sent, the time
+                  sending it finished ("sent"), all from time.monotonic(), and the "result"
+        """
+        return list(self.scheduler.history)
+
+    def __sendPresses(self, codes:list):
+        """Send presses through the remote, on the scheduler's timing
+
+        Args:
+            codes (list): (code, holdMs, gapMs) per key
+
+        Returns:
+            bool: True if every key was sent, False on the first failure
+        """
+        scheduler = getattr( self.__runState, "scheduler", None ) or self.scheduler
+        if hasattr(self.remoteController, "sendKeys"):
+            return self.remoteController.sendKeys( codes, scheduler )
+        return scheduler.run( codes, lambda code: self.remoteController.sendKey( code, 1, 0 ) )
+
     def setKeyMap( self, name:dict ):
         """Set the Key Translation Map
 
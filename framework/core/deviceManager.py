@@ -40,6 +40,7 @@ from framework.core.logModule import logModule
 from framework.core.powerControl import powerControlClass
 from framework.core.outboundClient import outboundClientClass
 from framework.core.commonRemote import commonRemoteClass
+from framework.core.remoteGroup import remoteGroup
 from framework.core.hdmiCECController import HDMICECController
 from framework.core.avSyncController import AVSyncController
 from framework.core.utilities import utilities
@@ -347,3 +348,25 @@ class deviceManager():
             self.log.error("Invalid deviceName [{}]".format(deviceName))
         return device
 
+    def getRemoteGroup(self, deviceNames:list=None):
+        """Gets a remote group, to send the same keys to several devices at once
+
+        Args:
+            deviceNames (list, optional): Names of the devices. Defaults to every device with a remoteController.
+
+        Returns:
+            remoteGroup: The group, or None on failure
+        """
+        if deviceNames == None:
+            deviceNames = [name for name, device in self.devices.items() if device.remoteController != None]
+        members = dict()
+        for name in deviceNames:
+            device = self.getDevice(name)
+            if device == None:
+                return None
+            if device.remoteController == None:
+                self.log.error("Device [{}] has no remoteController".format(name))
+                return None
+            members[name] = device
+        return remoteGroup(self.log, members)
+
@@ -40,6 +40,7 @@ from framework.core.logModule import logModule
 from framework.core.streamToFile import StreamToFile
 from framework.core.hdmicecModules import CECClientController, RemoteCECClient, CECDeviceType
 from framework.core.hdmicecModules.virtualCECController import virtualCECController
+from framework.core.hdmicecModules.simulatedCECController import simulatedCECController
 
 class HDMICECController():
     """
@@ -59,11 +60,15 @@ class HDMICECController():
         self.controllerType = config.get('type')
         self.cecAdaptor = config.get('adaptor')
         self._streamFile = path.join(self._log.logPath, f'{self.controllerType.lower()}_{str(datetime.now().timestamp())}')
-        self._stream = StreamToFile(self._streamFile)
+        self._stream = StreamToFile(self._streamFile, log=self._log)
+        adaptorCacheTTL = config.get('adaptor_cache_ttl', 300)
+        topologyTTL = config.get('topology_ttl', 300)
         if self.controllerType.lower() == 'cec-client':
             self.controller = CECClientController(self.cecAdaptor,
                                                   self._log,
-                                                  self._stream)
+                                                  self._stream,
+                                                  adaptor_cache_ttl=adaptorCacheTTL,
+                                                  topology_ttl=topologyTTL)
         elif self.controllerType.lower() == 'remote-cec-client':
             self.controller = RemoteCECClient(self.cecAdaptor,
                                               self._log,
@@ -72,7 +77,9 @@ class HDMICECController():
                                               username=config.get('username',''),
                                               password=config.get('password',''),
                                               port=config.get('port',22),
-                                              prompt=config.get('prompt', ':~'))
+                                              prompt=config.get('prompt', ':~'),
+                                              adaptor_cache_ttl=adaptorCacheTTL,
+                                              topology_ttl=topologyTTL)
         elif self.controllerType.lower() == 'virtual-cec-client':
             self.controller = virtualCECController(self.cecAdaptor,
                                                    self._log,
@@ -83,7 +90,16 @@ class HDMICECController():
                                                    port=config.get('port',22),
                                                    prompt=config.get('prompt', '~#'),
                                                    device_configuration=config.get('device_network_configuration',''),
-                                                   control_port=config.get('control_port', 8080))
+                                                   control_port=config.get('control_port', 8080),
+                                                   control_transport=config.get('control_transport', 'shell'))
+        elif self.controllerType.lower() == 'simulated-cec-client':
+            self.controller = simulatedCECController(self.cecAdaptor,
+                                                     self._log,
+                                                     self._stream,
+                                                     device_configuration=config.get('device_network_configuration',''),
+                                                     latency_ms=config.get('latency_ms', 0),
+                                                     bus_timing=config.get('bus_timing', False),
+                                                     topology_ttl=topologyTTL)
         self._read_line = 0
 
     def sendMessage(self, sourceAddress: str, destAddress: str, opCode: str, payload: list = None) -> None:
@@ -103,6 +119,33 @@ class HDMICECController():
                         (sourceAddress, destAddress, opCode, payload_string))
         self.controller.sendMessage(sourceAddress, destAddress, opCode, payload=payload)
 
+    def sendSequence(self, sequence: list) -> list:
+        """
+        Sends a sequence of messages with precise gaps between them, e.g. power on,
+        set stream path and a run of user control presses.
+
+        The whole sequence is handed to the controller, which schedules the messages
+        on a monotonic clock rather than relying on the timing of the calling code.
+
+        Args:
+          sequence (list): List of (sourceAddress, destAddress, opCode, payload, delayMs) tuples.
+                           delayMs is the gap after the previous message. payload may be None.
+                           e.g. [('1', '0', '0x04', None, 0), ('1', 'F', '0x86', ['0x10', '0x00'], 100)]
+
+        Returns:
+            list: A dictionary per message with the keys: sourceAddress, destAddress, opCode,
+                  payload, planned and sent. planned and sent are the planned and actual send
+                  times in milliseconds from the start of the sequence. sent is None if the
+                  message wasn't sent.
+        """
+        self._log.debug('Sending sequence of [%d] CEC messages' % len(sequence))
+        results = self.controller.sendSequence(sequence)
+        for result in results:
+            if result.get('sent') is None:
+                self._log.warn('CEC message not sent: Source=[%s] Dest=[%s] opCode=[%s]' %
+                               (result['sourceAddress'], result['destAddress'], result['opCode']))
+        return results
+
     def checkMessageReceived(self, sourceAddress: str, destAddress: str, opCode: str, timeout: int = 10, payload: list = None) -> bool:
         """
         This function checks to see if a specified opCode has been received.
@@ -129,10 +172,14 @@ class HDMICECController():
             result = True
         return result
 
-    def listDevices(self) -> list:
+    def listDevices(self, refresh: bool = False) -> list:
         """
         List CEC devices on CEC network.
 
+        The list is answered from a topology that is seeded by a network scan and
+        kept up to date from the CEC traffic seen since. A rescan only happens when
+        requested or when the last scan is older than the configured `topology_ttl`.
+
         The list returned contains dicts in the following format:
             {'active source': False,
              'vendor': 'Unknown',
@@ -143,11 +190,15 @@ class HDMICECController():
              'physical address': '0.0.0.0',
              'name': 'TV',
              'logical address': '0'}
+
+        Args:
+            refresh (bool): Force a rescan of the CEC network. Defaults to False.
+
         Returns:
             list: A list of dictionaries representing discovered devices.
         """
         self._log.debug('Listing devices on CEC network')
-        return self.controller.listDevices()
+        return self.controller.listDevices(refresh=refresh)
 
     def start(self):
         """Start the CECContoller.
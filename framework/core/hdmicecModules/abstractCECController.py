@@ -32,18 +32,45 @@
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
 import os
+import threading
+import time
 
 from framework.core.logModule import logModule
 from framework.core.streamToFile import StreamToFile
+from .cecTopology import CECTopology
 from .cecTypes import CECDeviceType
 
+# Adaptor discovery results shared between controllers, keyed by host.
+# Each entry is a tuple of (discovery time, list of adaptors).
+_ADAPTOR_CACHE = {}
+_ADAPTOR_CACHE_LOCK = threading.Lock()
+
+def sleepUntil(deadline: float) -> None:
+    """
+    Sleep until a time.monotonic() deadline, spinning for the final millisecond
+    as sleep alone isn't precise enough for CEC frame timings.
+
+    Args:
+        deadline (float): time.monotonic() value to sleep until.
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if remaining > 0.001:
+            time.sleep(remaining - 0.001)
+
 class CECInterface(metaclass=ABCMeta):
 
-    def __init__(self, adaptor_path:str, logger:logModule, streamLogger: StreamToFile):
+    def __init__(self, adaptor_path:str, logger:logModule, streamLogger: StreamToFile,
+                 adaptor_cache_ttl: float = 300, topology_ttl: float = 300):
         self.adaptor = adaptor_path
         self._log = logger
         self._console = None
         self._stream = streamLogger
+        self._adaptorCacheTTL = adaptor_cache_ttl
+        self._topology = CECTopology(ttl=topology_ttl)
+        self._stream.addLineCallback(self._topology.processLine)
 
     @abstractmethod
     def sendMessage(cls, sourceAddress: str, destAddress: str, opCode: str, payload: list = None, deviceType: CECDeviceType=None) -> None:
@@ -59,7 +86,7 @@ class CECInterface(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def listDevices(cls) -> list:
+    def listDevices(cls, refresh: bool = False) -> list:
         """
         List CEC devices on CEC network.
 
@@ -73,6 +100,11 @@ class CECInterface(metaclass=ABCMeta):
              'physical address': '0.0.0.0',
              'name': 'TV',
              'logical address': '0'}
+
+        Args:
+            refresh (bool): Force a rescan of the CEC network instead of answering
+                            from the cached topology. Defaults to False.
+
         Returns:
             list: A list of dictionaries representing discovered devices.
         """
@@ -90,6 +122,142 @@ class CECInterface(metaclass=ABCMeta):
         """
         pass
 
+    def _getAdaptors(self) -> list:
+        """
+        Retrieves a list of available CEC adaptors. Controllers that validate
+        their adaptor should override this.
+
+        Returns:
+            list: A list of dictionaries representing available adaptors with details like COM port.
+        """
+        return []
+
+    def _getCachedAdaptors(self, host: str, refresh: bool = False) -> list:
+        """
+        Retrieves the list of available CEC adaptors on a host, using the result of
+        a previous discovery when it is younger than the adaptor cache ttl.
+
+        Args:
+            host (str): Name of the host the adaptors are attached to.
+            refresh (bool): Ignore any cached result and rediscover. Defaults to False.
+
+        Returns:
+            list: A list of dictionaries representing available adaptors with details like COM port.
+        """
+        if not refresh:
+            adaptors = self._readAdaptorCache(host)
+            if adaptors is not None:
+                self._log.debug('Using cached CEC adaptor list for [%s]' % host)
+                return adaptors
+        adaptors = self._getAdaptors()
+        with _ADAPTOR_CACHE_LOCK:
+            _ADAPTOR_CACHE[host] = (time.monotonic(), adaptors)
+        return adaptors
+
+    def _readAdaptorCache(self, host: str) -> list:
+        """
+        Reads the cached adaptor list for a host.
+
+        Args:
+            host (str): Name of the host the adaptors are attached to.
+
+        Returns:
+            list: The cached adaptor list. None if there isn't one or it has expired.
+        """
+        with _ADAPTOR_CACHE_LOCK:
+            cached = _ADAPTOR_CACHE.get(host)
+        if cached is None or (time.monotonic() - cached[0]) > self._adaptorCacheTTL:
+            return None
+        return cached[1]
+
+    def _checkAdaptor(self, host: str) -> None:
+        """
+        Check the configured adaptor is available on the host. A cached adaptor list
+        that doesn't contain the adaptor is rediscovered before failing, in case
+        the adaptor has been connected since the last discovery.
+
+        Args:
+            host (str): Name of the host the adaptor is attached to.
+
+        Raises:
+            AttributeError: If the specified CEC adaptor is not found.
+        """
+        wasCached = self._readAdaptorCache(host) is not None
+        adaptors = self._getCachedAdaptors(host)
+        if self.adaptor not in map(lambda x: x.get('com port'), adaptors) and wasCached:
+            adaptors = self._getCachedAdaptors(host, refresh=True)
+        if self.adaptor not in map(lambda x: x.get('com port'), adaptors):
+            raise AttributeError('CEC Adaptor specified not found')
+
+    def sendSequence(self, sequence: list) -> list:
+        """
+        Sends a sequence of messages, scheduled on the monotonic clock.
+
+        Each message is sent delayMs after the planned send time of the previous one,
+        so gaps don't drift with the time taken to send. Messages that are due at the
+        same time are handed to the backend together by _sendBatch.
+
+        Args:
+            sequence (list): List of (sourceAddress, destAddress, opCode, payload, delayMs) tuples.
+                             payload may be None.
+
+        Returns:
+            list: A dictionary per message with the keys: sourceAddress, destAddress, opCode,
+                  payload, planned and sent. planned and sent are in milliseconds from the
+                  start of the sequence. sent is None if the message wasn't sent.
+        """
+        start = time.monotonic()
+        schedule = []
+        plannedMs = 0
+        for sourceAddress, destAddress, opCode, payload, delayMs in sequence:
+            plannedMs += delayMs
+            schedule.append((plannedMs, (sourceAddress, destAddress, opCode, payload)))
+        results = []
+        index = 0
+        while index < len(schedule):
+            sleepUntil(start + schedule[index][0] / 1000)
+            nowMs = (time.monotonic() - start) * 1000
+            batch = [schedule[index]]
+            index += 1
+            while index < len(schedule) and schedule[index][0] <= nowMs:
+                batch.append(schedule[index])
+                index += 1
+            try:
+                batchResults = self._sendBatch([message for _, message in batch])
+            except Exception as e:
+                self._log.error('Failed to send [%d] CEC messages: %s' % (len(batch), e))
+                batchResults = [False] * len(batch)
+            sent = (time.monotonic() - start) * 1000
+            for (plannedMs, (sourceAddress, destAddress, opCode, payload)), result in zip(batch, batchResults):
+                results.append({'sourceAddress': sourceAddress,
+                                'destAddress': destAddress,
+                                'opCode': opCode,
+                                'payload': payload,
+                                'planned': plannedMs,
+                                'sent': sent if result else None})
+        return results
+
+    def _sendBatch(self, messages: list) -> list:
+        """
+        Sends messages that are due at the same time. Controllers that can send
+        several messages in one operation should override this.
+
+        Args:
+            messages (list): List of (sourceAddress, destAddress, opCode, payload) tuples.
+
+        Returns:
+            list: A bool per message, True if it was sent.
+        """
+        results = []
+        for sourceAddress, destAddress, opCode, payload in messages:
+            try:
+                # sendMessage returns None for controllers that raise on failure
+                results.append(self.sendMessage(sourceAddress, destAddress, opCode, payload=payload) is not False)
+            except Exception as e:
+                self._log.error('Failed to send CEC message [%s]: %s' % (opCode, e))
+                results.append(False)
+        return results
+
     def formatMessage(cls, sourceAddress: str, destAddress: str, opCode:str, payload: list = None) -> str:
         """Format the input information into the required message string
             for the CECController.
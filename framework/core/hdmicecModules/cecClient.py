@@ -49,22 +49,31 @@ class CECClientController(CECInterface):
     devices through the `cec-client` command-line tool.
     """
 
-    def __init__(self, adaptor_path:str, logger:logModule, streamLogger: StreamToFile):
+    def __init__(self, adaptor_path:str, logger:logModule, streamLogger: StreamToFile,
+                 adaptor_cache_ttl: float = 300, topology_ttl: float = 300):
         """
         Initializes the CECClientController instance.
 
         Args:
             adaptor_path (str): Path to the CEC adaptor device.
             logger (logModule): An instance of a logging module for recording messages.
+            streamLogger (StreamToFile): Stream logger for the cec-client output.
+            adaptor_cache_ttl (float, optional): Time, in seconds, adaptor discovery results
+                                                 are reused for. Defaults to 300.
+            topology_ttl (float, optional): Time, in seconds, before the device list is
+                                            refreshed with a network scan. Defaults to 300.
 
         Raises:
             AttributeError: If the specified CEC adaptor is not found.
         """
 
-        super().__init__(adaptor_path=adaptor_path, logger=logger, streamLogger=streamLogger)
+        super().__init__(adaptor_path=adaptor_path,
+                         logger=logger,
+                         streamLogger=streamLogger,
+                         adaptor_cache_ttl=adaptor_cache_ttl,
+                         topology_ttl=topology_ttl)
         self._log.debug('Initialising CECClientController for [%s]' % self.adaptor)
-        if self.adaptor not in map(lambda x: x.get('com port'),self._getAdaptors()):
-            raise AttributeError('CEC Adaptor specified not found')
+        self._checkAdaptor('localhost')
         self.start()
 
     def start(self):
@@ -89,6 +98,15 @@ class CECClientController(CECInterface):
         self._console.stdin.write(f'tx {message}\n')
         self._console.stdin.flush()
 
+    def _sendBatch(self, messages: list) -> list:
+        commands = ''
+        for sourceAddress, destAddress, opCode, payload in messages:
+            message = self.formatMessage(sourceAddress, destAddress, opCode, payload=payload)
+            commands += f'tx {message}\n'
+        self._console.stdin.write(commands)
+        self._console.stdin.flush()
+        return [True] * len(messages)
+
     def _getAdaptors(self) -> list:
         """
         Retrieves a list of available CEC adaptors using `cec-client`.
@@ -116,7 +134,7 @@ class CECClientController(CECInterface):
             list: A list of dictionaries representing discovered devices with details.
         """
         devicesOnNetwork = []
-        self._console.stdin.write('scan')
+        self._console.stdin.write('scan\n')
         self._console.stdin.flush()
         output = self._stream.readUntil('currently active source',30)
         if len(output) > 0:
@@ -125,7 +143,9 @@ class CECClientController(CECInterface):
             devicesOnNetwork = self._splitDeviceSectionsToDicts(output)
         return devicesOnNetwork
 
-    def listDevices(self) -> list:
+    def listDevices(self, refresh: bool = False) -> list:
+        if refresh is False and self._topology.isStale() is False:
+            return self._topology.listDevices()
         devices = self._scanCECNetwork()
         for device_dict in devices:
             # Remove the 'address' from the dict and change it to 'physical address'
@@ -140,6 +160,8 @@ class CECClientController(CECInterface):
                 device_dict['active source'] = True
             else:
                 device_dict['active source'] = False
+        if len(devices) > 0:
+            self._topology.updateFromScan(devices)
         return devices
 
     def _splitDeviceSectionsToDicts(self,command_output:str) -> list:
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : CEC network topology model. Seeded from a full network scan
+#*   **          and kept up to date from the CEC traffic observed afterwards.
+#*   **
+#* ******************************************************************************
+
+import copy
+import re
+import threading
+import time
+
+TRAFFIC_REGEX = re.compile(r'(?:<<|>>)\s+([0-9a-fA-F]{2}(?::[0-9a-fA-F]{2})*)\s*$')
+
+POWER_STATUS = {0x00: 'on',
+                0x01: 'standby',
+                0x02: 'in transition from standby to on',
+                0x03: 'in transition from on to standby'}
+
+CEC_VERSION = {0x04: '1.3a',
+               0x05: '1.4',
+               0x06: '2.0'}
+
+# Logical address 0xF is used as the broadcast destination and as the
+# source for unregistered devices, so it never describes a real device.
+UNREGISTERED = 'F'
+
+
+class CECTopology():
+    """
+    Model of the devices on a CEC network.
+
+    The model is seeded from a full network scan and then updated incrementally
+    from observed traffic, so device lists can be answered without rescanning.
+    A scan is considered stale once it is older than the configured ttl.
+    """
+
+    def __init__(self, ttl: float = 300):
+        """
+        Initialises the CECTopology instance.
+
+        Args:
+            ttl (float): Time, in seconds, before the last full scan is considered stale.
+                         Defaults to 300.
+        """
+        self.ttl = ttl
+        self._devices = {}
+        self._lastScan = None
+        self._lock = threading.Lock()
+
+    def isStale(self) -> bool:
+        """
+        Check if the topology needs refreshing with a full network scan.
+
+        Returns:
+            bool: True if no scan has been recorded or it is older than the ttl.
+        """
+        if self._lastScan is None:
+            return True
+        return (time.monotonic() - self._lastScan) > self.ttl
+
+    def invalidate(self) -> None:
+        """Mark the topology as stale, forcing the next listing to rescan.
+        """
+        self._lastScan = None
+
+    def updateFromScan(self, devices: list) -> None:
+        """
+        Replace the topology with the result of a full network scan.
+
+        Args:
+            devices (list): List of device dictionaries, as returned by listDevices.
+        """
+        with self._lock:
+            self._devices = {}
+            for device in devices:
+                address = str(device.get('logical address')).upper()
+                self._devices[address] = dict(device)
+            self._lastScan = time.monotonic()
+
+    def processLine(self, line: str) -> None:
+        """
+        Update the topology from a line of cec-client output.
+        Lines that do not contain CEC traffic are ignored.
+
+        Args:
+            line (str): A single line of cec-client output.
+        """
+        frame = self.parseTrafficLine(line)
+        if frame:
+            self.updateFromFrame(*frame)
+
+    @staticmethod
+    def parseTrafficLine(line: str) -> tuple:
+        """
+        Parse a cec-client TRAFFIC line into its component parts.
+
+        Args:
+            line (str): A single line of cec-client output.
+                        e.g. 'TRAFFIC: [  6307]	>> 0f:87:00:00:f0'
+
+        Returns:
+            tuple: (sourceAddress, destAddress, opCode, payload) with the opCode and
+                   payload as integers. opCode is None for polling messages.
+                   None is returned if the line isn't CEC traffic.
+        """
+        match = TRAFFIC_REGEX.search(line)
+        if match is None:
+            return None
+        frame = [int(byte, 16) for byte in match.group(1).split(':')]
+        sourceAddress = '%X' % (frame[0] >> 4)
+        destAddress = '%X' % (frame[0] & 0x0F)
+        opCode = frame[1] if len(frame) > 1 else None
+        return sourceAddress, destAddress, opCode, frame[2:]
+
+    def updateFromFrame(self, sourceAddress: str, destAddress: str, opCode: int, payload: list) -> None:
+        """
+        Update the topology from a single CEC frame.
+
+        Args:
+            sourceAddress (str): The logical address of the source device (0-9 or A-F).
+            destAddress (str): The logical address of the destination device (0-9 or A-F).
+            opCode (int): The opCode of the frame. None for polling messages.
+            payload (list): List of integers making up the payload of the frame.
+        """
+        sourceAddress = sourceAddress.upper()
+        destAddress = destAddress.upper()
+        with self._lock:
+            source = None
+            if sourceAddress != UNREGISTERED:
+                source = self._getDevice(sourceAddress)
+            if opCode is None or source is None:
+                return
+            if opCode == 0x84 and len(payload) >= 2:
+                # Report Physical Address
+                source['physical address'] = self._physicalAddress(payload)
+            elif opCode == 0x47:
+                # Set OSD Name
+                name = bytes(payload).decode('ascii', errors='replace')
+                source['osd string'] = name
+                source['name'] = name
+            elif opCode == 0x82 and len(payload) >= 2:
+                # Active Source
+                for device in self._devices.values():
+                    device['active source'] = False
+                source['active source'] = True
+                source['physical address'] = self._physicalAddress(payload)
+            elif opCode == 0x9D:
+                # Inactive Source
+                source['active source'] = False
+            elif opCode == 0x90 and payload:
+                # Report Power Status
+                source['power status'] = POWER_STATUS.get(payload[0], 'unknown')
+            elif opCode == 0x9E and payload:
+                # CEC Version
+                source['CEC version'] = CEC_VERSION.get(payload[0], 'unknown')
+            elif opCode == 0x87 and len(payload) >= 3:
+                # Device Vendor ID
+                source['vendor'] = '%02X%02X%02X' % tuple(payload[:3])
+            elif opCode == 0x32 and len(payload) >= 3:
+                # Set Menu Language
+                source['language'] = bytes(payload[:3]).decode('ascii', errors='replace')
+            elif opCode == 0x36 and destAddress != UNREGISTERED:
+                # Standby sent to a single device
+                self._getDevice(destAddress)['power status'] = 'standby'
+            elif opCode in (0x04, 0x0D) and destAddress != UNREGISTERED:
+                # Image View On/Text View On
+                self._getDevice(destAddress)['power status'] = 'on'
+
+    def listDevices(self) -> list:
+        """
+        List the devices currently in the topology.
+
+        Returns:
+            list: A list of dictionaries representing the known devices.
+        """
+        with self._lock:
+            devices = sorted(self._devices.values(), key=lambda x: int(str(x.get('logical address')), 16))
+            return copy.deepcopy(devices)
+
+    def _getDevice(self, logicalAddress: str) -> dict:
+        """
+        Get a device from the topology, adding it if it hasn't been seen before.
+        Must be called with the lock held.
+
+        Args:
+            logicalAddress (str): The logical address of the device (0-9 or A-F).
+
+        Returns:
+            dict: The device dictionary.
+        """
+        device = self._devices.get(logicalAddress)
+        if device is None:
+            device = {'logical address': logicalAddress,
+                      'physical address': 'Unknown',
+                      'name': 'Unknown',
+                      'osd string': 'Unknown',
+                      'vendor': 'Unknown',
+                      'CEC version': 'Unknown',
+                      'power status': 'Unknown',
+                      'language': 'Unknown',
+                      'active source': False}
+            self._devices[logicalAddress] = device
+        return device
+
+    @staticmethod
+    def _physicalAddress(payload: list) -> str:
+        """
+        Convert the first two bytes of a payload into a physical address string.
+
+        Args:
+            payload (list): List of integers. The first two are the physical address.
+
+        Returns:
+            str: Physical address in the form 'a.b.c.d'.
+        """
+        return '%x.%x.%x.%x' % (payload[0] >> 4, payload[0] & 0x0F, payload[1] >> 4, payload[1] & 0x0F)
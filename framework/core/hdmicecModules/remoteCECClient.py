@@ -37,10 +37,15 @@ from framework.core.commandModules.sshConsole import sshConsole
 from .abstractCECController import CECInterface
 from .cecTypes import CECDeviceType
 
+# Time in seconds to wait for the remote cec-client to exit before closing its channel
+STOP_TIMEOUT = 5
+
 class RemoteCECClient(CECInterface):
 
-    def __init__(self, adaptor: str,logger: logModule, streamLogger: StreamToFile, address: str, port: int = 22, username: str = '', password: str = '', prompt = ':~'):
-        super().__init__(adaptor, logger, streamLogger)
+    def __init__(self, adaptor: str,logger: logModule, streamLogger: StreamToFile, address: str, port: int = 22, username: str = '', password: str = '', prompt = ':~',
+                 adaptor_cache_ttl: float = 300, topology_ttl: float = 300):
+        super().__init__(adaptor, logger, streamLogger, adaptor_cache_ttl=adaptor_cache_ttl, topology_ttl=topology_ttl)
+        self._address = address
         self._console = sshConsole(self._log,address, username, password, port=port, prompt=prompt)
         self._log.debug('Initialising RemoteCECClient controller')
         try:
@@ -48,18 +53,33 @@ class RemoteCECClient(CECInterface):
         except:
             self._log.critical('Could not open connection to RemoteCECClient controller')
             raise
-        if self.adaptor not in map(lambda x: x.get('com port'),self._getAdaptors()):
-            raise AttributeError('CEC Adaptor specified not found')
+        self._checkAdaptor(self._address)
         self.start()
 
     def start(self):
-        self._console.write(f'cec-client {self.adaptor}')
-        self._stream.writeStreamToFile(self._console.shell.makefile())
+        # cec-client runs on its own exec channel, so its output streams straight into the
+        # local parser and the interactive shell is left free. stdbuf stops the output
+        # being block buffered as it's no longer written to a terminal.
+        self._stdin, self._stdout = self._console.exec_command(f'stdbuf -oL -eL cec-client {self.adaptor}')
+        self._stream.writeStreamToFile(self._stdout)
 
     def stop(self):
-        self._console.write('q')
+        self._writeCommand('q')
+        # Give cec-client time to quit, then close its channel whether it has or not
+        self._stdout.channel.status_event.wait(STOP_TIMEOUT)
+        self._stdout.channel.close()
         self._stream.stopStreamedLog()
 
+    def _writeCommand(self, command: str) -> None:
+        """
+        Write a command to the stdin of the remote cec-client.
+
+        Args:
+            command (str): The cec-client command.
+        """
+        self._stdin.write(f'{command}\n')
+        self._stdin.flush()
+
     def _getAdaptors(self) -> list:
         """
         Retrieves a list of available CEC adaptors using `cec-client`.
@@ -67,8 +87,10 @@ class RemoteCECClient(CECInterface):
         Returns:
             list: A list of dictionaries representing available adaptors with details like COM port.
         """
-        self._console.write(f'cec-client -l')
-        stdout = self._console.read()
+        _, output = self._console.exec_command('cec-client -l')
+        stdout = output.read()
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode('utf-8', errors='replace')
         stdout = stdout.replace('\r\n','\n')
         adaptor_count = re.search(r'Found devices: ([0-9]+)',stdout, re.M).group(1)
         adaptors = self._splitDeviceSectionsToDicts(stdout)
@@ -76,10 +98,20 @@ class RemoteCECClient(CECInterface):
 
     def sendMessage(self, sourceAddress: str, destAddress: str, opCode: str, payload: list = None) -> None:
         message = self.formatMessage(sourceAddress, destAddress, opCode, payload=payload)
-        self._console.write(f'tx {message}')
+        self._writeCommand(f'tx {message}')
+
+    def _sendBatch(self, messages: list) -> list:
+        commands = []
+        for sourceAddress, destAddress, opCode, payload in messages:
+            message = self.formatMessage(sourceAddress, destAddress, opCode, payload=payload)
+            commands.append(f'tx {message}')
+        self._writeCommand('\n'.join(commands))
+        return [True] * len(messages)
 
-    def listDevices(self) -> list:
-        self._console.write(f'scan')
+    def listDevices(self, refresh: bool = False) -> list:
+        if refresh is False and self._topology.isStale() is False:
+            return self._topology.listDevices()
+        self._writeCommand('scan')
         output = self._stream.readUntil('currently active source',90)
         devices = []
         if len(output) > 0:
@@ -97,6 +129,8 @@ class RemoteCECClient(CECInterface):
                 device['active source'] = True
             else:
                 device['active source'] = False
+        if len(devices) > 0:
+            self._topology.updateFromScan(devices)
         return devices
 
     def _splitDeviceSectionsToDicts(self,command_output:str) -> list:
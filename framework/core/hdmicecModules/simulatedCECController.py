@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : simulated CEC controller. Runs an in-process CEC bus with
+#*   **          simulated devices, so CEC tests can run without hardware.
+#*   **          Traffic is written in the cec-client TRAFFIC format so it
+#*   **          goes through the same parsing as a real adaptor.
+#*   **
+#* ******************************************************************************
+
+import heapq
+import itertools
+import os
+import threading
+import time
+
+import yaml
+
+from framework.core.logModule import logModule
+from framework.core.streamToFile import StreamToFile
+from .abstractCECController import CECInterface, sleepUntil
+
+BROADCAST = 0xF
+
+# CEC bit timings in milliseconds, used when bus timing is enabled.
+START_BIT_MS = 4.5
+BYTE_MS = 24.0              # 8 data bits, EOM and ACK at 2.4ms each
+SIGNAL_FREE_TIME_MS = 7.2   # 3 bit periods before the next frame can start
+
+DEVICE_TYPES = {'tv': 0x00,
+                'recorder': 0x01,
+                'tuner': 0x03,
+                'playback': 0x04,
+                'audio': 0x05,
+                'audio system': 0x05,
+                'audiosystem': 0x05,
+                'switch': 0x06,
+                'processor': 0x07}
+
+# Logical addresses available to each device type, in allocation order
+LOGICAL_ADDRESSES = {0x00: [0x0],
+                     0x01: [0x1, 0x2, 0x9],
+                     0x03: [0x3, 0x6, 0x7, 0xA],
+                     0x04: [0x4, 0x8, 0xB],
+                     0x05: [0x5]}
+FREE_USE_ADDRESSES = [0xE, 0xC, 0xD]
+
+POWER_STATUS_STRINGS = {0x00: 'on', 0x01: 'standby'}
+CEC_VERSIONS = {'1.3a': 0x04, '1.4': 0x05, '2.0': 0x06}
+
+
+class simulatedCECFrame():
+    """
+    A single frame queued for transmission on the simulated bus.
+    """
+
+    def __init__(self, source: int, dest: int, data: list, planned: float):
+        """
+        Args:
+            source (int): Logical address of the sender.
+            dest (int): Logical address of the receiver. 0xF for broadcast.
+            data (list): List of integers for the opCode and payload. Empty for a poll.
+            planned (float): time.monotonic() value the frame is due to be sent at.
+        """
+        self.source = source
+        self.dest = dest
+        self.data = data
+        self.planned = planned
+        self.sent = None
+        self.done = threading.Event()
+
+    def toString(self) -> str:
+        """
+        Returns:
+            str: The frame in cec-client format, e.g. '40:90:00'.
+        """
+        return ':'.join('%02x' % byte for byte in [(self.source << 4) | self.dest] + self.data)
+
+
+class simulatedCECDevice():
+    """
+    A simulated device on the CEC bus.
+    """
+
+    def __init__(self, name: str, deviceType: int, logicalAddress: int, physicalAddress: str,
+                 powerStatus: int = 0x00, activeSource: bool = False, vendorId: int = 0x000000,
+                 cecVersion: int = 0x05, language: str = 'eng', latency: float = None):
+        self.name = name
+        self.deviceType = deviceType
+        self.logicalAddress = logicalAddress
+        self.physicalAddress = physicalAddress
+        self.powerStatus = powerStatus
+        self.activeSource = activeSource
+        self.vendorId = vendorId
+        self.cecVersion = cecVersion
+        self.language = language
+        self.latency = latency
+
+    @property
+    def physicalAddressBytes(self) -> list:
+        """
+        Returns:
+            list: The physical address as two integers, e.g. [0x10, 0x00] for 1.0.0.0.
+        """
+        nibbles = [int(x, 16) for x in self.physicalAddress.split('.')]
+        return [(nibbles[0] << 4) | nibbles[1], (nibbles[2] << 4) | nibbles[3]]
+
+    def toDict(self) -> dict:
+        """
+        Returns:
+            dict: The device in the format returned by listDevices.
+        """
+        version = {v: k for k, v in CEC_VERSIONS.items()}.get(self.cecVersion, 'unknown')
+        return {'logical address': '%X' % self.logicalAddress,
+                'physical address': self.physicalAddress,
+                'name': self.name,
+                'osd string': self.name,
+                'vendor': '%06X' % self.vendorId,
+                'CEC version': version,
+                'power status': POWER_STATUS_STRINGS.get(self.powerStatus, 'unknown'),
+                'language': self.language,
+                'active source': self.activeSource}
+
+
+class CECBusSimulator():
+    """
+    In-process simulated CEC bus.
+
+    Frames are scheduled on the monotonic clock and sent by a single bus thread,
+    which writes each one to the output stream in cec-client TRAFFIC format and
+    passes it to the simulated devices. Devices answer standard opCodes after
+    their configured latency. When bus timing is enabled frames take as long as
+    they would on a real CEC bus, otherwise the bus runs as fast as it can.
+    """
+
+    def __init__(self, output, latency: float = 0, busTiming: bool = False):
+        """
+        Args:
+            output (IOBase): Writable text stream for the cec-client format traffic.
+            latency (float, optional): Default device response latency in seconds. Defaults to 0.
+            busTiming (bool, optional): Simulate real CEC frame timings. Defaults to False.
+        """
+        self.devices = {}
+        self.latency = latency
+        self.busTiming = busTiming
+        self._output = output
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._busFreeAt = 0
+        self._startTime = time.monotonic()
+        self._running = False
+        self._thread = None
+
+    def addDevice(self, device: simulatedCECDevice) -> None:
+        """
+        Adds a device to the bus.
+
+        Args:
+            device (simulatedCECDevice): The device to add.
+        """
+        self.devices[device.logicalAddress] = device
+
+    def start(self) -> None:
+        """Start the bus thread.
+        """
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the bus thread. Frames still queued are discarded.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+
+    def transmit(self, source: int, dest: int, data: list, due: float = None) -> simulatedCECFrame:
+        """
+        Queue a frame for transmission.
+
+        Args:
+            source (int): Logical address of the sender.
+            dest (int): Logical address of the receiver. 0xF for broadcast.
+            data (list): List of integers for the opCode and payload. Empty for a poll.
+            due (float, optional): time.monotonic() value to send the frame at. Defaults to now.
+
+        Returns:
+            simulatedCECFrame: The queued frame. Its done event is set once it has been sent.
+        """
+        if due is None:
+            due = time.monotonic()
+        frame = simulatedCECFrame(source, dest, list(data), due)
+        with self._condition:
+            heapq.heappush(self._queue, (due, next(self._sequence), frame))
+            self._condition.notify()
+        return frame
+
+    def _run(self) -> None:
+        """
+        Bus thread. Sends frames in due order, honouring the bus timing if enabled.
+        """
+        while True:
+            with self._condition:
+                while self._running:
+                    if self._queue:
+                        wait = self._queue[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if not self._running:
+                    return
+                _, _, frame = heapq.heappop(self._queue)
+            self._send(frame)
+
+    def _send(self, frame: simulatedCECFrame) -> None:
+        """
+        Put a frame on the bus and let the devices react to it.
+
+        Args:
+            frame (simulatedCECFrame): The frame to send.
+        """
+        if self.busTiming:
+            start = max(time.monotonic(), self._busFreeAt)
+            end = start + (START_BIT_MS + BYTE_MS * (1 + len(frame.data))) / 1000
+            sleepUntil(end)
+            self._busFreeAt = end + SIGNAL_FREE_TIME_MS / 1000
+        frame.sent = time.monotonic()
+        direction = '>>' if frame.source in self.devices else '<<'
+        timestamp = int((frame.sent - self._startTime) * 1000)
+        self._output.write('TRAFFIC: [%14d]\t%s %s\n' % (timestamp, direction, frame.toString()))
+        self._output.flush()
+        frame.done.set()
+        if frame.dest == BROADCAST:
+            receivers = [device for device in self.devices.values() if device.logicalAddress != frame.source]
+        else:
+            receivers = [self.devices[frame.dest]] if frame.dest in self.devices else []
+        for device in receivers:
+            for dest, data in self._respond(device, frame):
+                latency = self.latency if device.latency is None else device.latency
+                self.transmit(device.logicalAddress, dest, data, due=frame.sent + latency)
+
+    def _respond(self, device: simulatedCECDevice, frame: simulatedCECFrame) -> list:
+        """
+        Work out how a device reacts to a frame it has received.
+
+        Args:
+            device (simulatedCECDevice): The receiving device.
+            frame (simulatedCECFrame): The received frame.
+
+        Returns:
+            list: List of (dest, data) tuples for the frames the device sends in response.
+        """
+        if not frame.data:
+            # Polling message, acknowledged by the hardware
+            return []
+        opCode = frame.data[0]
+        payload = frame.data[1:]
+        directed = frame.dest != BROADCAST
+        if opCode == 0x83:
+            # Give Physical Address
+            return [(BROADCAST, [0x84] + device.physicalAddressBytes + [device.deviceType])]
+        if opCode == 0x46 and directed:
+            # Give OSD Name
+            return [(frame.source, [0x47] + list(device.name.encode('ascii', errors='replace')[:14]))]
+        if opCode == 0x8F and directed:
+            # Give Device Power Status
+            return [(frame.source, [0x90, device.powerStatus])]
+        if opCode == 0x9F and directed:
+            # Get CEC Version
+            return [(frame.source, [0x9E, device.cecVersion])]
+        if opCode == 0x8C and directed:
+            # Give Device Vendor ID
+            vendor = device.vendorId
+            return [(BROADCAST, [0x87, (vendor >> 16) & 0xFF, (vendor >> 8) & 0xFF, vendor & 0xFF])]
+        if opCode == 0x91 and directed:
+            # Get Menu Language
+            return [(BROADCAST, [0x32] + list(device.language.encode('ascii')[:3]))]
+        if opCode == 0x85:
+            # Request Active Source
+            if device.activeSource:
+                return [(BROADCAST, [0x82] + device.physicalAddressBytes)]
+            return []
+        if opCode == 0x82:
+            # Active Source, another device has taken over
+            device.activeSource = False
+            return []
+        if opCode == 0x86 and len(payload) >= 2:
+            # Set Stream Path
+            if payload[:2] == device.physicalAddressBytes:
+                device.powerStatus = 0x00
+                device.activeSource = True
+                return [(BROADCAST, [0x82] + device.physicalAddressBytes)]
+            return []
+        if opCode in (0x04, 0x0D):
+            # Image View On/Text View On
+            device.powerStatus = 0x00
+            return []
+        if opCode == 0x36:
+            # Standby
+            device.powerStatus = 0x01
+            device.activeSource = False
+            return []
+        if opCode == 0x44 and payload:
+            # User Control Pressed, only the power keys change the device state
+            if payload[0] == 0x6D or (payload[0] == 0x40 and device.powerStatus != 0x00):
+                device.powerStatus = 0x00
+            elif payload[0] == 0x6C or payload[0] == 0x40:
+                device.powerStatus = 0x01
+            return []
+        if opCode in (0x45, 0x00, 0x84, 0x87, 0x47, 0x90, 0x9E, 0x32, 0x9D):
+            # Messages that don't need a response
+            return []
+        if directed:
+            # Feature Abort: abort reason 0 is "Unrecognized opcode", 4 is "Refused"
+            reason = 0x04 if opCode == 0xFF else 0x00
+            return [(frame.source, [0x00, opCode, reason])]
+        return []
+
+
+class simulatedCECController(CECInterface):
+    """
+    CEC controller backed by an in-process simulated CEC bus.
+
+    Devices are configured from a device network configuration YAML file, in the
+    same format as used for the virtual-cec-client.
+    """
+
+    def __init__(self, adaptor: str, logger: logModule, streamLogger: StreamToFile,
+                 device_configuration: str = '', latency_ms: float = 0, bus_timing: bool = False,
+                 topology_ttl: float = 300):
+        """
+        Initializes the simulatedCECController class.
+
+        Args:
+            adaptor (str): The adaptor file path for the parent class. Not used.
+            logger (logModule): Logger module instance for logging operations.
+            streamLogger (StreamToFile): Stream logger the simulated traffic is written to.
+            device_configuration (str, optional): Path to the HDMI CEC device network configuration YAML file.
+            latency_ms (float, optional): Default device response latency in milliseconds. Defaults to 0.
+            bus_timing (bool, optional): Simulate real CEC frame timings. Defaults to False.
+            topology_ttl (float, optional): Passed to the parent class. Defaults to 300.
+
+        Raises:
+            FileNotFoundError: If the device configuration file doesn't exist.
+            ValueError: If no devices are found in the device configuration.
+        """
+        super().__init__(adaptor, logger, streamLogger, topology_ttl=topology_ttl)
+        self._latency = latency_ms / 1000
+        self._busTiming = bus_timing
+        try:
+            with open(device_configuration, 'r') as f:
+                self._deviceConfig = yaml.safe_load(f)
+        except FileNotFoundError:
+            self._log.critical('Device config file not found')
+            raise
+        self.bus = None
+        self.start()
+
+    def start(self):
+        readFd, writeFd = os.pipe()
+        self._reader = os.fdopen(readFd, 'r', encoding='utf-8')
+        self._writer = os.fdopen(writeFd, 'w', encoding='utf-8')
+        self.bus = CECBusSimulator(self._writer, latency=self._latency, busTiming=self._busTiming)
+        for device in self._loadDevices(self._deviceConfig):
+            self._log.debug('Simulating CEC device [%s] at logical address [%X]' % (device.name, device.logicalAddress))
+            self.bus.addDevice(device)
+        self._stream.writeStreamToFile(self._reader)
+        self.bus.start()
+
+    def stop(self):
+        if getattr(self, 'bus', None) is None:
+            return
+        self.bus.stop()
+        self.bus = None
+        self._writer.close()
+        self._stream.stopStreamedLog()
+        self._reader.close()
+
+    def sendMessage(self, sourceAddress: str, destAddress: str, opCode: str, payload: list = None) -> None:
+        data = [int(opCode, 16)]
+        if payload:
+            data.extend(int(x, 16) for x in payload)
+        self.bus.transmit(int(sourceAddress, 16), int(destAddress, 16), data)
+
+    def sendSequence(self, sequence: list) -> list:
+        """
+        Sends a sequence of messages. The whole sequence is queued on the bus up front,
+        so the frames go out as fast as the bus allows with only the requested gaps.
+
+        Args:
+            sequence (list): List of (sourceAddress, destAddress, opCode, payload, delayMs) tuples.
+                             payload may be None.
+
+        Returns:
+            list: A dictionary per message with the keys: sourceAddress, destAddress, opCode,
+                  payload, planned and sent. planned and sent are in milliseconds from the
+                  start of the sequence. sent is None if the frame wasn't sent.
+        """
+        start = time.monotonic()
+        plannedMs = 0
+        frames = []
+        for sourceAddress, destAddress, opCode, payload, delayMs in sequence:
+            plannedMs += delayMs
+            data = [int(opCode, 16)] + [int(x, 16) for x in payload or []]
+            frame = self.bus.transmit(int(sourceAddress, 16), int(destAddress, 16), data, due=start + plannedMs / 1000)
+            frames.append(((sourceAddress, destAddress, opCode, payload, plannedMs), frame))
+        # Allow for every frame being held up for the longest frame time
+        timeout = (plannedMs + len(frames) * (START_BIT_MS + BYTE_MS * 16 + SIGNAL_FREE_TIME_MS)) / 1000 + 1
+        results = []
+        for (sourceAddress, destAddress, opCode, payload, plannedMs), frame in frames:
+            frame.done.wait(max(0, start + timeout - time.monotonic()))
+            results.append({'sourceAddress': sourceAddress,
+                            'destAddress': destAddress,
+                            'opCode': opCode,
+                            'payload': payload,
+                            'planned': plannedMs,
+                            'sent': None if frame.sent is None else (frame.sent - start) * 1000})
+        return results
+
+    def listDevices(self, refresh: bool = False) -> list:
+        """
+        Lists the simulated devices on the CEC bus. The simulation is always up
+        to date, so refresh has no effect.
+
+        Args:
+            refresh (bool): Accepted for interface compatibility. Defaults to False.
+
+        Returns:
+            list: A list of dictionaries representing the simulated devices.
+        """
+        addresses = sorted(self.bus.devices)
+        return [self.bus.devices[address].toDict() for address in addresses]
+
+    def formatMessage(self, sourceAddress: str, destAddress: str, opCode:str, payload: list = None) -> str:
+        message_string = f'{sourceAddress}{destAddress}:{opCode[2:]}'
+        if payload:
+            payload_string = ':'.join(map(lambda x: x[2:], payload))
+            message_string += ':' + payload_string
+        return message_string.lower()
+
+    def _loadDevices(self, config) -> list:
+        """
+        Creates the simulated devices from a device network configuration.
+
+        Devices are read from the first list of device entries found in the configuration,
+        including any nested 'children'. Each entry supports the keys: name, type,
+        logical_address, physical_address (or pa), active_source, power_status, vendor_id,
+        version, language and response_delay_ms. Logical addresses are allocated from
+        the device type when not given.
+
+        Args:
+            config (dict|list): The loaded device network configuration.
+
+        Returns:
+            list: List of simulatedCECDevice.
+
+        Raises:
+            ValueError: If no devices are found in the configuration.
+        """
+        entries = []
+        self._flattenDevices(self._findDeviceList(config), entries)
+        if not entries:
+            raise ValueError('No devices found in CEC device network configuration')
+        devices = []
+        used = set()
+        for index, entry in enumerate(entries):
+            entry = {str(k).lower().replace(' ', '_').replace('-', '_'): v for k, v in entry.items()}
+            deviceType = DEVICE_TYPES.get(str(entry.get('type', 'playback')).lower(), 0x04)
+            logicalAddress = entry.get('logical_address')
+            if logicalAddress is None:
+                candidates = LOGICAL_ADDRESSES.get(deviceType, []) + FREE_USE_ADDRESSES
+                logicalAddress = next((x for x in candidates if x not in used), None)
+                if logicalAddress is None:
+                    raise ValueError('No free logical address for CEC device [%s]' % entry.get('name'))
+            elif isinstance(logicalAddress, str):
+                logicalAddress = int(logicalAddress, 16)
+            used.add(logicalAddress)
+            vendorId = entry.get('vendor_id', 0)
+            if isinstance(vendorId, str):
+                vendorId = int(vendorId, 16)
+            powerStatus = entry.get('power_status', 'on')
+            if isinstance(powerStatus, str):
+                powerStatus = 0x00 if powerStatus.lower() == 'on' else 0x01
+            version = entry.get('version', '1.4')
+            if not isinstance(version, int):
+                version = CEC_VERSIONS.get(str(version), 0x05)
+            latency = entry.get('response_delay_ms')
+            devices.append(simulatedCECDevice(name=str(entry.get('name', 'Device%d' % index)),
+                                              deviceType=deviceType,
+                                              logicalAddress=logicalAddress,
+                                              physicalAddress=str(entry.get('physical_address', entry.get('pa', '%d.0.0.0' % index))),
+                                              powerStatus=int(powerStatus),
+                                              activeSource=bool(entry.get('active_source', False)),
+                                              vendorId=vendorId,
+                                              cecVersion=version,
+                                              language=str(entry.get('language', 'eng')),
+                                              latency=None if latency is None else latency / 1000))
+        return devices
+
+    def _findDeviceList(self, config) -> list:
+        """
+        Finds the first list of device entries in a configuration.
+
+        Args:
+            config (dict|list): Configuration to search.
+
+        Returns:
+            list: The device entries. Empty if none are found.
+        """
+        if isinstance(config, list):
+            if config and all(isinstance(x, dict) and ('name' in x or 'type' in x) for x in config):
+                return config
+            items = config
+        elif isinstance(config, dict):
+            items = config.values()
+        else:
+            return []
+        for item in items:
+            found = self._findDeviceList(item)
+            if found:
+                return found
+        return []
+
+    def _flattenDevices(self, entries: list, result: list) -> None:
+        """
+        Flattens device entries and their nested children into a single list.
+
+        Args:
+            entries (list): Device entries.
+            result (list): List the flattened entries are appended to.
+        """
+        for entry in entries:
+            result.append({k: v for k, v in entry.items() if k != 'children'})
+            children = entry.get('children')
+            if isinstance(children, list):
+                self._flattenDevices(children, result)
+
+    def __del__(self):
+        """
+        Destructor for the class, ensures the bus is stopped.
+        """
+        self.stop()
@@ -47,7 +47,7 @@ class virtualCECController(CECInterface):
     """
     def __init__(self, adaptor: str, logger: logModule, streamLogger: StreamToFile,
                 address: str, username: str = '', password: str = '', port: int = 22, prompt = '~#',
-                device_configuration:str = '', control_port:int = 8080):
+                device_configuration:str = '', control_port:int = 8080, control_transport:str = 'shell'):
         """
         Initializes the virtualCECController class for HDMI CEC device communication.
 
@@ -62,6 +62,9 @@ class virtualCECController(CECInterface):
             prompt (str, optional): Command prompt string for the SSH session. Defaults to '~#'.
             device_configuration (str, optional): Path to the HDMI CEC device network configuration YAML file. Defaults to ''.
             control_port (int, optional): Port number for ut-controller communication. Defaults to 8080.
+            control_transport (str, optional): How messages reach the ut-controller. One of 'shell' (curl typed
+                                               into the SSH shell), 'tunnel' (HTTP through an SSH port-forward) or
+                                               'http' (HTTP direct to the device address). Defaults to 'shell'.
 
         """
         super().__init__(adaptor, logger, streamLogger)
@@ -84,7 +87,11 @@ class virtualCECController(CECInterface):
 
             self.session = sshConsole(self._log, address, username, password, port=port, prompt=prompt)
 
-            self.utPlaneController = utPlaneController(self.session, port=self.control_port)
+            self.utPlaneController = utPlaneController(self.session,
+                                                       port=self.control_port,
+                                                       log=self._log,
+                                                       transport=control_transport,
+                                                       address=address)
         except FileNotFoundError:
             self._log.critical(f"Device config file not found")
             raise
@@ -111,7 +118,18 @@ class virtualCECController(CECInterface):
             list: A list of dictionaries representing discovered devices with details.
         """
         result = self.session.read_until(self.commandPrompt)
+        return self._parseDeviceNetworkList(result)
 
+    def _parseDeviceNetworkList(self, result: str) -> list:
+        """
+        Parses the device network list printed by the vComponent.
+
+        Args:
+            result (str): Output containing the printed device network list.
+
+        Returns:
+            list: A list of dictionaries representing discovered devices with details.
+        """
         result = re.sub(r'\x1b\[[0-9;]*m', '', result)         # remove ANSI color codes
         result = result.replace('\r', '')                      # normalize newlines
         result = re.sub(r'root@[\w\-\:\/# ]+', '', result)     # remove shell prompt lines
@@ -138,9 +156,13 @@ class virtualCECController(CECInterface):
 
         return devices
 
-    def listDevices(self) -> list:
+    def listDevices(self, refresh: bool = False) -> list:
         """
         Lists the devices currently available on the HDMI CEC network.
+        The device map is always printed by the ut-controller, so refresh has no effect.
+
+        Args:
+            refresh (bool): Accepted for interface compatibility. Defaults to False.
 
         Returns:
             list: A list of dictionaries representing discovered devices with details.
@@ -152,9 +174,12 @@ class virtualCECController(CECInterface):
             }
         """
         # send command to CEC network to print device configuration
-        self.utPlaneController.sendMessage(self.printConfigString)
-
-        devices = self.readDeviceNetworkList()
+        if self.utPlaneController.transport == 'shell':
+            self.utPlaneController.sendMessage(self.printConfigString)
+            devices = self.readDeviceNetworkList()
+        else:
+            response = self.utPlaneController.postKVP(self.printConfigString)
+            devices = self._parseDeviceNetworkList(response.get('body', ''))
 
         if devices is None or len(devices) == 0:
             self.session.write("cat " + HDMICEC_DEVICE_LIST_FILE)
@@ -176,12 +201,42 @@ class virtualCECController(CECInterface):
         Returns:
           bool: True if the message was sent successfully, False otherwise.
         """
+        yaml_content = self._messageYaml(sourceAddress, destAddress, opCode, payload)
+
+        try:
+            result = self.utPlaneController.sendMessage(yaml_content)
+            return bool(result)
+        except Exception as e:
+            self._log.critical(f"Failed to send CEC message: {e}")
+            return False
+
+    def _sendBatch(self, messages: list) -> list:
+        yamlInputs = [self._messageYaml(*message) for message in messages]
+        try:
+            return [bool(result) for result in self.utPlaneController.sendMessages(yamlInputs)]
+        except Exception as e:
+            self._log.critical(f"Failed to send CEC messages: {e}")
+            return [False] * len(messages)
+
+    def _messageYaml(self, sourceAddress: str, destAddress: str, opCode: str, payload: list = None) -> str:
+        """
+        Creates the ut-controller YAML command to send a CEC message.
+
+        Args:
+          sourceAddress (str): The logical address of the source device ('0'-'F').
+          destAddress (str): The logical address of the destination device ('0'-'F').
+          opCode (str): Operation code to send as a hexadecimal string e.g 0x81.
+          payload (list): List of hexadecimal strings to be sent with the opCode. Optional.
+
+        Returns:
+          str: The YAML command.
+        """
         # Format the payload: source, destination, opCode, and payload
         msg_payload = [f"0x{sourceAddress}{destAddress}", opCode]
         if payload:
             msg_payload.extend(payload)
 
-        yaml_content = (
+        return (
             "HdmiCec:\n"
             "  command: cec_message\n"
             "  description: Send a CEC message\n"
@@ -190,18 +245,11 @@ class virtualCECController(CECInterface):
             f"    payload: {msg_payload}\n"
         )
 
-        try:
-            result = self.utPlaneController.sendMessage(yaml_content)
-            return bool(result)
-        except Exception as e:
-            self._log.critical(f"Failed to send CEC message: {e}")
-            return False
-
     def start(self):
         self.loadCecDeviceNetworkConfiguration(self.cecDeviceNetworkConfigString)
 
     def stop(self):
-        pass
+        self.utPlaneController.close()
 
     def receiveMessage(self,sourceAddress: str, destAddress: str, opCode: str, timeout: int = 10, payload: list = None) -> bool:
         """
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Key to screen latency benchmark. Times how long the DUT takes
+#*   **          to change a screen region after a remote key is sent, by
+#*   **          differencing frames grabbed in the background.
+#*   **
+#* ******************************************************************************
+
+import collections
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from framework.core.logModule import logModule
+
+class keyLatencyBenchmark():
+    """
+    Measures the time from sending a remote key to the screen responding.
+
+    Frames are read from the video source on a background thread and stamped
+    with time.monotonic() as they arrive. For each press the benchmark waits
+    for the region to settle, keeps the last frame as the reference, sends the
+    key, and finds the first later frame in which more than `changeThreshold`
+    of the region's pixels differ from the reference by more than
+    `pixelThreshold` grey levels. The latency is from the start of the send to
+    that frame, so it includes the capture card's own delay.
+
+    While the benchmark is started it is the only reader of the video source,
+    so capture OCR checks shouldn't run at the same time.
+    """
+
+    def __init__(self, remote, videoSource, region=None, log:logModule=None, pixelThreshold:int=25,
+                 changeThreshold:float=0.01, timeout:float=5, settleTime:float=0.5, outputPath:str=None):
+        """Initialise the benchmark.
+
+        Args:
+            remote (commonRemoteClass): Remote sending the keys, with sendKey(keycode, delay).
+            videoSource (capture): The capture module, after start(), or a video source with read(), e.g. cv2.VideoCapture.
+            region (tuple|str, optional): (left, top, right, bottom) pixels of the region watched, or a capture
+                                          region name. Defaults to None, the whole frame.
+            log (logModule, optional): Log module. Defaults to None.
+            pixelThreshold (int, optional): Grey levels a pixel must change by to count as changed. Defaults to 25.
+            changeThreshold (float, optional): Fraction of the region's pixels that must change. Defaults to 0.01.
+            timeout (float, optional): Seconds to wait for the screen to respond to a press. Defaults to 5.
+            settleTime (float, optional): Seconds the region must be still before each press. Defaults to 0.5.
+            outputPath (str, optional): Directory for the CSV reports. Defaults to the log directory.
+        """
+        if log == None:
+            log = logModule("keyLatencyBenchmark")
+        self.log = log
+        self.remote = remote
+        if isinstance(region, str):
+            region = videoSource.getRegionCoords(region)["co_ords"]
+        self.region = region
+        # The capture module keeps its cv2.VideoCapture in videoApi
+        self.videoSource = getattr(videoSource, "videoApi", None) or videoSource
+        self.pixelThreshold = pixelThreshold
+        self.changeThreshold = changeThreshold
+        self.timeout = timeout
+        self.settleTime = settleTime
+        self.outputPath = outputPath
+        self.results = []
+        self._frames = collections.deque(maxlen=1000)
+        self._frameCount = 0
+        self._frameCondition = threading.Condition()
+        self._stopEvent = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start reading frames in the background.
+        """
+        if self._thread != None:
+            return
+        self._stopEvent.clear()
+        self._thread = threading.Thread(target=self._grabLoop, name="keyLatencyBenchmark", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop reading frames.
+        """
+        if self._thread == None:
+            return
+        self._stopEvent.set()
+        self._thread.join()
+        self._thread = None
+
+    def run(self, keycode, presses:int=10, resetKey=None) -> list:
+        """Measure the latency of repeated presses of a key, then log the summary and write the reports.
+
+        Args:
+            keycode (rcCode): Key to measure.
+            presses (int, optional): Number of presses. Defaults to 10.
+            resetKey (rcCode, optional): Key sent after each press to return to the starting screen,
+                                         e.g. BACK after opening a menu. Defaults to None.
+
+        Returns:
+            list: Latency in seconds per press, None where the screen didn't respond.
+        """
+        self.start()
+        try:
+            latencies = self.measure(keycode, presses, resetKey)
+        finally:
+            self.stop()
+        self.logSummary()
+        self.save()
+        return latencies
+
+    def measure(self, keycode, presses:int=1, resetKey=None) -> list:
+        """Measure the latency of repeated presses of a key. The benchmark must be started.
+
+        Args:
+            keycode (rcCode): Key to measure.
+            presses (int, optional): Number of presses. Defaults to 1.
+            resetKey (rcCode, optional): Key sent after each press to return to the starting screen. Defaults to None.
+
+        Returns:
+            list: Latency in seconds per press, None where the screen didn't respond.
+        """
+        if self._thread == None:
+            raise RuntimeError("keyLatencyBenchmark not started")
+        latencies = []
+        for press in range(presses):
+            result = self.measurePress(keycode)
+            self.results.append(result)
+            latencies.append(result["latency"])
+            if result["latency"] == None:
+                self.log.warn("keyLatencyBenchmark: [{}] press [{}] no screen change in [{}]s".format(keycode.name, press + 1, self.timeout))
+            else:
+                self.log.info("keyLatencyBenchmark: [{}] press [{}] latency [{:.3f}]s".format(keycode.name, press + 1, result["latency"]))
+            if resetKey != None:
+                self.remote.sendKey(resetKey, delay=0)
+        return latencies
+
+    def measurePress(self, keycode) -> dict:
+        """Press a key once and time the screen's response.
+
+        Returns:
+            dict: "key", "latency", the seconds from the send to the first changed frame or None,
+                  "send", the seconds the send took, and "settled", False if the region was
+                  still changing when the key was sent.
+        """
+        settled, reference, lastFrame = self._waitForSettle()
+        start = time.monotonic()
+        self.remote.sendKey(keycode, delay=0)
+        send = time.monotonic() - start
+        latency = None
+        deadline = start + self.timeout
+        while latency == None:
+            frames, lastFrame = self._nextFrames(lastFrame, deadline)
+            if not frames:
+                break
+            for timestamp, frame in frames:
+                if timestamp >= start and self._changed(reference, frame):
+                    latency = timestamp - start
+                    break
+        return {"key": keycode.name, "latency": latency, "send": send, "settled": settled}
+
+    def getReport(self) -> dict:
+        """Get the latency distribution of each key over the presses measured.
+
+        Returns:
+            dict: Per key, the number of presses ("presses"), of presses the screen responded
+                  to ("detected"), and the min, mean, median, p90, p99 and max seconds.
+        """
+        report = dict()
+        for key in dict.fromkeys(result["key"] for result in self.results):
+            results = [result for result in self.results if result["key"] == key]
+            values = np.array([result["latency"] for result in results if result["latency"] != None], dtype=np.float64)
+            stats = {"presses": len(results), "detected": len(values)}
+            for name, function in (("min", np.min), ("mean", np.mean), ("median", np.median),
+                                   ("p90", lambda data: np.percentile(data, 90)),
+                                   ("p99", lambda data: np.percentile(data, 99)), ("max", np.max)):
+                stats[name] = float(function(values)) if len(values) else None
+            report[key] = stats
+        return report
+
+    def logSummary(self):
+        """Write the per key latency summary to the test log.
+        """
+        self.log.step("Key to screen latency, [{}] presses".format(len(self.results)))
+        for key, stats in self.getReport().items():
+            if stats["detected"] == 0:
+                self.log.step("{:<12} no screen change detected".format(key))
+                continue
+            self.log.step("{:<12} detected {}/{}  min {:.3f}s  median {:.3f}s  p90 {:.3f}s  max {:.3f}s".format(
+                key, stats["detected"], stats["presses"], stats["min"], stats["median"], stats["p90"], stats["max"]))
+
+    def save(self, path:str=None) -> list:
+        """Write the latency per press and the summary as CSV files.
+
+        Args:
+            path (str, optional): Directory to write to. Defaults to outputPath, or the log directory.
+
+        Returns:
+            list: Paths of key_latency_benchmark.csv and key_latency_summary.csv.
+        """
+        if path == None:
+            path = self.outputPath or getattr(self.log, "logPath", None) or "."
+        os.makedirs(path, exist_ok=True)
+        pressesPath = os.path.join(path, "key_latency_benchmark.csv")
+        with open(pressesPath, "w") as csvFile:
+            csvFile.write("press,key,latency,send,settled\n")
+            for press, result in enumerate(self.results, 1):
+                latency = "" if result["latency"] == None else "{:.4f}".format(result["latency"])
+                csvFile.write("{},{},{},{:.4f},{}\n".format(press, result["key"], latency, result["send"], result["settled"]))
+        summaryPath = os.path.join(path, "key_latency_summary.csv")
+        columns = ["presses", "detected", "min", "mean", "median", "p90", "p99", "max"]
+        with open(summaryPath, "w") as csvFile:
+            csvFile.write(",".join(["key"] + columns) + "\n")
+            for key, stats in self.getReport().items():
+                fields = [key] + ["" if stats[column] == None else "{:.4f}".format(stats[column]) if isinstance(stats[column], float)
+                                  else str(stats[column]) for column in columns]
+                csvFile.write(",".join(fields) + "\n")
+        return [pressesPath, summaryPath]
+
+    def _grabLoop(self):
+        """Read frames until stopped, keeping the watched region of each in grey.
+        """
+        while not self._stopEvent.is_set():
+            ok, frame = self.videoSource.read()
+            timestamp = time.monotonic()
+            if not ok or frame is None:
+                self._stopEvent.wait(0.01)
+                continue
+            if self.region != None:
+                left, top, right, bottom = self.region
+                frame = frame[top:bottom, left:right]
+            if frame.ndim == 3:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            with self._frameCondition:
+                self._frameCount += 1
+                self._frames.append((self._frameCount, timestamp, frame))
+                self._frameCondition.notify_all()
+
+    def _nextFrames(self, after:int, deadline:float):
+        """Wait for frames newer than frame number `after`.
+
+        Returns:
+            tuple: The new (timestamp, frame) pairs, empty if none arrived by the deadline,
+                   and the number of the last one.
+        """
+        with self._frameCondition:
+            while self._frameCount <= after:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return [], after
+                self._frameCondition.wait(remaining)
+            frames = [(timestamp, frame) for number, timestamp, frame in self._frames if number > after]
+            return frames, self._frameCount
+
+    def _waitForSettle(self):
+        """Wait until the region stops changing, for up to the timeout.
+
+        Returns:
+            tuple: True if it settled, the last frame, and its number.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        frames, lastFrame = self._nextFrames(max(0, self._frameCount - 1), deadline)
+        if not frames:
+            raise RuntimeError("keyLatencyBenchmark: no frames from the video source")
+        reference = frames[-1][1]
+        stillSince = time.monotonic()
+        while time.monotonic() - stillSince < self.settleTime:
+            frames, lastFrame = self._nextFrames(lastFrame, deadline)
+            if not frames:
+                return False, reference, lastFrame
+            for timestamp, frame in frames:
+                if self._changed(reference, frame):
+                    stillSince = timestamp
+                reference = frame
+        return True, reference, lastFrame
+
+    def _changed(self, reference, frame) -> bool:
+        changed = np.count_nonzero(cv2.absdiff(reference, frame) > self.pixelThreshold)
+        return changed > self.changeThreshold * frame.size
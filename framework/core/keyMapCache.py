@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Compiles remote key maps into flat rcCode to wire code tables,
+#*   **          and caches the compiled maps on disk.
+#*   **
+#* ******************************************************************************
+
+import hashlib
+import json
+import os
+import tempfile
+
+import yaml
+
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+
+# Bump when the compiled form changes, so older cache files are ignored
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "raft", "keymaps")
+
+def compileKeyMaps(maps, log:logModule=None) -> list:
+    """Compile key maps, as read from the remoteMaps section of a key map file.
+
+    Each compiled map keeps its name, prefix and codes, and adds "wireCodes",
+    the final code sent for each rcCode name with the prefix already applied.
+    Codes that aren't rcCode names, or have no value, are left out of
+    wireCodes with a warning. Maps without a name are dropped.
+
+    Args:
+        maps (dict|list): Key maps, by entry name or as a list. Maps already compiled are kept as they are.
+        log (logModule, optional): Log module. Defaults to None.
+
+    Returns:
+        list: The compiled maps.
+    """
+    if log == None:
+        log = logModule("keyMapCache")
+    if maps == None:
+        return []
+    if isinstance(maps, dict):
+        maps = list(maps.values())
+    compiled = []
+    for index, keyMap in enumerate(maps):
+        if "wireCodes" in keyMap:
+            compiled.append(keyMap)
+            continue
+        name = keyMap.get("name")
+        if name == None:
+            log.error("Key map [{}] has no name, skipped".format(index))
+            continue
+        codes = keyMap.get("codes") or {}
+        prefix = keyMap.get("prefix")
+        invalid = [key for key in codes if key not in rc.__members__]
+        if invalid:
+            log.warn("Key map [{}] codes aren't rcCodes, ignored: {}".format(name, invalid))
+        empty = [key for key, value in codes.items() if value == None]
+        if empty:
+            log.warn("Key map [{}] codes have no value, ignored: {}".format(name, empty))
+        wireCodes = dict()
+        for key, value in codes.items():
+            if key in rc.__members__ and value != None:
+                wireCodes[key] = prefix + str(value) if prefix else value
+        compiled.append({**keyMap, "wireCodes": wireCodes})
+    return compiled
+
+def loadKeyMaps(configFile:str, cacheDir:str=DEFAULT_CACHE_DIR, log:logModule=None) -> list:
+    """Load the compiled key maps of a key map file.
+
+    The compiled maps are cached in `cacheDir`, keyed by a hash of the file
+    contents and the rcCode names, so a file is only parsed again when it, or
+    the rcCodes it is validated against, changes. The cache files are JSON, so
+    reading one never runs code, whoever wrote it.
+
+    Args:
+        configFile (str): Key map file, with a remoteMaps section.
+        cacheDir (str, optional): Directory of the cache files. Defaults to ~/.cache/raft/keymaps.
+                                  None disables the cache.
+        log (logModule, optional): Log module. Defaults to None.
+
+    Returns:
+        list: The compiled maps, see compileKeyMaps.
+    """
+    if log == None:
+        log = logModule("keyMapCache")
+    with open(configFile, "rb") as inputFile:
+        content = inputFile.read()
+    cachePath = None
+    if cacheDir:
+        digest = hashlib.sha256(content)
+        digest.update("{}:{}".format(CACHE_VERSION, ",".join(rc.__members__)).encode())
+        cachePath = os.path.join(cacheDir, digest.hexdigest() + ".json")
+        try:
+            with open(cachePath, "r") as cacheFile:
+                return json.load(cacheFile)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warn("Key map cache [{}] not readable, recompiling: {}".format(cachePath, e))
+    # The C loader, where PyYAML was built with it, parses large maps much faster
+    loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+    config = yaml.load(content, Loader=loader) or {}
+    maps = compileKeyMaps(config.get("remoteMaps", {}), log)
+    if cachePath:
+        tempPath = None
+        try:
+            os.makedirs(cacheDir, exist_ok=True)
+            # Written to a temporary file first, so a concurrent reader never sees part of it
+            fd, tempPath = tempfile.mkstemp(dir=cacheDir, suffix=".tmp")
+            with os.fdopen(fd, "w") as cacheFile:
+                json.dump(maps, cacheFile)
+            os.replace(tempPath, cachePath)
+        except (OSError, TypeError, ValueError) as e:
+            log.warn("Key map cache [{}] not written: {}".format(cachePath, e))
+            if tempPath != None and os.path.exists(tempPath):
+                os.remove(tempPath)
+    return maps
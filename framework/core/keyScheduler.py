@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Key press scheduler. Plans key presses on the monotonic clock
+#*   **          so send latency doesn't make the key timing drift, and records
+#*   **          the planned and actual time of each press.
+#*   **
+#* ******************************************************************************
+
+import copy
+import threading
+import time
+
+from framework.core.logModule import logModule
+
+class keyScheduler():
+    """
+    Sends key presses at planned times.
+
+    Each press is planned from the start of the sequence, not from the end of
+    the previous send, so a slow send delays only the presses it overlaps. A
+    press whose time has passed is sent at once. A held key is auto-repeated
+    every `repeatInterval` seconds while held, as a remote does.
+
+    Every press is recorded in `history`, with the times from time.monotonic().
+    Setting `cancelEvent` stops the sequence being run before its next press.
+    A run that must be cancelled on its own uses a scheduler from withCancelEvent.
+    """
+
+    def __init__(self, log:logModule=None, repeatInterval:float=0.1, historySize:int=1000):
+        """Initialise the scheduler.
+
+        Args:
+            log (logModule, optional): Log module. Defaults to None.
+            repeatInterval (float, optional): Seconds between the auto-repeats of a held key. Defaults to 0.1.
+            historySize (int, optional): Number of presses kept in the history. Defaults to 1000.
+        """
+        if log == None:
+            log = logModule("keyScheduler")
+        self.log = log
+        self.repeatInterval = repeatInterval
+        self.historySize = historySize
+        self.history = []
+        self.cancelEvent = threading.Event()
+        self._lock = threading.Lock()
+
+    def plan(self, codes:list) -> tuple:
+        """Plan the presses of a key sequence.
+
+        Args:
+            codes (list): (code, holdMs, gapMs) per key. A key held for holdMs is pressed, then
+                          auto-repeated until it is released. The next key follows gapMs after release.
+
+        Returns:
+            tuple: The presses, as (code, seconds from the start) tuples, and the seconds until the sequence ends.
+        """
+        presses = []
+        offset = 0.0
+        for code, holdMs, gapMs in codes:
+            hold = holdMs / 1000
+            presses.append((code, offset))
+            if hold > 0 and self.repeatInterval > 0:
+                repeats = int(hold / self.repeatInterval - 1e-9)
+                presses.extend((code, offset + repeat * self.repeatInterval) for repeat in range(1, repeats + 1))
+            offset += hold + gapMs / 1000
+        return presses, offset
+
+    def run(self, codes:list, send) -> bool:
+        """Send a key sequence on schedule.
+
+        Args:
+            codes (list): (code, holdMs, gapMs) per key, see plan.
+            send (callable): Called as send(code) for each press, returning True on success.
+
+        Returns:
+            bool: True if every press was sent, False on the first failure or if cancelled.
+        """
+        presses, duration = self.plan(codes)
+        start = time.monotonic()
+        for code, offset in presses:
+            planned = start + offset
+            wait = planned - time.monotonic()
+            if self.cancelEvent.wait(max(0, wait)):
+                self.log.warn("keyScheduler: cancelled before [{}]".format(code))
+                return False
+            actual = time.monotonic()
+            result = send(code) == True
+            self.record(code, planned, actual, time.monotonic(), result)
+            if not result:
+                self.log.error("keyScheduler: sending [{}] failed".format(code))
+                return False
+        # Wait out the gap after the last key, so back to back sequences keep their spacing
+        wait = start + duration - time.monotonic()
+        if self.cancelEvent.wait(max(0, wait)):
+            return False
+        return True
+
+    def getStats(self) -> dict:
+        """Get the timing accuracy of the recorded presses.
+
+        Returns:
+            dict: presses (int), and the mean and max lateness of a press against its plan,
+                  and the mean and max send time, in milliseconds.
+        """
+        with self._lock:
+            history = list(self.history)
+        if not history:
+            return {"presses": 0, "late_mean_ms": 0.0, "late_max_ms": 0.0, "send_mean_ms": 0.0, "send_max_ms": 0.0}
+        late = [(press["actual"] - press["planned"]) * 1000 for press in history]
+        send = [(press["sent"] - press["actual"]) * 1000 for press in history]
+        return {"presses": len(history),
+                "late_mean_ms": sum(late) / len(late), "late_max_ms": max(late),
+                "send_mean_ms": sum(send) / len(send), "send_max_ms": max(send)}
+
+    def withCancelEvent(self, cancelEvent:threading.Event):
+        """Get a scheduler sharing this one's settings and history, with its own cancel event.
+
+        Args:
+            cancelEvent (threading.Event): Event that cancels the runs of the new scheduler only.
+
+        Returns:
+            keyScheduler: The new scheduler.
+        """
+        scheduler = copy.copy(self)
+        scheduler.cancelEvent = cancelEvent
+        return scheduler
+
+    def clearHistory(self):
+        """Clear the recorded presses.
+        """
+        with self._lock:
+            # Cleared in place, as schedulers from withCancelEvent share the list
+            del self.history[:]
+
+    def record(self, code:str, planned:float, actual:float, sent:float, result:bool):
+        """Record a press in the history. Used by remotes that time presses themselves.
+
+        Args:
+            code (str): The code sent.
+            planned (float): Time the press was planned for.
+            actual (float): Time the press was sent.
+            sent (float): Time sending the press finished.
+            result (bool): True if the press was sent.
+        """
+        with self._lock:
+            self.history.append({"code": code, "planned": planned, "actual": actual, "sent": sent, "result": result})
+            if len(self.history) > self.historySize:
+                del self.history[:len(self.history) - self.historySize]
@@ -45,6 +45,8 @@
 #     7- Cancel
 ###########################################################
 
+import time
+
 from framework.core.powerModules.apcAos import powerApcAos
 from framework.core.powerModules.kasaControl import powerKasa
 from framework.core.powerModules.tapoControl import powerTapo
@@ -74,50 +76,194 @@ class powerControlClass():
         # If variables are not passed in the config they will be defaulted to retryCount: [1], retryDelay: [30]
         self.retryCount = config.get("retryCount", 1)
         self.retryDelay = config.get("retryDelay", 30)
+        # Seconds a known outlet state is trusted before the switch is asked again, 0 disables the cache
+        self.stateCacheTTL = config.get("state_cache_ttl", 0)
         if ( self.name == None ):
             self.name = self.ip
         self.powerOnState = False
+        self._cachedState = None
+        self._cachedStateTime = None
+        # Seconds between keepalives on a persistent telnet session shared by every outlet on the PDU,
+        # 0 opens a new session per command. Used by the apc, apcAos, olimex and SLP types.
+        sessionKeepalive = config.get("session_keepalive", 0)
         type = config.get("type")
+        # Controllers with the same switchKey share a power switch, so can be switched together with powerGroup
+        self.switchKey = (type, self.ip, config.get("port"))
         if type == None:
             self.powerSwitch = powerNone( log )
         elif type == "hs100":
             self.powerSwitch = powerHS100( log, self.ip, config.get("port"))
         elif type == "apc":
-            self.powerSwitch = powerAPC( log, self.ip, config.get("username"), config.get("password"), config.get("outlet"))
+            self.powerSwitch = powerAPC( log, self.ip, config.get("username"), config.get("password"), config.get("outlet"), sessionKeepalive, config.get("port", 23))
         elif type == "apcAos":
-            self.powerSwitch = powerApcAos( log, self.ip, config.get("username"), config.get("password"), config.get("port",23), config.get("outlet"))
+            self.powerSwitch = powerApcAos( log, self.ip, config.get("username"), config.get("password"), config.get("port",23), config.get("outlet"), sessionKeepalive)
         elif type == "olimex":
-            self.powerSwitch = powerOlimex( log, self.ip, config.get("port"), config.get("relay"))
+            self.powerSwitch = powerOlimex( log, self.ip, config.get("port"), config.get("relay"), sessionKeepalive)
         elif type == "kasa":
             self.powerSwitch = powerKasa( log, **config )
         elif type == "tapo":
             self.powerSwitch = powerTapo( log, **config)
         elif type == "SLP":
-            self.powerSwitch = powerSLP(log, self.ip, config.get("username"), config.get("password"), config.get("outlet_id"),config.get('port',23))
+            self.powerSwitch = powerSLP(log, self.ip, config.get("username"), config.get("password"), config.get("outlet_id"),config.get('port',23), sessionKeepalive)
         elif type == "none":
             self.powerSwitch = powerNone( log )
         else:
             self.log.error("Power Switch [{}] unknown".format(type))
         return
 
-    def powerOn(self):
+    def powerOn(self, refresh:bool=False):
+        """Turn the outlet on. Skipped if the outlet is cached as on.
+
+        Args:
+            refresh (bool, optional): Ignore the cached state. Defaults to False.
+
+        Returns:
+            bool: True if the outlet is on.
+        """
         self.log.info("powerOn ({})".format( self.name ))
-        result = self.powerRetry(self.powerSwitch.powerOn)
+        if refresh == False and self.getCachedState() == True:
+            self.log.debug("powerOn ({}) skipped, cached state is on".format( self.name ))
+            return True
+        result = self._powerCommand(self.powerSwitch.powerOn, True)
         if result == True:
             self.powerOnState = True
         return result
 
 
-    def powerOff(self):
+    def powerOff(self, refresh:bool=False):
+        """Turn the outlet off. Skipped if the outlet is cached as off.
+
+        Args:
+            refresh (bool, optional): Ignore the cached state. Defaults to False.
+
+        Returns:
+            bool: True if the outlet is off.
+        """
         self.log.info("powerOff ({})".format( self.name ))
-        result = self.powerRetry(self.powerSwitch.powerOff)
+        if refresh == False and self.getCachedState() == False:
+            self.log.debug("powerOff ({}) skipped, cached state is off".format( self.name ))
+            return True
+        result = self._powerCommand(self.powerSwitch.powerOff, False)
         if result == True:
             self.powerOnState = False
         return result
 
+    @staticmethod
+    def powerGroup(controls:list, state:bool, refresh:bool=False):
+        """Switch several outlets on the same power switch together.
+
+        Outlets already cached in the requested state are skipped. Power switches
+        with a powerGroup method switch the remaining outlets together, e.g. in a
+        single multi-outlet command. Otherwise each outlet is switched in turn.
+
+        Args:
+            controls (list): powerControlClass instances sharing a switchKey.
+            state (bool): True to power the outlets on, False to power them off.
+            refresh (bool, optional): Ignore the cached states. Defaults to False.
+
+        Returns:
+            bool: True if every outlet is in the requested state.
+        """
+        pending = [control for control in controls if refresh or control.getCachedState() != state]
+        if len(pending) == 0:
+            return True
+        first = pending[0]
+        groupMethod = getattr(first.powerSwitch, "powerGroup", None)
+        if len(pending) == 1 or groupMethod == None:
+            results = [control.powerOn(refresh) if state else control.powerOff(refresh) for control in pending]
+            return all(result == True for result in results)
+        first.log.info("powerGroup ({}) {} outlets {}".format(first.name, len(pending), "on" if state else "off"))
+        def powerGroup():
+            return groupMethod([control.powerSwitch for control in pending], state)
+        try:
+            result = first.powerRetry(powerGroup)
+        except Exception:
+            for control in pending:
+                control.invalidateState()
+            raise
+        for control in pending:
+            if result == True:
+                control.powerOnState = state
+                control._setCachedState(state)
+            else:
+                control.invalidateState()
+        return result
+
     def reboot(self):
         self.log.info("reboot")
-        return self.powerRetry(self.powerSwitch.reboot)
+        return self._powerCommand(self.powerSwitch.reboot, True)
+
+    def getState(self, refresh:bool=False):
+        """Get the power state of the outlet.
+
+        The cached state is returned while it's younger than state_cache_ttl.
+        Otherwise the state is read from the power switch, or for switches that
+        can't report their state, the last state set is returned.
+
+        Args:
+            refresh (bool, optional): Ignore the cached state and read it from the switch. Defaults to False.
+
+        Returns:
+            bool: True if the outlet is on.
+        """
+        if refresh == False:
+            state = self.getCachedState()
+            if state != None:
+                return state
+        readState = getattr(self.powerSwitch, "getState", None)
+        if readState == None:
+            return self.powerOnState
+        try:
+            state = self.powerRetry(readState)
+        except Exception:
+            self.invalidateState()
+            raise
+        self._setCachedState(state)
+        return state
+
+    def getCachedState(self):
+        """Get the cached power state of the outlet, without querying the switch.
+
+        Returns:
+            bool: The cached state, or None if there isn't one or it's older than state_cache_ttl.
+        """
+        if self._cachedStateTime == None:
+            return None
+        if time.monotonic() - self._cachedStateTime > self.stateCacheTTL:
+            return None
+        return self._cachedState
+
+    def invalidateState(self):
+        """Discard the cached power state, e.g. when the outlet may have been switched elsewhere.
+        """
+        self._cachedState = None
+        self._cachedStateTime = None
+
+    def _setCachedState(self, state:bool):
+        if self.stateCacheTTL > 0:
+            self._cachedState = state
+            self._cachedStateTime = time.monotonic()
+
+    def _powerCommand(self, powerMethod, expectedState:bool):
+        """Run a power command, caching the expected state if it succeeds.
+
+        Args:
+            powerMethod (Method): The powerMethod to perform.
+            expectedState (bool): The outlet state after the command succeeds.
+
+        Returns:
+            boolean: Whether the powerMethod was successfully performed.
+        """
+        try:
+            result = self.powerRetry(powerMethod)
+        except Exception:
+            self.invalidateState()
+            raise
+        if result == True:
+            self._setCachedState(expectedState)
+        else:
+            self.invalidateState()
+        return result
 
     def getPowerLevel(self):
         """Retrieve the current power draw of the device.
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Power cycle to ready benchmark. Times each boot stage of a DUT
+#*   **          after power is restored, from the console stream and network
+#*   **          probes, and reports the latency distribution per stage.
+#*   **
+#* ******************************************************************************
+
+import os
+import platform
+import re
+import socket
+import subprocess
+import threading
+import time
+
+import numpy as np
+
+from framework.core.logModule import logModule
+
+# Console output marking each boot stage, searched in order after the first console byte
+DEFAULT_CONSOLE_MILESTONES = {"bootloader": r"U-Boot|BOLT|CFE version|Bootloader",
+                              "kernel": r"Linux version|Booting Linux|Starting kernel",
+                              "login": r"login:"}
+NETWORK_PROBES = ("ping", "ssh")
+
+class powerCycleBenchmark():
+    """
+    Measures how long a DUT takes to become ready after a power cycle.
+
+    Each cycle powers the outlet off, waits `offTime`, then powers it on. Stage
+    times are in seconds from the power on command:
+
+    - console: the first byte on the console.
+    - one stage per console milestone, the first console output matching its pattern.
+    - ping: the first ping reply.
+    - ssh: the first SSH banner on `sshPort`.
+
+    Stages that aren't reached within `timeout` are recorded as missing.
+    """
+
+    def __init__(self, powerControl, session=None, host:str=None, log:logModule=None,
+                 consoleMilestones:dict=None, probes:tuple=NETWORK_PROBES, sshPort:int=22,
+                 offTime:float=5, timeout:float=300, pollInterval:float=0.05, outputPath:str=None):
+        """Initialise the benchmark.
+
+        Args:
+            powerControl (powerControlClass): Power control of the DUT.
+            session (consoleInterface, optional): DUT console, read with read_all. Defaults to None, no console stages.
+            host (str, optional): DUT address for the network probes. Defaults to None, no network stages.
+            log (logModule, optional): Log module. Defaults to None.
+            consoleMilestones (dict, optional): Regular expression per console stage, in boot order.
+                                                Defaults to bootloader, kernel and login.
+            probes (tuple, optional): Network probes to run, from "ping" and "ssh". Defaults to both.
+            sshPort (int, optional): SSH port probed. Defaults to 22.
+            offTime (float, optional): Seconds the outlet is left off. Defaults to 5.
+            timeout (float, optional): Seconds after power on to wait for every stage. Defaults to 300.
+            pollInterval (float, optional): Seconds between console reads. Defaults to 0.05.
+            outputPath (str, optional): Directory for the CSV reports. Defaults to the log directory.
+        """
+        if log == None:
+            log = logModule("powerCycleBenchmark")
+        self.log = log
+        self.powerControl = powerControl
+        self.session = session
+        self.host = host
+        self.sshPort = sshPort
+        self.offTime = offTime
+        self.timeout = timeout
+        self.pollInterval = pollInterval
+        self.outputPath = outputPath
+        if consoleMilestones == None:
+            consoleMilestones = DEFAULT_CONSOLE_MILESTONES
+        self.consoleMilestones = {stage: re.compile(pattern) for stage, pattern in consoleMilestones.items()}
+        self.probes = tuple(probe for probe in probes if probe in NETWORK_PROBES) if host else ()
+        self.stages = []
+        if session != None:
+            self.stages += ["console"] + list(self.consoleMilestones.keys())
+        self.stages += list(self.probes)
+        self.results = []
+
+    def run(self, cycles:int=1) -> list:
+        """Run power cycles, then log the summary and write the reports.
+
+        Args:
+            cycles (int, optional): Number of power cycles. Defaults to 1.
+
+        Returns:
+            list: Stage times per cycle, see runCycle.
+        """
+        for cycle in range(cycles):
+            self.log.step("Power cycle [{}/{}]".format(cycle + 1, cycles))
+            self.results.append(self.runCycle())
+        self.logSummary()
+        self.save()
+        return self.results
+
+    def runCycle(self) -> dict:
+        """Power cycle the DUT once and time each stage.
+
+        Returns:
+            dict: Seconds from power on per stage, None where the stage wasn't reached.
+                  "power_on" is the time the power on command took.
+        """
+        if self.powerControl.powerOff(refresh=True) != True:
+            raise RuntimeError("Power off failed")
+        time.sleep(self.offTime)
+        # Discard console output from before the power cycle
+        if self.session != None:
+            self.session.read_all()
+        times = {stage: None for stage in self.stages}
+        start = time.monotonic()
+        if self.powerControl.powerOn(refresh=True) != True:
+            raise RuntimeError("Power on failed")
+        times["power_on"] = time.monotonic() - start
+        stopEvent = threading.Event()
+        probeThreads = [threading.Thread(target=self._probeLoop, args=(probe, start, times, stopEvent), daemon=True)
+                        for probe in self.probes]
+        for thread in probeThreads:
+            thread.start()
+        self._watchConsole(start, times)
+        remaining = start + self.timeout - time.monotonic()
+        for thread in probeThreads:
+            thread.join(max(0, remaining))
+        stopEvent.set()
+        missing = [stage for stage in self.stages if times[stage] == None]
+        if missing:
+            self.log.warn("powerCycleBenchmark: stages not reached in [{}]s: {}".format(self.timeout, missing))
+        self.log.info("powerCycleBenchmark: {}".format(self._formatTimes(times)))
+        return {stage: times[stage] for stage in ["power_on"] + self.stages}
+
+    def getReport(self) -> dict:
+        """Get the latency distribution of each stage over the cycles run.
+
+        Returns:
+            dict: Per stage, the number of cycles it was reached in ("reached"), of
+                  cycles run ("cycles"), and the min, mean, median, p90 and max seconds.
+        """
+        report = dict()
+        for stage in ["power_on"] + self.stages:
+            values = np.array([result[stage] for result in self.results if result.get(stage) != None], dtype=np.float64)
+            stats = {"cycles": len(self.results), "reached": len(values)}
+            for name, function in (("min", np.min), ("mean", np.mean), ("median", np.median),
+                                   ("p90", lambda data: np.percentile(data, 90)), ("max", np.max)):
+                stats[name] = float(function(values)) if len(values) else None
+            report[stage] = stats
+        return report
+
+    def logSummary(self):
+        """Write the per stage latency summary to the test log.
+        """
+        self.log.step("Power cycle to ready, [{}] cycles".format(len(self.results)))
+        for stage, stats in self.getReport().items():
+            if stats["reached"] == 0:
+                self.log.step("{:<12} not reached".format(stage))
+                continue
+            self.log.step("{:<12} reached {}/{}  min {:.2f}s  median {:.2f}s  p90 {:.2f}s  max {:.2f}s".format(
+                stage, stats["reached"], stats["cycles"], stats["min"], stats["median"], stats["p90"], stats["max"]))
+
+    def save(self, path:str=None) -> list:
+        """Write the stage times per cycle and the summary as CSV files.
+
+        Args:
+            path (str, optional): Directory to write to. Defaults to outputPath, or the log directory.
+
+        Returns:
+            list: Paths of power_cycle_benchmark.csv and power_cycle_summary.csv.
+        """
+        if path == None:
+            path = self.outputPath or getattr(self.log, "logPath", None) or "."
+        os.makedirs(path, exist_ok=True)
+        stages = ["power_on"] + self.stages
+        cyclesPath = os.path.join(path, "power_cycle_benchmark.csv")
+        with open(cyclesPath, "w") as csvFile:
+            csvFile.write(",".join(["cycle"] + stages) + "\n")
+            for cycle, result in enumerate(self.results, 1):
+                fields = [str(cycle)] + ["" if result[stage] == None else "{:.3f}".format(result[stage]) for stage in stages]
+                csvFile.write(",".join(fields) + "\n")
+        summaryPath = os.path.join(path, "power_cycle_summary.csv")
+        columns = ["cycles", "reached", "min", "mean", "median", "p90", "max"]
+        with open(summaryPath, "w") as csvFile:
+            csvFile.write(",".join(["stage"] + columns) + "\n")
+            for stage, stats in self.getReport().items():
+                fields = [stage] + ["" if stats[column] == None else "{:.3f}".format(stats[column]) if isinstance(stats[column], float)
+                                    else str(stats[column]) for column in columns]
+                csvFile.write(",".join(fields) + "\n")
+        return [cyclesPath, summaryPath]
+
+    def _watchConsole(self, start:float, times:dict):
+        """Read the console until every console stage is seen or the timeout passes.
+        """
+        if self.session == None:
+            return
+        output = ""
+        pending = list(self.consoleMilestones.keys())
+        while time.monotonic() - start < self.timeout and (times["console"] == None or pending):
+            data = self.session.read_all()
+            if data:
+                now = time.monotonic() - start
+                if times["console"] == None:
+                    times["console"] = now
+                output += data
+                # Stages are in boot order, so each is searched for after the previous one
+                while pending:
+                    match = self.consoleMilestones[pending[0]].search(output)
+                    if match == None:
+                        break
+                    times[pending.pop(0)] = now
+                    output = output[match.end():]
+                # Keep enough output for a pattern split across reads
+                output = output[-4096:]
+            else:
+                time.sleep(self.pollInterval)
+
+    def _probeLoop(self, probe:str, start:float, times:dict, stopEvent:threading.Event):
+        """Probe the DUT until it responds or the timeout passes.
+        """
+        probeMethod = self._pingProbe if probe == "ping" else self._sshProbe
+        while not stopEvent.is_set() and time.monotonic() - start < self.timeout:
+            if probeMethod():
+                times[probe] = time.monotonic() - start
+                return
+            stopEvent.wait(self.pollInterval)
+
+    def _pingProbe(self) -> bool:
+        if platform.system().lower() == 'windows':
+            command = ["ping", "-n", "1", "-w", "1000", self.host]
+        else:
+            command = ["ping", "-c", "1", "-W", "1", self.host]
+        try:
+            return subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5).returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+
+    def _sshProbe(self) -> bool:
+        try:
+            with socket.create_connection((self.host, self.sshPort), timeout=1) as connection:
+                return connection.recv(4).startswith(b"SSH-")
+        except OSError:
+            return False
+
+    def _formatTimes(self, times:dict) -> str:
+        return ", ".join("{} [{}]".format(stage, "-" if times[stage] == None else "{:.2f}s".format(times[stage]))
+                         for stage in ["power_on"] + self.stages)
@@ -30,11 +30,12 @@
 #* ******************************************************************************
 
 from framework.core.commandModules.telnetClass import telnet
+from framework.core.powerModules.pduSessionPool import getPduSession, pduSession, sendPipelined
 
 
 class powerSLP():
 
-    def __init__(self, log, ip, username, password, outlet_id, port=None):
+    def __init__(self, log, ip, username, password, outlet_id, port=None, keepalive=0):
         """
         Initializes the PDU control object.
 
@@ -45,6 +46,9 @@ class powerSLP():
             password (str): The password for authentication.
             outlet_id (int): The ID of the outlet to control.
             port (int, optional): The port for Telnet connection. Defaults to 23.
+            keepalive (int, optional): When set, a persistent session shared with the other
+                                       outlets on the PDU is used, kept alive every keepalive seconds.
+                                       Defaults to 0, a new session per command.
         """
         self.log = log
         self.ip = ip
@@ -54,8 +58,14 @@ class powerSLP():
         self.port = 23
         if port:
             self.port = port
-        self.telnet = telnet(self.log, '{}:{}'.format(self.ip, self.port),
-                             self.username, self.password)
+        self.session = None
+        self.telnet = None
+        if keepalive:
+            self.session = getPduSession(self.log, self.ip, self.port, self.username, self.password,
+                                         username_prompt='Username: ', password_prompt='Password: ',
+                                         keepalive=keepalive)
+        else:
+            self.telnet = telnet(self.log, "", self.ip, self.username, self.password, self.port)
 
     def command(self, cmd):
         """
@@ -67,13 +77,15 @@ class powerSLP():
         Returns:
             bool: True if the command was successful, False otherwise.
         """
+        if self.session:
+            return "Command successful" in self.session.command(cmd, "Command successful")
         result = True
         if self.telnet.connect(username_prompt='Username: ',
                                password_prompt='Password: ') is False:
             raise RuntimeError('Cannot connect to PDU via telnet')
         self.telnet.read_very_eager()
         if self.telnet.write(cmd):
-            if b"Command successful" not in self.telnet.read_until(
+            if "Command successful" not in self.telnet.read_until(
                     "Command successful"):
                 result = False
         else:
@@ -81,6 +93,31 @@ class powerSLP():
         self.telnet.disconnect()
         return result
 
+    def powerGroup(self, powerSwitches, state):
+        """
+        Switch several outlets on this PDU together, pipelining their commands in one session.
+
+        Args:
+            powerSwitches (list): powerSLP instances for outlets on this PDU.
+            state (bool): True to turn the outlets on, False to turn them off.
+
+        Returns:
+            bool: True if every outlet was switched, False otherwise.
+        """
+        commands = ['{} {}\n'.format('ON' if state else 'OFF', switch.outlet) for switch in powerSwitches]
+        session = self.session
+        if session is None:
+            session = pduSession(self.log, self.ip, self.port, self.username, self.password,
+                                 username_prompt='Username: ', password_prompt='Password: ', keepalive=0)
+        try:
+            result = session.run(sendPipelined, commands, "Command successful")
+        finally:
+            if self.session is None:
+                session.close()
+        if result != True:
+            self.log.error(" Power Failed {}".format('on' if state else 'off'))
+        return result
+
     def powerOff(self):
         """
         Turn off the outlet.
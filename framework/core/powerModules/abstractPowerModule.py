@@ -75,6 +75,17 @@ class PowerModuleInterface(metaclass=ABCMeta):
         """
         pass
 
+    def getState(self) -> bool:
+        """Read the current power state of the powerswitch/outlet.
+
+        Power modules that can query the device should override this. By default
+        the last state set by the module is returned.
+
+        Returns:
+            bool: True if the powerswitch/outlet is powered on.
+        """
+        return self.is_on
+
     def reboot(self) -> bool:
         """Power cycle the powerswitch/outlet.
 
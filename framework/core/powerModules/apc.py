@@ -32,6 +32,7 @@
 
 import time
 from framework.core.commandModules.telnetClass import telnet
+from framework.core.powerModules.pduSessionPool import getPduSession
 import re
 
 CONNECT_MSG = "Communication Established"
@@ -45,7 +46,7 @@ class powerAPC():
     """Power Control module for the APC power switches
     """
 
-    def __init__(self, log, hostName, userName, password, outletNumber=1):
+    def __init__(self, log, hostName, userName, password, outletNumber=1, keepalive=0, port=23):
         """
         Initializes the PDU Controller class.
 
@@ -55,13 +56,23 @@ class powerAPC():
             userName (str): The username for the PDU web interface.
             password (str): The password for the PDU web interface.
             outletNumber (int, optional): The outlet number on the PDU. Defaults to 1.
+            keepalive (int, optional): When set, a persistent session shared with the other outlets on
+                                       the PDU is used, kept alive every keepalive seconds. Defaults to 0,
+                                       a new session per operation.
+            port (int, optional): The telnet port of the PDU. Defaults to 23.
         """
         self.hostName = hostName
+        self.port = port
         self.userName = userName
         self.password = password
         self.outletNumber = outletNumber
         self.log = log
         self.telnet = None
+        self.session = None
+        if keepalive:
+            self.session = getPduSession(self.log, self.hostName, self.port, self.userName, self.password,
+                                         username_prompt="User Name :", password_prompt="Password  :",
+                                         ready=CONNECT_MSG, keepalive=keepalive)
 
     def pduPowerSetting(self, powerMode):
         """
@@ -73,6 +84,9 @@ class powerAPC():
         Returns:
             bool: True if the operation is successful, False otherwise.
         """
+        if self.session:
+            return self.session.run(self.sessionPowerSetting, powerMode)
+
         if not self.open():
             self.log.error("Unable to open PDU")
             return False
@@ -83,6 +97,97 @@ class powerAPC():
 
         self.selectPDUOutlet(self.outletNumber)
 
+        if not self.sendPowerMode(powerMode):
+            return False
+
+        self.close()
+        return True
+
+    def powerGroup(self, powerSwitches, state):
+        """
+        Switch several outlets on this PDU in one login.
+
+        The menu interface can't switch several outlets at once, so each outlet is
+        switched in turn, without logging out in between.
+
+        Args:
+            powerSwitches (list): powerAPC instances for outlets on this PDU.
+            state (bool): True to turn the outlets on, False to turn them off.
+
+        Returns:
+            bool: True if every outlet was switched, False otherwise.
+        """
+        outlets = [switch.outletNumber for switch in powerSwitches]
+        powerMode = POWER_ON if state else POWER_OFF
+        if self.session:
+            return self.session.run(self.sessionPowerOutlets, outlets, powerMode)
+
+        if not self.open():
+            self.log.error("Unable to open PDU")
+            return False
+        try:
+            return self.sessionPowerOutlets(self.telnet, outlets, powerMode)
+        finally:
+            self.close()
+
+    def sessionPowerOutlets(self, session, outlets, powerMode):
+        """
+        Control the power mode of several outlets over an open PDU session.
+
+        Args:
+            session (telnet): The open session, logged in at the top level menu.
+            outlets (list): Outlet numbers.
+            powerMode (str): The desired power mode ('POWER_ON', 'POWER_OFF', or 'REBOOT').
+
+        Returns:
+            bool: True if every outlet was set, False otherwise.
+        """
+        result = True
+        for outletNumber in outlets:
+            if self.sessionPowerSetting(session, powerMode, outletNumber) != True:
+                result = False
+        return result
+
+    def sessionPowerSetting(self, session, powerMode, outletNumber=None):
+        """
+        Control the power mode of the outlet over the shared PDU session.
+
+        The session is left logged in at the top level menu, ready for the next operation.
+
+        Args:
+            session (telnet): The open session, logged in at the top level menu.
+            powerMode (str): The desired power mode ('POWER_ON', 'POWER_OFF', or 'REBOOT').
+            outletNumber (int, optional): The outlet to control. Defaults to this instance's outlet.
+
+        Returns:
+            bool: True if the operation is successful, False otherwise.
+
+        Raises:
+            ConnectionError: If the PDU doesn't show its menu, so the session is reopened.
+        """
+        self.telnet = session
+        self.telnet.read_very_eager()
+        # Redraw the top level menu, which configurePDU waits for
+        self.telnet.write("")
+        if not self.configurePDU(logout=False):
+            raise ConnectionError("PDU menu not shown")
+        if outletNumber == None:
+            outletNumber = self.outletNumber
+        self.selectPDUOutlet(outletNumber)
+        result = self.sendPowerMode(powerMode)
+        self.returnToTop()
+        return result
+
+    def sendPowerMode(self, powerMode):
+        """
+        Send a power mode to the selected outlet.
+
+        Args:
+            powerMode (str): The desired power mode ('POWER_ON', 'POWER_OFF', or 'REBOOT').
+
+        Returns:
+            bool: True if the power mode is valid, False otherwise.
+        """
         if POWER_ON == powerMode:
             self.log.info("Powering ON the device")
             self.sendPowerON()
@@ -97,8 +202,6 @@ class powerAPC():
         else:
             self.log.info("Invalid Power Mode")
             return False
-
-        self.close()
         return True
 
     def checkConnection(self):
@@ -123,8 +226,9 @@ class powerAPC():
         Returns:
             bool: True if the connection is successful, False otherwise.
         """
-        self.telnet = telnet(self.log, "", self.hostName, self.userName, self.password)
-        self.telnet.connect(username_prompt="User Name :", password_prompt="Password  :")
+        self.telnet = telnet(self.log, "", self.hostName, self.userName, self.password, self.port,
+                             username_prompt="User Name :", password_prompt="Password  :")
+        self.telnet.open()
 
         if self.checkConnection():
             self.log.info("Successfully connected to PDU")
@@ -136,6 +240,15 @@ class powerAPC():
     def close(self):
         """Close a Telnet connection to the APC power switch.
         """
+        self.returnToTop()
+        self.telnet.write("4")
+        self.telnet.read_some()
+        self.telnet.write("")
+        self.log.info("Disconnected from PDU")
+
+    def returnToTop(self):
+        """Return to the top level menu of the APC power switch.
+        """
         # Keeping sending ECS make us reach top directory
         self.telnet.write(chr(27))
         self.telnet.write(chr(27))
@@ -144,10 +257,6 @@ class powerAPC():
         self.telnet.write(chr(27))
 
         self.telnet.read_very_eager()
-        self.telnet.write("4")
-        self.telnet.read_some()
-        self.telnet.write("")
-        self.log.info("Disconnected from PDU")
 
     def waitAPCNextline(self):
         """Wait for the next line from the APC power switch.
@@ -156,14 +265,18 @@ class powerAPC():
         self.log.debug(data)
         self.telnet.read_eager()
 
-    def configurePDU(self):
+    def configurePDU(self, logout=True):
         """Configure the APC power switch for outlet control.
+
+        Args:
+            logout (bool, optional): Log out of the PDU on failure. Defaults to True.
         """
         self.log.info("configuring PDU")
         data = self.telnet.read_until('Console')
         if not re.search("Console", data, re.IGNORECASE):
             self.log.info('Failed to configure PDU')
-            self.close()
+            if logout:
+                self.close()
             return False
 
         self.log.info("PDU Control Console")
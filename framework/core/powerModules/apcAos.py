@@ -31,6 +31,7 @@
 
 import time
 from framework.core.commandModules.telnetClass import telnet
+from framework.core.powerModules.pduSessionPool import getPduSession
 
 CMD_PROMPT = "apc>"
 POWER_ON = "olOn"
@@ -43,7 +44,7 @@ class powerApcAos():
     """Power Control module for the APC power switches
     """
 
-    def __init__(self, log, hostName, userName, password, port=23, outletNumber=1):
+    def __init__(self, log, hostName, userName, password, port=23, outletNumber=1, keepalive=0):
         """
         Initialize the powerAPCAOS object.
 
@@ -54,6 +55,9 @@ class powerApcAos():
             password (str): Password for accessing the APC power switch.
             port (int): Port number for the Telnet connection (default is 23).
             outletNumber (int): Outlet number to control (default is 1).
+            keepalive (int): When set, a persistent session shared with the other outlets on the
+                             PDU is used, kept alive every keepalive seconds (default is 0, a new
+                             session per command).
         """
         self.hostName = hostName
         self.userName = userName
@@ -62,12 +66,18 @@ class powerApcAos():
         self.outletNumber = outletNumber
         self.log = log
         self.telnet = None
+        self.session = None
+        if keepalive:
+            self.session = getPduSession(self.log, self.hostName, self.port, self.userName, self.password,
+                                         username_prompt="User Name :", password_prompt="Password  :",
+                                         ready=CMD_PROMPT, keepalive=keepalive)
 
     def open(self):
         """Open a Telnet connection to the APC power switch.
         """
-        self.telnet = telnet(self.log, "", self.hostName, self.userName, self.password, self.port)
-        self.telnet.connect("User Name :", "Password  :")
+        self.telnet = telnet(self.log, "", self.hostName, self.userName, self.password, self.port,
+                             username_prompt="User Name :", password_prompt="Password  :")
+        self.telnet.open()
         self.waitForPrompt()
 
     def close(self):
@@ -77,9 +87,13 @@ class powerApcAos():
 
     def waitForPrompt(self):
         """Wait for the command prompt from the APC power switch.
+
+        Returns:
+            str: The output up to the prompt.
         """
         data = self.telnet.read_until(CMD_PROMPT)
         self.log.info(data)
+        return data
 
     def sendCommand(self, cmd):
         """
@@ -87,11 +101,19 @@ class powerApcAos():
 
         Args:
             cmd (str): Command to send.
+
+        Returns:
+            str: The response.
         """
+        if self.session:
+            data = self.session.command(cmd, CMD_PROMPT)
+            self.log.info(data)
+            return data
         self.open()
         self.telnet.write(cmd)
-        self.waitForPrompt()
+        data = self.waitForPrompt()
         self.close()
+        return data
 
     def powerOn(self):
         """
@@ -101,7 +123,10 @@ class powerApcAos():
             bool: True if the operation is successful, False otherwise.
         """
         self.log.debug("powerApcAos().powerOn")
-        self.sendCommand(POWER_ON + " " + str(self.outletNumber))
+        data = self.sendCommand(POWER_ON + " " + str(self.outletNumber))
+        if "E000" not in data:
+            self.log.error(" PDU error [{}]".format(data.strip()))
+            return False
         return True
 
     def powerOff(self):
@@ -112,9 +137,31 @@ class powerApcAos():
             bool: True if the operation is successful, False otherwise.
         """
         self.log.debug("powerApcAos().powerOff")
-        self.sendCommand(POWER_OFF + " " + str(self.outletNumber))
+        data = self.sendCommand(POWER_OFF + " " + str(self.outletNumber))
+        if "E000" not in data:
+            self.log.error(" PDU error [{}]".format(data.strip()))
+            return False
         return True
         
+    def powerGroup(self, powerSwitches, state):
+        """
+        Switch several outlets on this PDU with a single command, e.g. olOn 1,3,5.
+
+        Args:
+            powerSwitches (list): powerApcAos instances for outlets on this PDU.
+            state (bool): True to turn the outlets on, False to turn them off.
+
+        Returns:
+            bool: True if the PDU reports success, False otherwise.
+        """
+        outlets = ",".join(str(switch.outletNumber) for switch in powerSwitches)
+        self.log.debug("powerApcAos().powerGroup [{}] {}".format(outlets, state))
+        data = self.sendCommand((POWER_ON if state else POWER_OFF) + " " + outlets)
+        if "E000" not in data:
+            self.log.error(" Power Failed on outlets [{}]".format(outlets))
+            return False
+        return True
+
     def reboot(self):
         """
         Reboot the outlet specified by the outletNumber.
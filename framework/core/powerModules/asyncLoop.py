@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.powerModules
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Persistent asyncio event loop for power modules driving async
+#*   **          device libraries from synchronous code.
+#*   **
+#* *****************************************************************************
+
+import asyncio
+import concurrent.futures
+import threading
+
+class asyncLoopThread():
+    """
+    Runs an asyncio event loop on a daemon thread for the life of the process.
+
+    Async device libraries keep their connections bound to the loop they were
+    created on, so running every call on the same loop lets connections be reused
+    between calls, where asyncio.run would create and close a new loop each time.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="powerModuleAsyncLoop", daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop the coroutines are run on.
+        """
+        return self._loop
+
+    def run(self, coroutine, timeout:float=None):
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coroutine (coroutine): The coroutine to run.
+            timeout (float, optional): Seconds to wait for the result. Defaults to None, wait forever.
+
+        Returns:
+            Any: The result of the coroutine.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the coroutine doesn't complete in time. It is cancelled.
+            Exception: Any exception raised by the coroutine.
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+_sharedLoop = None
+_sharedLoopLock = threading.Lock()
+
+def getAsyncLoop() -> asyncLoopThread:
+    """Get the event loop shared by all power modules, starting it on first use.
+
+    Returns:
+        asyncLoopThread: The shared loop.
+    """
+    global _sharedLoop
+    with _sharedLoopLock:
+        if _sharedLoop is None:
+            _sharedLoop = asyncLoopThread()
+        return _sharedLoop
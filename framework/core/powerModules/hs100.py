@@ -30,12 +30,13 @@
 #*   **
 #* ******************************************************************************
 
-import socket
+import concurrent.futures
+import json
 import time
-import struct
-from struct import pack
 
 import framework.core.logModule
+from framework.core.powerModules.asyncLoop import getAsyncLoop
+from framework.core.powerModules.hs100Async import decrypt, encrypt, hs100AsyncClient
 
 class powerHS100():
     
@@ -53,6 +54,8 @@ class powerHS100():
             port = 9999
         self.port = int(port)
         self.log = log
+        # The connection is kept open between commands
+        self.client = hs100AsyncClient(self.ip, self.port)
 
         # Predefined Smart Plug Commands
         self.commands = {'info'     : '{"system":{"get_sysinfo":{}}}',
@@ -81,13 +84,7 @@ class powerHS100():
         Returns:
             bytes: The encrypted bytes.
         """
-        key = 171
-        result = pack('>I', len(string))
-        for i in string:
-            a = key ^ ord(i)
-            key = a
-            result += bytes([a])
-        return result
+        return encrypt(string.encode())
 
     def decrypt(self, string):
         """
@@ -99,13 +96,25 @@ class powerHS100():
         Returns:
             str: The decrypted string.
         """
-        key = 171
-        result = ""
-        for i in string:
-            a = key ^ i
-            key = i
-            result += chr(a)
-        return result
+        return decrypt(string).decode()
+
+    def query(self, key):
+        """
+        Send a command over the plug's persistent connection.
+
+        Args:
+            key (str): The command key. Refer to self.commands for available keys.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            OSError: If the plug can't be reached.
+        """
+        response = getAsyncLoop().run(self.client.query(json.loads(self.commands[key])), self.client.timeout * 2)
+        self.log.debug("Sent:     {}".format(key))
+        self.log.debug("Received: {}".format(response))
+        return response
 
     def switchCommand(self, key):
         """
@@ -122,26 +131,62 @@ class powerHS100():
         while counter < 5:
             try:
                 counter += 1
-                sock_tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock_tcp.settimeout(5)
-                sock_tcp.connect((self.ip, self.port))
-                sock_tcp.settimeout(None)
-                sock_tcp.send(self.encrypt(self.commands[key]))
-                data = sock_tcp.recv(2048)
-                sock_tcp.close()
-                decrypted = self.decrypt(data[4:])
-                self.log.debug("Sent:     {}".format(key))
-                self.log.debug("Received: {}".format(decrypted))
+                self.query(key)
                 if key == 'on':
                     self.powerOnState = True
                 result = True
                 break
-            except socket.error as message:
-                #quit("Could not connect to host " + self.powerSwitchIp + ":" + str(self.powerSwitchPort))
+            except (OSError, concurrent.futures.TimeoutError) as message:
                 self.log.error("PowerControl Socket Error: %s" % message)
                 time.sleep(1)
         return result
 
+    def getState(self):
+        """
+        Read the state of the Smart Plug.
+
+        Returns:
+            bool: True if the plug is on.
+        """
+        response = self.query('info')
+        return bool(response["system"]["get_sysinfo"].get("relay_state"))
+
+    def getPowerLevel(self):
+        """
+        Read the power draw from a HS110 energy meter.
+
+        Returns:
+            float: Power level in Watts.
+
+        Raises:
+            RuntimeError: If the plug has no energy meter.
+        """
+        return getAsyncLoop().run(self.client.getRealtime(), self.client.timeout * 2)["power"]
+
+    def getVoltageLevel(self):
+        """
+        Read the voltage from a HS110 energy meter.
+
+        Returns:
+            float: Voltage level in Volts.
+
+        Raises:
+            RuntimeError: If the plug has no energy meter.
+        """
+        return getAsyncLoop().run(self.client.getRealtime(), self.client.timeout * 2)["voltage"]
+
+    def getCurrentLevel(self):
+        """
+        Read the current draw from a HS110 energy meter.
+
+        Returns:
+            float: Current level in Amps.
+
+        Raises:
+            RuntimeError: If the plug has no energy meter.
+        """
+        return getAsyncLoop().run(self.client.getRealtime(), self.client.timeout * 2)["current"]
+
     def powerOff(self):
         """
         Turn off the Smart Plug.
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.powerModules
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Asyncio client for TP-Link HS100/HS110 smart plugs. Keeps a
+#*   **          connection open per plug and fans requests out to many plugs
+#*   **          at once.
+#*   **
+#* ******************************************************************************
+
+import asyncio
+import json
+import struct
+
+import numpy as np
+
+from framework.core.powerModules.asyncLoop import getAsyncLoop
+
+INITIALIZATION_VECTOR = 171
+DEFAULT_PORT = 9999
+
+def encrypt(plaintext:bytes) -> bytes:
+    """Obfuscate a message with the XOR autokey cipher, adding the length prefix.
+
+    Each output byte is the XOR of the initialisation vector and every input
+    byte up to it, so the whole message is a single cumulative XOR.
+
+    Args:
+        plaintext (bytes): Message to obfuscate.
+
+    Returns:
+        bytes: The length prefixed, obfuscated message.
+    """
+    data = np.frombuffer(plaintext, dtype=np.uint8)
+    ciphertext = np.bitwise_xor.accumulate(data) ^ np.uint8(INITIALIZATION_VECTOR)
+    return struct.pack(">I", len(plaintext)) + ciphertext.tobytes()
+
+def decrypt(ciphertext:bytes) -> bytes:
+    """Reverse the XOR autokey cipher.
+
+    Each plain byte is the XOR of its cipher byte and the cipher byte before it.
+
+    Args:
+        ciphertext (bytes): Obfuscated message, without the length prefix.
+
+    Returns:
+        bytes: The plain message.
+    """
+    data = np.frombuffer(ciphertext, dtype=np.uint8)
+    keys = np.empty_like(data)
+    keys[:1] = INITIALIZATION_VECTOR
+    keys[1:] = data[:-1]
+    return (data ^ keys).tobytes()
+
+
+class hs100AsyncClient():
+    """
+    A connection to one plug, kept open between requests.
+
+    Requests on the connection are serialised. A request that finds the
+    connection closed, e.g. by the plug restarting, reconnects once and
+    is sent again.
+    """
+
+    def __init__(self, host:str, port:int=DEFAULT_PORT, timeout:float=5):
+        """Initialise the client. The connection is opened by the first request.
+
+        Args:
+            host (str): Plug address.
+            port (int, optional): Plug port. Defaults to 9999.
+            timeout (float, optional): Seconds to wait for a connection or response. Defaults to 5.
+        """
+        self.host = host
+        self.port = int(port) if port else DEFAULT_PORT
+        self.timeout = timeout
+        self.connectCount = 0
+        self._reader = None
+        self._writer = None
+        self._lock = None
+
+    async def query(self, request:dict) -> dict:
+        """Send a request and wait for its response.
+
+        Args:
+            request (dict): The request, e.g. {"system": {"get_sysinfo": {}}}.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            OSError: If the plug can't be reached.
+            asyncio.TimeoutError: If the plug doesn't respond in time.
+        """
+        if self._lock == None:
+            # Created here so it belongs to the running loop
+            self._lock = asyncio.Lock()
+        message = encrypt(json.dumps(request).encode())
+        async with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._writer == None:
+                        await self._connect()
+                    self._writer.write(message)
+                    await self._writer.drain()
+                    header = await asyncio.wait_for(self._reader.readexactly(4), self.timeout)
+                    body = await asyncio.wait_for(self._reader.readexactly(struct.unpack(">I", header)[0]), self.timeout)
+                    return json.loads(decrypt(body))
+                except (OSError, asyncio.IncompleteReadError) as e:
+                    await self.close()
+                    if attempt > 0:
+                        raise OSError("HS100 [{}:{}] request failed: {}".format(self.host, self.port, e)) from e
+
+    async def setState(self, state:bool) -> bool:
+        """Switch the plug.
+
+        Args:
+            state (bool): True to turn on, False to turn off.
+
+        Returns:
+            bool: True if the plug accepted the command.
+        """
+        response = await self.query({"system": {"set_relay_state": {"state": int(state)}}})
+        return response["system"]["set_relay_state"].get("err_code", 0) == 0
+
+    async def getState(self) -> bool:
+        """Read the plug state.
+
+        Returns:
+            bool: True if the plug is on.
+        """
+        response = await self.query({"system": {"get_sysinfo": {}}})
+        return bool(response["system"]["get_sysinfo"].get("relay_state"))
+
+    async def getRealtime(self) -> dict:
+        """Read the energy meter of a HS110.
+
+        Returns:
+            dict: power (W), voltage (V) and current (A).
+
+        Raises:
+            RuntimeError: If the plug has no energy meter.
+        """
+        response = await self.query({"emeter": {"get_realtime": {}}})
+        realtime = response.get("emeter", {}).get("get_realtime", {})
+        if realtime.get("err_code", 0) != 0:
+            raise RuntimeError("HS100 [{}] has no energy meter: {}".format(self.host, realtime.get("err_msg")))
+        # Newer firmware reports milli units, older firmware reports whole units
+        return {"power": realtime["power_mw"] / 1000 if "power_mw" in realtime else realtime.get("power"),
+                "voltage": realtime["voltage_mv"] / 1000 if "voltage_mv" in realtime else realtime.get("voltage"),
+                "current": realtime["current_ma"] / 1000 if "current_ma" in realtime else realtime.get("current")}
+
+    async def close(self):
+        """Close the connection.
+        """
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer != None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        self.connectCount += 1
+
+
+class hs100AsyncController():
+    """
+    Queries or switches many plugs at once.
+
+    Each plug keeps its own open connection, and requests to different plugs
+    run concurrently, so switching a rack of plugs takes about as long as
+    switching one. The synchronous methods run on the event loop shared by the
+    power modules; the coroutines can be awaited directly from that loop.
+    """
+
+    def __init__(self, plugs:list, timeout:float=5):
+        """Initialise the controller.
+
+        Args:
+            plugs (list): Plug addresses, as "host" or "host:port", or (host, port) tuples.
+            timeout (float, optional): Seconds to wait for each plug. Defaults to 5.
+        """
+        self.timeout = timeout
+        self.clients = dict()
+        for plug in plugs:
+            if isinstance(plug, str):
+                host, _, port = plug.partition(":")
+                plug = (host, int(port) if port else DEFAULT_PORT)
+            self.clients[plug] = hs100AsyncClient(plug[0], plug[1], timeout)
+
+    def setState(self, state:bool, plugs:list=None) -> dict:
+        """Switch plugs concurrently.
+
+        Args:
+            state (bool): True to turn on, False to turn off.
+            plugs (list, optional): (host, port) keys of the plugs. Defaults to all plugs.
+
+        Returns:
+            dict: True or the exception raised, per plug.
+        """
+        return self._run(lambda client: client.setState(state), plugs)
+
+    def getStates(self, plugs:list=None) -> dict:
+        """Read plug states concurrently.
+
+        Args:
+            plugs (list, optional): (host, port) keys of the plugs. Defaults to all plugs.
+
+        Returns:
+            dict: The state, or the exception raised, per plug.
+        """
+        return self._run(lambda client: client.getState(), plugs)
+
+    def getRealtime(self, plugs:list=None) -> dict:
+        """Read energy meters concurrently.
+
+        Args:
+            plugs (list, optional): (host, port) keys of the plugs. Defaults to all plugs.
+
+        Returns:
+            dict: The reading, see hs100AsyncClient.getRealtime, or the exception raised, per plug.
+        """
+        return self._run(lambda client: client.getRealtime(), plugs)
+
+    async def streamRealtime(self, interval:float=1, count:int=None, plugs:list=None):
+        """Read the energy meters of plugs at a fixed interval.
+
+        Args:
+            interval (float, optional): Seconds between readings. Defaults to 1.
+            count (int, optional): Number of readings. Defaults to None, until cancelled.
+            plugs (list, optional): (host, port) keys of the plugs. Defaults to all plugs.
+
+        Yields:
+            dict: The loop time of the reading, and the reading or exception per plug.
+        """
+        loop = asyncio.get_running_loop()
+        nextReading = loop.time()
+        taken = 0
+        while count == None or taken < count:
+            readings = await self._gather(lambda client: client.getRealtime(), plugs)
+            yield {"time": nextReading, "readings": readings}
+            taken += 1
+            nextReading += interval
+            await asyncio.sleep(max(0, nextReading - loop.time()))
+
+    def close(self):
+        """Close every plug connection.
+        """
+        getAsyncLoop().run(self._closeAll(), self.timeout)
+
+    async def _closeAll(self):
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
+
+    async def _gather(self, request, plugs:list=None) -> dict:
+        keys = list(self.clients.keys()) if plugs == None else plugs
+        results = await asyncio.gather(*(request(self.clients[key]) for key in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+    def _run(self, request, plugs:list=None) -> dict:
+        # Each plug has its own timeout, so allow for a reconnect and one more attempt
+        return getAsyncLoop().run(self._gather(request, plugs), self.timeout * 4)
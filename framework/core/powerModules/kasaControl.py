@@ -52,6 +52,9 @@
 # @Note: Had issues with calling the python library directly it has comms errors
 # To get round this issue and to get this in, since kasa command line tool works
 # Swap the interface to use that instead
+#
+# The library can be used again with backend: "library". It then runs on a
+# persistent event loop, so one connection to the device is kept open and reused
 #* ******************************************************************************
 
 import os
@@ -60,13 +63,14 @@ import subprocess
 
 from framework.core.logModule import logModule
 from framework.core.powerModules.abstractPowerModule import PowerModuleInterface
+from framework.core.powerModules.asyncLoop import getAsyncLoop
 
 class powerKasa(PowerModuleInterface):
     
     """Kasa power switch controller supports
     """
     
-    def __init__( self, log:logModule, ip:str, args:str=None, options:str=None, **kwargs ):
+    def __init__( self, log:logModule, ip:str, args:str=None, options:str=None, backend:str="cli", port:int=None, timeout:float=5, **kwargs ):
         """[init the kasa module]
 
             kasa [OPTIONS] COMMAND [ARGS]...\n
@@ -80,6 +84,9 @@ class powerKasa(PowerModuleInterface):
             ip ([str]): [ip]
             args ([str], optional): [args]. Defaults to None.
             options ([str], optional): [options]. Defaults to None, which translates to "--plug"
+            backend ([str], optional): ["cli" to run the kasa command line tool, or "library" to use python-kasa in process]. Defaults to "cli".
+            port ([int], optional): [port of the device]. Defaults to None, the standard port.
+            timeout ([float], optional): [seconds to wait for the device with the library backend]. Defaults to 5.
             kwargs ([dict]): [any other args]
         """
         super().__init__(log)
@@ -96,6 +103,11 @@ class powerKasa(PowerModuleInterface):
             self.slotIndex=int(args.split("--index ")[1])
         self.options = options
         self.args = args
+        self.backend = backend
+        self.port = port
+        self.timeout = timeout
+        self._device = None
+        self._childId = None
 
     def split_with_quotes(self, inputString):
         """
@@ -147,6 +159,8 @@ class powerKasa(PowerModuleInterface):
         """
         extension = ""
         extension += "--host {} ".format(self.ip)
+        if self.port != None:
+            extension += "--port {} ".format(self.port)
         if noOptions == False:
             extension += "{} ".format( self.options )
         extension += "{}".format(command)
@@ -166,6 +180,8 @@ class powerKasa(PowerModuleInterface):
         Returns:
             bool: True if the operation is successful, False otherwise.
         """
+        if self.backend == "library":
+            return self._librarySetState(False)
         self.__getstate__()
         if self.is_off:
             return True
@@ -182,6 +198,8 @@ class powerKasa(PowerModuleInterface):
         Returns:
             bool: True if the operation is successful, False otherwise.
         """
+        if self.backend == "library":
+            return self._librarySetState(True)
         self.__getstate__()
         if self.is_on:
             return True
@@ -191,9 +209,22 @@ class powerKasa(PowerModuleInterface):
             self._log.error(" Power On Failed")    
         return self.is_on
 
+    def getState(self):
+        """
+        Read the state of the device.
+
+        Returns:
+            bool: True if the device is on.
+        """
+        self.__getstate__()
+        return self._is_on
+
     def __getstate__(self):
         """Get the state of the device.
         """
+        if self.backend == "library":
+            self._is_on = getAsyncLoop().run(self._libraryGetState(), self.timeout)
+            return
         if "strip" in self.options:
             # We have a strip look at the status of the strip, and check the index and the device state
             #Device state: ON
@@ -233,6 +264,177 @@ class powerKasa(PowerModuleInterface):
                 self._is_on = True
                 self._log.debug("Device state: ON")
 
+    def _librarySetState(self, state:bool):
+        """
+        Switch the device with python-kasa, skipping the command if it's already in that state.
+
+        Args:
+            state (bool): True to turn on, False to turn off.
+
+        Returns:
+            bool: True if the device is in the requested state.
+        """
+        try:
+            self._is_on = getAsyncLoop().run(self._libraryQuerySetState(state), self.timeout)
+        except Exception as e:
+            self._log.error(" Power {} Failed: {}".format("On" if state else "Off", e))
+            raise
+        return self._is_on == state
+
+    async def _libraryDevice(self):
+        """
+        Get the python-kasa device, creating it on first use. The device is kept
+        for the life of this object, so its connection is reused.
+
+        Returns:
+            kasa.iot.IotDevice: The device.
+        """
+        if self._device == None:
+            from kasa import DeviceConfig
+            from kasa.iot import IotPlug, IotStrip
+            config = DeviceConfig(self.ip, port_override=self.port, timeout=self.timeout)
+            if "strip" in self.options:
+                self._device = IotStrip(self.ip, config=config)
+            else:
+                self._device = IotPlug(self.ip, config=config)
+        return self._device
+
+    async def _libraryQuery(self, request:dict, childIds:list=None):
+        """
+        Send a single request to the device.
+
+        device.update() queries every module, and each outlet of a strip separately,
+        so the system commands are sent directly to keep each operation to one request.
+
+        Args:
+            request (dict): Request, e.g. {"system": {"get_sysinfo": {}}}.
+            childIds (list, optional): Strip outlet ids the request applies to. Defaults to None.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            RuntimeError: If the device returns an error.
+        """
+        device = await self._libraryDevice()
+        if childIds != None:
+            request = {"context": {"child_ids": childIds}, **request}
+        response = await device.protocol.query(request)
+        for module, methods in request.items():
+            if module == "context":
+                continue
+            for method in methods:
+                result = response.get(module, {}).get(method, {})
+                if result.get("err_code", 0) != 0:
+                    raise RuntimeError("Kasa [{}] {}.{} failed: {}".format(self.ip, module, method, result))
+        return response
+
+    async def _libraryGetState(self):
+        """
+        Read the state of the device, or of the strip outlet.
+
+        Returns:
+            bool: True if powered on.
+        """
+        response = await self._libraryQuery({"system": {"get_sysinfo": {}}})
+        sysinfo = response["system"]["get_sysinfo"]
+        children = sysinfo.get("children")
+        if children == None or "strip" not in self.options:
+            return bool(sysinfo.get("relay_state"))
+        child = children[self.slotIndex]
+        self._childId = child["id"]
+        return bool(child["state"])
+
+    async def _libraryQuerySetState(self, state:bool):
+        """
+        Read the state and switch the device if needed.
+
+        Args:
+            state (bool): True to turn on, False to turn off.
+
+        Returns:
+            bool: The state of the device after switching.
+        """
+        if await self._libraryGetState() == state:
+            return state
+        childIds = [self._childId] if self._childId != None else None
+        await self._libraryQuery({"system": {"set_relay_state": {"state": int(state)}}}, childIds)
+        return state
+
+    def getPowerLevel(self):
+        """
+        Read the power draw from the device's energy meter. Requires the library backend.
+
+        Returns:
+            float: Power level in Watts.
+
+        Raises:
+            RuntimeError: If the backend or device doesn't support energy monitoring.
+        """
+        return self._libraryRealtime("power")
+
+    def getVoltageLevel(self):
+        """
+        Read the voltage from the device's energy meter. Requires the library backend.
+
+        Returns:
+            float: Voltage level in Volts.
+
+        Raises:
+            RuntimeError: If the backend or device doesn't support energy monitoring.
+        """
+        return self._libraryRealtime("voltage")
+
+    def getCurrentLevel(self):
+        """
+        Read the current draw from the device's energy meter. Requires the library backend.
+
+        Returns:
+            float: Current level in Amps.
+
+        Raises:
+            RuntimeError: If the backend or device doesn't support energy monitoring.
+        """
+        return self._libraryRealtime("current")
+
+    def _libraryRealtime(self, reading:str):
+        """
+        Read one value from the energy meter.
+
+        Args:
+            reading (str): "power", "voltage" or "current".
+
+        Returns:
+            float: The reading in Watts, Volts or Amps.
+
+        Raises:
+            RuntimeError: If the backend or device doesn't support energy monitoring.
+        """
+        if self.backend != "library":
+            return getattr(super(), "get{}Level".format(reading.capitalize()))()
+        realtime = getAsyncLoop().run(self._libraryQueryRealtime(), self.timeout)
+        # Newer firmware reports milli units, older firmware reports whole units
+        if reading + "_mw" in realtime:
+            return realtime[reading + "_mw"] / 1000
+        if reading + "_mv" in realtime:
+            return realtime[reading + "_mv"] / 1000
+        if reading + "_ma" in realtime:
+            return realtime[reading + "_ma"] / 1000
+        return float(realtime[reading])
+
+    async def _libraryQueryRealtime(self):
+        """
+        Read the energy meter, of the strip outlet if this is a strip.
+
+        Returns:
+            dict: The emeter get_realtime response.
+        """
+        if "strip" in self.options and self._childId == None:
+            await self._libraryGetState()
+        childIds = [self._childId] if self._childId != None else None
+        response = await self._libraryQuery({"emeter": {"get_realtime": {}}}, childIds)
+        return response["emeter"]["get_realtime"]
+
     def reboot(self):
         """
         Reboot the device.
@@ -30,10 +30,11 @@
 #* ******************************************************************************
 
 from framework.core.commandModules.telnetClass import telnet
+from framework.core.powerModules.pduSessionPool import getPduSession, pduSession, sendPipelined
 
 class powerOlimex():
     
-    def __init__( self, log, ip, port, relay ):
+    def __init__( self, log, ip, port, relay, keepalive=0 ):
         """
         Initialize the PowerSwitch instance.
 
@@ -42,6 +43,9 @@ class powerOlimex():
             ip (str): The IP address of the power switch.
             port (int): The port number.
             relay (int): The relay number.
+            keepalive (int, optional): When set, a persistent session shared with the other
+                                       relays on the board is used, kept alive every keepalive seconds.
+                                       Defaults to 0, a new session per command.
         """
         self.log = log
         self.ip = ip
@@ -50,6 +54,9 @@ class powerOlimex():
             self.port = int(9999)   #TODO: Set the default port here
         self.relay = relay
         self.telnet = None
+        self.session = None
+        if keepalive:
+            self.session = getPduSession(self.log, self.ip, self.port, keepalive=keepalive)
 
     def command(self, cmd):
         """
@@ -61,17 +68,43 @@ class powerOlimex():
         Returns:
             bool: True if the command is successful, False otherwise.
         """
-        self.telnet=telnet(self.log, '{}:{}'.format(self.ip,self.port), None, None)
+        if self.session:
+            return "(OK)" in self.session.command(cmd, "(OK)")
+        self.telnet=telnet(self.log, "", self.ip, None, None, self.port)
         if False==self.telnet.connect():
             return False
         self.telnet.read_very_eager()
         if False==self.telnet.write(cmd):
             return False
-        if not b"(OK)" in self.telnet.read_until("(OK)"):
+        if not "(OK)" in self.telnet.read_until("(OK)"):
             return False
         self.telnet.disconnect()
         return True
 
+    def powerGroup(self, powerSwitches, state):
+        """
+        Switch several relays on this board together, pipelining their commands in one session.
+
+        Args:
+            powerSwitches (list): powerOlimex instances for relays on this board.
+            state (bool): True to turn the relays on, False to turn them off.
+
+        Returns:
+            bool: True if every relay was switched, False otherwise.
+        """
+        commands = ['REL{}={}\n'.format(switch.relay, int(state)) for switch in powerSwitches]
+        session = self.session
+        if session is None:
+            session = pduSession(self.log, self.ip, self.port, keepalive=0)
+        try:
+            result = session.run(sendPipelined, commands, "(OK)")
+        finally:
+            if self.session is None:
+                session.close()
+        if result != True:
+            self.log.error(" Power Failed {}".format('on' if state else 'off'))
+        return result
+
     def powerOff(self):
         """
         Turn off the power.
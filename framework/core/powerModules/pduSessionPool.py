@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.powerModules
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Pool of persistent telnet sessions to PDUs. One logged in
+#*   **          session is kept per PDU and shared by every outlet on it.
+#*   **
+#* ******************************************************************************
+
+import threading
+import time
+
+from framework.core.commandModules.telnetClass import telnet
+
+# Sessions shared between every power module instance, keyed by (host, port, username)
+_SESSIONS = dict()
+_SESSIONS_LOCK = threading.Lock()
+
+class pduSession():
+    """
+    A persistent telnet session to a PDU.
+
+    Commands are serialised with a lock, so the session can be shared by
+    every outlet on the PDU. The session is opened on first use, kept alive
+    by sending `keepaliveCommand` when idle, and reopened once if a command
+    finds it has been dropped.
+    """
+
+    def __init__(self, log, host:str, port:int, username:str=None, password:str=None,
+                 username_prompt:str=None, password_prompt:str=None, ready:str=None,
+                 keepalive:float=60, keepaliveCommand:str=""):
+        """Initialise the session. The connection isn't opened until it is first used.
+
+        Args:
+            log (logModule): Log module.
+            host (str): PDU address.
+            port (int): PDU telnet port.
+            username (str, optional): Login username. Defaults to None, no login.
+            password (str, optional): Login password. Defaults to None.
+            username_prompt (str, optional): Prompt shown for the username. Defaults to the telnet default.
+            password_prompt (str, optional): Prompt shown for the password. Defaults to the telnet default.
+            ready (str, optional): Text shown once logged in and ready for commands. Defaults to None, not waited for.
+            keepalive (float, optional): Seconds idle before a keepalive is sent. Defaults to 60, 0 disables keepalives.
+            keepaliveCommand (str, optional): Line sent as a keepalive. Defaults to "", an empty line.
+        """
+        self.log = log
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.usernamePrompt = username_prompt
+        self.passwordPrompt = password_prompt
+        self.ready = ready
+        self.keepalive = keepalive
+        self.keepaliveCommand = keepaliveCommand
+        self.lock = threading.RLock()
+        self.telnet = None
+        self.connectCount = 0
+        self.lastUsed = 0
+        self._stopEvent = threading.Event()
+        self._keepaliveThread = None
+
+    def run(self, function, *args):
+        """Run a function with exclusive use of the session.
+
+        The session is opened if needed. If the function fails because the connection
+        has dropped, the session is reopened and the function run once more.
+
+        Args:
+            function (callable): Called as function(telnet, *args) with the open telnet session.
+            *args: Further arguments for the function.
+
+        Returns:
+            The function's result.
+
+        Raises:
+            ConnectionError: If the session can't be opened.
+        """
+        with self.lock:
+            for attempt in range(2):
+                try:
+                    if self.telnet == None:
+                        self._open()
+                    result = function(self.telnet, *args)
+                    self.lastUsed = time.monotonic()
+                    return result
+                except (OSError, EOFError) as e:
+                    # ConnectionError is an OSError, raised when a write fails
+                    self._close()
+                    if attempt > 0:
+                        raise
+                    self.log.warn("pduSession: session to [{}:{}] lost, reconnecting: {}".format(self.host, self.port, e))
+
+    def command(self, cmd:str, expect:str, timeout:float=10) -> str:
+        """Send a command and read the response.
+
+        Args:
+            cmd (str): Command to send.
+            expect (str): Text marking the end of the response.
+            timeout (float, optional): Seconds to wait for the response. Defaults to 10.
+
+        Returns:
+            str: The response, which doesn't end with `expect` if it timed out.
+        """
+        return self.run(self._command, cmd, expect, timeout)
+
+    def close(self):
+        """Close the session and stop the keepalives.
+        """
+        self._stopEvent.set()
+        with self.lock:
+            self._close()
+
+    def _command(self, session:telnet, cmd:str, expect:str, timeout:float) -> str:
+        # Drop anything left over, e.g. keepalive responses. This raises EOFError if the PDU closed the session.
+        session.tn.read_very_eager()
+        self._write(session, cmd)
+        return session.read_until(expect, timeout)
+
+    def _write(self, session:telnet, cmd:str):
+        if session.write(cmd) == False:
+            raise ConnectionError("Write to [{}:{}] failed".format(self.host, self.port))
+
+    def _open(self):
+        """Open and log in to the session.
+
+        Raises:
+            ConnectionError: If the connection or login fails.
+        """
+        session = telnet(self.log, "", self.host, self.username, self.password, self.port)
+        prompts = dict()
+        if self.usernamePrompt:
+            prompts["username_prompt"] = self.usernamePrompt
+        if self.passwordPrompt:
+            prompts["password_prompt"] = self.passwordPrompt
+        try:
+            connected = session.connect(**prompts)
+        except OSError as e:
+            raise ConnectionError("Cannot connect to PDU [{}:{}]: {}".format(self.host, self.port, e))
+        if connected == False:
+            raise ConnectionError("Cannot connect to PDU [{}:{}]".format(self.host, self.port))
+        session.is_open = True
+        if self.ready and self.ready not in session.read_until(self.ready):
+            session.disconnect()
+            raise ConnectionError("PDU [{}:{}] not ready after login".format(self.host, self.port))
+        self.telnet = session
+        self.connectCount += 1
+        self.lastUsed = time.monotonic()
+        self.log.info("pduSession: opened session to [{}:{}]".format(self.host, self.port))
+        if self.keepalive and self._keepaliveThread == None:
+            self._keepaliveThread = threading.Thread(target=self._keepaliveLoop, daemon=True)
+            self._keepaliveThread.start()
+
+    def _close(self):
+        if self.telnet == None:
+            return
+        try:
+            self.telnet.disconnect()
+        except OSError:
+            pass
+        self.telnet.is_open = False
+        self.telnet = None
+
+    def _keepaliveLoop(self):
+        """Send a keepalive whenever the session has been idle for `keepalive` seconds.
+        """
+        while not self._stopEvent.wait(self.keepalive / 2):
+            with self.lock:
+                if self.telnet == None or time.monotonic() - self.lastUsed < self.keepalive:
+                    continue
+                try:
+                    self.telnet.tn.read_very_eager()
+                    self._write(self.telnet, self.keepaliveCommand)
+                    self.lastUsed = time.monotonic()
+                except (OSError, EOFError):
+                    # Reopened by the next command
+                    self.log.debug("pduSession: keepalive to [{}:{}] failed".format(self.host, self.port))
+                    self._close()
+
+
+def sendPipelined(session:telnet, commands:list, expect:str, timeout:float=10) -> bool:
+    """Send several commands back to back, then read a response for each.
+
+    The PDU handles the commands in order, so this costs one round trip rather than one per command.
+
+    Args:
+        session (telnet): Open telnet session.
+        commands (list): Commands to send.
+        expect (str): Text every successful response contains.
+        timeout (float, optional): Seconds to wait for each response. Defaults to 10.
+
+    Returns:
+        bool: True if every command succeeded.
+
+    Raises:
+        ConnectionError: If writing to the session fails.
+    """
+    session.tn.read_very_eager()
+    for cmd in commands:
+        if session.write(cmd) == False:
+            raise ConnectionError("Write to [{}:{}] failed".format(session.host, session.port))
+    for _ in commands:
+        if expect not in session.read_until(expect, timeout):
+            return False
+    return True
+
+def getPduSession(log, host:str, port:int, username:str=None, password:str=None, **kwargs) -> pduSession:
+    """Get the shared session for a PDU, creating it on first use.
+
+    Args:
+        log (logModule): Log module, used when the session is created.
+        host (str): PDU address.
+        port (int): PDU telnet port.
+        username (str, optional): Login username. Defaults to None.
+        password (str, optional): Login password. Defaults to None.
+        **kwargs: Further pduSession arguments, used when the session is created.
+
+    Returns:
+        pduSession: The session for the PDU.
+    """
+    key = (host, int(port), username)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session == None:
+            session = pduSession(log, host, port, username, password, **kwargs)
+            _SESSIONS[key] = session
+    return session
+
+def closePduSessions():
+    """Close every pooled PDU session.
+    """
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
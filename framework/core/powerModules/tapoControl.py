@@ -43,6 +43,10 @@
 # Swap the interface to use that instead
 # This implementation is a hack to get TAPO support.
 # The kasaControl should be reimplemented to support both Kasa and TAPO
+#
+# With backend: "library" python-kasa is used in process instead. Discovery and
+# the encryption handshake are done once per ip, and the authenticated device is
+# kept and shared by every outlet of a strip.
 #* ******************************************************************************
 
 import json
@@ -51,13 +55,19 @@ import subprocess
 
 from framework.core.logModule import logModule
 from framework.core.powerModules.abstractPowerModule import PowerModuleInterface
+from framework.core.powerModules.asyncLoop import getAsyncLoop
+
+# Connected python-kasa devices and their connection configs, keyed by (ip, port).
+# Only accessed from the shared event loop, so they don't need a lock.
+_LIBRARY_DEVICES = {}
+_LIBRARY_CONFIGS = {}
 
 class powerTapo(PowerModuleInterface):
     
     """Tapo power switch controller supports
     """
     
-    def __init__( self, log:logModule, ip:str, outlet:str = None, **kwargs ):
+    def __init__( self, log:logModule, ip:str, outlet:str = None, backend:str = "cli", port:int = None, timeout:float = 5, **kwargs ):
         """
         Tapo module based on kasa library.
         TODO: Reintegrate this with the powerKasa module.
@@ -66,6 +76,9 @@ class powerTapo(PowerModuleInterface):
             log ([logModule]): [log module]
             ip ([str]): [ip]
             outlet ([int], optional): Outlet number for power strips. Defaults to None.
+            backend ([str], optional): "cli" to run the kasa command line tool, or "library" to use python-kasa in process. Defaults to "cli".
+            port ([int], optional): Port of the device. Defaults to None, the standard port.
+            timeout ([float], optional): Seconds to wait for the device with the library backend. Defaults to 5.
             kwargs ([dict]): [any other args]
         """
         super().__init__(log)
@@ -78,7 +91,12 @@ class powerTapo(PowerModuleInterface):
             self._outlet=str(outlet)
         self._device_type = None
         self._encryption_type = None
-        self._discover_device()
+        self._backend = backend
+        self._port = port
+        self._timeout = timeout
+        self._libraryKey = (ip, port)
+        if self._backend != "library":
+            self._discover_device()
         self._get_state()
 
     def _performCommand(self, command, json = False, append_args:list = []):
@@ -131,6 +149,9 @@ class powerTapo(PowerModuleInterface):
         Returns:
             bool: True if the operation is successful, False otherwise.
         """
+        if self._backend == "library":
+            self._is_on = self._libraryRun(self._librarySetState(False))
+            return not self._is_on
         self._get_state()
         if not self._is_on:
             return True
@@ -150,6 +171,9 @@ class powerTapo(PowerModuleInterface):
         Returns:
             bool: True if the operation is successful, False otherwise.
         """
+        if self._backend == "library":
+            self._is_on = self._libraryRun(self._librarySetState(True))
+            return self._is_on
         self._get_state()
         if self._is_on:
             return True
@@ -162,9 +186,22 @@ class powerTapo(PowerModuleInterface):
             self._log.error(" Power On Failed")    
         return self._is_on
 
+    def getState(self):
+        """
+        Read the state of the device.
+
+        Returns:
+            bool: True if the device is on.
+        """
+        self._get_state()
+        return self._is_on
+
     def _get_state(self):
         """Get the state of the device.
         """
+        if self._backend == "library":
+            self._is_on = self._libraryRun(self._libraryGetState())
+            return
         result = self._performCommand("state")
         if self._outlet is not None:
             # == Children ==
@@ -265,7 +302,119 @@ class powerTapo(PowerModuleInterface):
             return found.group(1)
         return None
 
+    def getOutletStates(self) -> list:
+        """Read the state of every outlet of a power strip with a single update.
+
+        Returns:
+            list: A bool per outlet, True if powered on.
+
+        Raises:
+            RuntimeError: If the library backend isn't used.
+        """
+        if self._backend != "library":
+            raise RuntimeError('Batched outlet states require backend: "library"')
+        return self._libraryRun(self._libraryOutletStates())
+
+    def _libraryRun(self, coroutine):
+        """Run a coroutine on the shared event loop. The connected device is dropped
+        on failure so the next call reconnects, reusing the cached connection config.
+
+        Args:
+            coroutine (coroutine): The coroutine to run.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        try:
+            return getAsyncLoop().run(coroutine, self._timeout * 3)
+        except Exception as e:
+            self._log.error("Tapo [{}] request failed: {}".format(self.ip, e))
+            getAsyncLoop().run(self._libraryDisconnect(), self._timeout)
+            raise
+
+    async def _libraryDevice(self):
+        """Get the connected device, connecting on first use.
+
+        The first connection uses discovery to find the device family and encryption
+        type. Reconnections use the config saved from that, skipping discovery.
+
+        Returns:
+            kasa.Device: The device.
+        """
+        device = _LIBRARY_DEVICES.get(self._libraryKey)
+        if device is not None:
+            return device
+        from kasa import Credentials, Device, Discover
+        config = _LIBRARY_CONFIGS.get(self._libraryKey)
+        if config is None:
+            credentials = None
+            if self._username and self._password:
+                credentials = Credentials(self._username, self._password)
+            device = await Discover.discover_single(self.ip,
+                                                    port=self._port,
+                                                    credentials=credentials,
+                                                    timeout=self._timeout,
+                                                    discovery_timeout=self._timeout)
+            await device.update()
+            _LIBRARY_CONFIGS[self._libraryKey] = device.config
+        else:
+            device = await Device.connect(config=config)
+        self._device_type = device.device_type.name
+        _LIBRARY_DEVICES[self._libraryKey] = device
+        return device
+
+    async def _libraryDisconnect(self):
+        """Drop the connected device.
+        """
+        device = _LIBRARY_DEVICES.pop(self._libraryKey, None)
+        if device is not None:
+            try:
+                await device.disconnect()
+            except Exception:
+                pass
+
+    async def _libraryTarget(self):
+        """Update the device and get the outlet this instance controls.
+
+        Returns:
+            kasa.Device: The device, or the child device for a strip outlet.
+        """
+        device = await self._libraryDevice()
+        await device.update()
+        if self._outlet is not None:
+            return device.children[int(self._outlet)]
+        return device
+
+    async def _libraryGetState(self):
+        target = await self._libraryTarget()
+        return target.is_on
+
+    async def _librarySetState(self, state:bool):
+        target = await self._libraryTarget()
+        if target.is_on == state:
+            return state
+        if state:
+            await target.turn_on()
+        else:
+            await target.turn_off()
+        return state
+
+    async def _libraryOutletStates(self):
+        device = await self._libraryDevice()
+        await device.update()
+        return [child.is_on for child in device.children]
+
+    async def _libraryPowerLevel(self):
+        from kasa import Module
+        target = await self._libraryTarget()
+        energy = target.modules.get(Module.Energy)
+        if energy is None:
+            raise RuntimeError('Power monitoring is not supported by this Tapo device: [{}]'.format(self.ip))
+        return energy.current_consumption
+
     def getPowerLevel(self):
+        if self._backend == "library":
+            return self._libraryRun(self._libraryPowerLevel())
         if self._outlet is not None:
             args = [
                 "--module", 'energy', 'get_current_power',
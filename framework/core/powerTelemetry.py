@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Background power telemetry sampling. Reads an outlet's power,
+#*   **          voltage and current at a fixed rate into a ring buffer, with
+#*   **          rolling statistics and CSV/NPZ output.
+#*   **
+#* ******************************************************************************
+
+import os
+import threading
+import time
+
+import numpy as np
+
+from framework.core.logModule import logModule
+
+CHANNELS = ("power", "voltage", "current")
+
+class powerTelemetrySampler():
+    """
+    Samples the telemetry of one outlet in a background thread.
+
+    Samples are kept in a preallocated ring buffer of `capacity` samples, so
+    the oldest samples are overwritten on long runs. Each sample records the
+    time, a reading per channel, the test step number from the log module and
+    the current tag, set with `setTag`, e.g. "boot", "standby" or "playback".
+    Channels the power switch can't read are recorded as NaN.
+    """
+
+    def __init__(self, powerControl, log:logModule=None, rate:float=1, capacity:int=3600,
+                 channels:tuple=("power",), name:str="power", outputPath:str=None):
+        """Initialise the sampler.
+
+        Args:
+            powerControl (powerControlClass): Outlet to sample. Its power switch is read directly, as
+                                              a failed reading is recorded as NaN rather than retried.
+            log (logModule, optional): Log module, whose current step number tags each sample. Defaults to None.
+            rate (float, optional): Samples per second. Defaults to 1.
+            capacity (int, optional): Number of samples kept. Defaults to 3600.
+            channels (tuple, optional): Readings to take, from "power", "voltage" and "current". Defaults to ("power",).
+            name (str, optional): Name used for the output files. Defaults to "power".
+            outputPath (str, optional): Directory for the output files. Defaults to the log directory.
+
+        Raises:
+            ValueError: If a channel isn't supported or the rate isn't positive.
+        """
+        for channel in channels:
+            if channel not in CHANNELS:
+                raise ValueError("Telemetry channel [{}] not supported".format(channel))
+        if rate <= 0:
+            raise ValueError("Telemetry rate must be positive")
+        if log == None:
+            log = logModule("powerTelemetrySampler")
+        self.log = log
+        self.powerControl = powerControl
+        self.rate = rate
+        self.interval = 1 / rate
+        self.capacity = capacity
+        self.channels = tuple(channels)
+        self.name = name
+        self.outputPath = outputPath
+        self.tags = [""]
+        self._tagIndex = 0
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._values = np.full((capacity, len(self.channels)), np.nan, dtype=np.float64)
+        self._steps = np.zeros(capacity, dtype=np.int32)
+        self._tagIndexes = np.zeros(capacity, dtype=np.int32)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stopEvent = threading.Event()
+        self._thread = None
+        self._unsupported = set()
+        powerSwitch = getattr(powerControl, "powerSwitch", powerControl)
+        self._readers = {channel: getattr(powerSwitch, "get{}Level".format(channel.capitalize()), None) for channel in self.channels}
+
+    def start(self):
+        """Start sampling in a background thread.
+        """
+        if self._thread != None:
+            return
+        self._stopEvent.clear()
+        self._thread = threading.Thread(target=self._sampleLoop, daemon=True)
+        self._thread.start()
+        self.log.debug("powerTelemetrySampler: sampling [{}] at [{}]Hz".format(self.name, self.rate))
+
+    def stop(self):
+        """Stop sampling. Samples already taken are kept.
+        """
+        if self._thread == None:
+            return
+        self._stopEvent.set()
+        self._thread.join()
+        self._thread = None
+
+    def setTag(self, tag:str):
+        """Tag the following samples, e.g. with the DUT state being measured.
+
+        Args:
+            tag (str): The tag. "" clears it.
+        """
+        with self._lock:
+            if tag not in self.tags:
+                self.tags.append(tag)
+            self._tagIndex = self.tags.index(tag)
+
+    def sample(self):
+        """Take one sample now. Called by the sampling thread, and can be called directly.
+        """
+        # The sample belongs to the tag and step current when it was started
+        tagIndex = self._tagIndex
+        step = getattr(self.log, "stepNum", 0)
+        values = [self._read(channel) for channel in self.channels]
+        with self._lock:
+            index = self._count % self.capacity
+            self._times[index] = time.time()
+            self._values[index] = values
+            self._steps[index] = step
+            self._tagIndexes[index] = tagIndex
+            self._count += 1
+
+    def getSamples(self, window:float=None, tag:str=None, step:int=None) -> dict:
+        """Get the buffered samples, oldest first.
+
+        Args:
+            window (float, optional): Only samples from the last `window` seconds. Defaults to None, all samples.
+            tag (str, optional): Only samples with this tag. Defaults to None, any tag.
+            step (int, optional): Only samples from this test step. Defaults to None, any step.
+
+        Returns:
+            dict: Arrays keyed by "time", each channel name, "step" and "tag".
+        """
+        with self._lock:
+            count = min(self._count, self.capacity)
+            order = (np.arange(count) + self._count - count) % self.capacity
+            times = self._times[order]
+            values = self._values[order]
+            steps = self._steps[order]
+            tagIndexes = self._tagIndexes[order]
+            tags = np.array(self.tags)
+        mask = np.ones(count, dtype=bool)
+        if window != None and count:
+            mask &= times >= times[-1] - window
+        if tag != None:
+            mask &= tagIndexes == (self.tags.index(tag) if tag in self.tags else -1)
+        if step != None:
+            mask &= steps == step
+        samples = {"time": times[mask]}
+        for column, channel in enumerate(self.channels):
+            samples[channel] = values[mask, column]
+        samples["step"] = steps[mask]
+        samples["tag"] = tags[tagIndexes[mask]]
+        return samples
+
+    def getStats(self, window:float=None, tag:str=None, step:int=None) -> dict:
+        """Get statistics over the buffered samples.
+
+        Args:
+            window (float, optional): Only samples from the last `window` seconds. Defaults to None, all samples.
+            tag (str, optional): Only samples with this tag. Defaults to None, any tag.
+            step (int, optional): Only samples from this test step. Defaults to None, any step.
+
+        Returns:
+            dict: samples (int), duration (seconds), and per channel the mean, peak and min,
+                  e.g. "power_mean". When sampling power, "energy_wh" is the energy used
+                  between the first and last samples, in Watt hours.
+        """
+        samples = self.getSamples(window, tag, step)
+        times = samples["time"]
+        stats = {"samples": len(times),
+                 "duration": float(times[-1] - times[0]) if len(times) > 1 else 0.0}
+        for channel in self.channels:
+            values = samples[channel]
+            valid = values[~np.isnan(values)]
+            for stat, function in (("mean", np.mean), ("peak", np.max), ("min", np.min)):
+                stats["{}_{}".format(channel, stat)] = float(function(valid)) if len(valid) else float("nan")
+        if "power" in self.channels:
+            stats["energy_wh"] = self._energy(times, samples["power"], tag != None or step != None)
+        return stats
+
+    def save(self, path:str=None, csv:bool=True, npz:bool=True) -> list:
+        """Write the buffered samples as columns to CSV and/or NPZ files.
+
+        Args:
+            path (str, optional): Directory to write to. Defaults to outputPath, or the log directory.
+            csv (bool, optional): Write <name>_telemetry.csv. Defaults to True.
+            npz (bool, optional): Write <name>_telemetry.npz. Defaults to True.
+
+        Returns:
+            list: Paths of the files written.
+        """
+        if path == None:
+            path = self.outputPath or getattr(self.log, "logPath", None) or "."
+        os.makedirs(path, exist_ok=True)
+        samples = self.getSamples()
+        basename = os.path.join(path, "{}_telemetry".format(self.name))
+        written = []
+        if csv:
+            columns = ["time"] + list(self.channels) + ["step", "tag"]
+            with open(basename + ".csv", "w") as csvFile:
+                csvFile.write(",".join(columns) + "\n")
+                for row in range(len(samples["time"])):
+                    fields = ["{:.6f}".format(samples["time"][row])]
+                    fields += ["{:.6g}".format(samples[channel][row]) for channel in self.channels]
+                    fields += [str(samples["step"][row]), samples["tag"][row]]
+                    csvFile.write(",".join(fields) + "\n")
+            written.append(basename + ".csv")
+        if npz:
+            np.savez(basename + ".npz", **samples)
+            written.append(basename + ".npz")
+        self.log.info("powerTelemetrySampler: [{}] samples written to {}".format(len(samples["time"]), written))
+        return written
+
+    def _energy(self, times, power, filtered:bool) -> float:
+        """Integrate power over time with the trapezoidal rule.
+
+        Filtered samples, e.g. of one tag, aren't contiguous, so gaps where
+        other samples were taken aren't counted.
+        """
+        if len(times) < 2:
+            return 0.0
+        intervals = np.diff(times)
+        energy = (power[1:] + power[:-1]) / 2 * intervals
+        if filtered:
+            energy = energy[intervals <= self.interval * 1.5]
+        return float(np.nansum(energy) / 3600)
+
+    def _read(self, channel:str) -> float:
+        if channel in self._unsupported:
+            return np.nan
+        if self._readers[channel] == None:
+            self.log.warn("powerTelemetrySampler: [{}] can't read {}".format(self.name, channel))
+            self._unsupported.add(channel)
+            return np.nan
+        try:
+            return float(self._readers[channel]())
+        except Exception as e:
+            # Only this sample is lost, the channel is read again on the next one
+            self.log.debug("powerTelemetrySampler: [{}] {} read failed: {}".format(self.name, channel, e))
+        return np.nan
+
+    def _sampleLoop(self):
+        """Sample on a fixed schedule, so slow readings don't make the rate drift.
+        """
+        nextSample = time.monotonic()
+        while not self._stopEvent.is_set():
+            self.sample()
+            nextSample += self.interval
+            remaining = nextSample - time.monotonic()
+            if remaining < 0:
+                # Readings are slower than the rate, skip the missed samples
+                nextSample += -remaining // self.interval * self.interval + self.interval
+                remaining = nextSample - time.monotonic()
+            self._stopEvent.wait(remaining)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Rack wide power control. Runs power operations across the slots
+#*   **          of a rack concurrently, staggering power on between slots that
+#*   **          share a power switch to limit inrush current. Unstaggered
+#*   **          slots on one PDU are switched together where the PDU allows.
+#*   **
+#* ******************************************************************************
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from framework.core.logModule import logModule
+from framework.core.powerControl import powerControlClass
+from framework.core.rackController import rack
+
+# Seconds the power modules leave an outlet off when rebooting it on its own
+DEFAULT_REBOOT_DELAY = 1
+
+class rackPowerController():
+    """
+    Controls the power of multiple slots in a rack at once.
+
+    Each slot is controlled through its own powerControlClass, so retries are
+    handled per slot. Slots on different power switches are switched at the same
+    time. Slots sharing a power switch are started `stagger` seconds apart when
+    powering on or rebooting. When they aren't staggered, slots sharing a power
+    switch are switched as one group, see powerControlClass.powerGroup, so a
+    PDU gets one multi-outlet command rather than one command per outlet.
+    A grouped reboot leaves the outlets off for `rebootDelay` seconds.
+    """
+
+    ACTIONS = ("powerOn", "powerOff", "reboot")
+
+    def __init__(self, rack:rack, log:logModule=None, deviceName:str="dut", stagger:float=None, maxWorkers:int=None, coalesce:bool=True,
+                 rebootDelay:float=None):
+        """Initialise the rack power controller
+
+        Args:
+            rack (rack): The rack to control.
+            log (logModule, optional): Log module. Defaults to None.
+            deviceName (str, optional): Name of the device in each slot whose powerSwitch is used. Defaults to "dut".
+            stagger (float, optional): Seconds between powering on slots that share a power switch.
+                                       Defaults to the rack's `power_stagger` config, or 0.
+            maxWorkers (int, optional): Maximum number of slots switched at once. Defaults to one per slot.
+            coalesce (bool, optional): Switch unstaggered slots sharing a power switch as one group. Defaults to True.
+            rebootDelay (float, optional): Seconds a group of slots is left off when rebooted, at least DEFAULT_REBOOT_DELAY.
+                                           Defaults to the rack's `reboot_delay` config, or DEFAULT_REBOOT_DELAY.
+        """
+        if log == None:
+            log = logModule("rackPowerController")
+        self.log = log
+        self.rack = rack
+        rawConfig = getattr(rack, "rawConfig", None) or {}
+        if stagger == None:
+            stagger = rawConfig.get("power_stagger", 0)
+        self.stagger = stagger
+        self.maxWorkers = maxWorkers
+        self.coalesce = coalesce
+        if rebootDelay == None:
+            rebootDelay = rawConfig.get("reboot_delay", DEFAULT_REBOOT_DELAY)
+        # Never shorter than the off time of an outlet rebooted on its own
+        self.rebootDelay = max(rebootDelay, DEFAULT_REBOOT_DELAY)
+        self.powerControls = dict()
+        self._switchKeys = dict()
+        for slot in rack.slot:
+            device = slot.getDevice(deviceName)
+            if device == None or device.get("powerSwitch") == None:
+                self.log.debug("Slot [{}] has no powerSwitch for [{}]".format(slot.getName(), deviceName))
+                continue
+            powerControl = powerControlClass(log, device.get("powerSwitch"))
+            self.powerControls[slot.getName()] = powerControl
+            self._switchKeys[slot.getName()] = powerControl.switchKey
+
+    def powerOn(self, slots:list=None):
+        """Power on slots concurrently, staggered per power switch.
+
+        Args:
+            slots (list, optional): Slot names or 1-based slot indexes. Defaults to all slots with a powerSwitch.
+
+        Returns:
+            dict: Result per slot name, see `run`.
+        """
+        return self.run("powerOn", slots)
+
+    def powerOff(self, slots:list=None):
+        """Power off slots concurrently.
+
+        Args:
+            slots (list, optional): Slot names or 1-based slot indexes. Defaults to all slots with a powerSwitch.
+
+        Returns:
+            dict: Result per slot name, see `run`.
+        """
+        return self.run("powerOff", slots)
+
+    def reboot(self, slots:list=None):
+        """Reboot slots concurrently, staggered per power switch.
+
+        Args:
+            slots (list, optional): Slot names or 1-based slot indexes. Defaults to all slots with a powerSwitch.
+
+        Returns:
+            dict: Result per slot name, see `run`.
+        """
+        return self.run("reboot", slots)
+
+    def run(self, action:str, slots:list=None):
+        """Run a power action across slots concurrently.
+
+        Powering off isn't staggered, as it doesn't cause an inrush. Slots that aren't
+        staggered and share a power switch are switched as one group.
+
+        Args:
+            action (str): One of "powerOn", "powerOff" or "reboot".
+            slots (list, optional): Slot names or 1-based slot indexes. Defaults to all slots with a powerSwitch.
+
+        Returns:
+            dict: Result per slot name. Each result is a dictionary with the keys:
+                  result (bool), error (str or None), delay, start, end and duration.
+                  Times are in seconds from the start of the run.
+
+        Raises:
+            ValueError: If the action isn't supported or a slot has no powerSwitch.
+        """
+        if action not in self.ACTIONS:
+            raise ValueError("Power action [{}] not supported".format(action))
+        slotNames = self._selectSlots(slots)
+        stagger = self.stagger if action != "powerOff" else 0
+        delays = self._scheduleSlots(slotNames, stagger)
+        self.log.info("{} on slots {}".format(action, slotNames))
+        if len(slotNames) == 0:
+            return dict()
+        runStart = time.monotonic()
+        if self.coalesce and stagger == 0:
+            groups = self._groupSlots(slotNames)
+        else:
+            groups = [[name] for name in slotNames]
+        workers = self.maxWorkers or len(groups)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._runGroup, names, action, runStart, delays[names[0]]) for names in groups]
+            results = dict()
+            for names, future in zip(groups, futures):
+                result = future.result()
+                results.update({name: dict(result) for name in names})
+        results = {name: results[name] for name in slotNames}
+        failed = [name for name, result in results.items() if result["result"] != True]
+        if failed:
+            self.log.error("{} failed on slots {}".format(action, failed))
+        self.log.info("{} completed on [{}] slots in [{:.2f}]s".format(action, len(slotNames), time.monotonic() - runStart))
+        return results
+
+    def _runGroup(self, names:list, action:str, runStart:float, delay:float):
+        """Run a power action on a slot, or group of slots sharing a power switch,
+        once its staggered start time is reached.
+
+        Args:
+            names (list): Slot names.
+            action (str): Power action to run.
+            runStart (float): time.monotonic() value at the start of the run.
+            delay (float): Seconds after runStart to start the action.
+
+        Returns:
+            dict: The result, shared by every slot in the group, see `run`.
+        """
+        remaining = runStart + delay - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        start = time.monotonic()
+        result = False
+        error = None
+        try:
+            if len(names) == 1:
+                result = getattr(self.powerControls[names[0]], action)()
+            else:
+                result = self._powerGroup([self.powerControls[name] for name in names], action)
+        except Exception as e:
+            error = str(e)
+            self.log.error("{} failed on slots {}: {}".format(action, names, error))
+        end = time.monotonic()
+        return {"result": result,
+                "error": error,
+                "delay": delay,
+                "start": start - runStart,
+                "end": end - runStart,
+                "duration": end - start}
+
+    def _powerGroup(self, controls:list, action:str):
+        """Run a power action on a group of slots sharing a power switch.
+
+        Args:
+            controls (list): powerControlClass instances for the slots.
+            action (str): Power action to run.
+
+        Returns:
+            bool: True if the action succeeded on every slot.
+        """
+        if action == "powerOn":
+            return powerControlClass.powerGroup(controls, True)
+        if action == "powerOff":
+            return powerControlClass.powerGroup(controls, False)
+        if powerControlClass.powerGroup(controls, False, refresh=True) != True:
+            return False
+        time.sleep(self.rebootDelay)
+        return powerControlClass.powerGroup(controls, True, refresh=True)
+
+    def _groupSlots(self, slotNames:list):
+        """Group slots whose power switch can switch several outlets together.
+
+        Args:
+            slotNames (list): Slot names.
+
+        Returns:
+            list: Lists of slot names. Slots sharing a power switch with a powerGroup
+                  method are grouped, other slots are on their own.
+        """
+        groups = dict()
+        for name in slotNames:
+            if hasattr(self.powerControls[name].powerSwitch, "powerGroup"):
+                key = self._switchKeys[name]
+            else:
+                key = name
+            groups.setdefault(key, []).append(name)
+        return list(groups.values())
+
+    def _selectSlots(self, slots:list=None):
+        """Resolve a slot selection to slot names.
+
+        Args:
+            slots (list, optional): Slot names or 1-based slot indexes. Defaults to all slots with a powerSwitch.
+
+        Returns:
+            list: Slot names.
+
+        Raises:
+            ValueError: If a selected slot index is out of range, or the slot has no powerSwitch.
+        """
+        if slots == None:
+            return list(self.powerControls.keys())
+        names = []
+        for slot in slots:
+            if isinstance(slot, int):
+                if slot < 1 or slot > len(self.rack.slot):
+                    raise ValueError("Slot index [{}] out of range 1..{}".format(slot, len(self.rack.slot)))
+                slot = self.rack.slot[slot-1].getName()
+            if slot not in self.powerControls:
+                raise ValueError("Slot [{}] has no powerSwitch".format(slot))
+            names.append(slot)
+        return names
+
+    def _scheduleSlots(self, slotNames:list, stagger:float):
+        """Work out the start delay for each slot, staggering slots that share a power switch.
+
+        Args:
+            slotNames (list): Slot names.
+            stagger (float): Seconds between slots on the same power switch.
+
+        Returns:
+            dict: Start delay in seconds per slot name.
+        """
+        delays = dict()
+        switchCount = dict()
+        for name in slotNames:
+            key = self._switchKeys[name]
+            count = switchCount.get(key, 0)
+            delays[name] = count * stagger
+            switchCount[key] = count + 1
+        return delays
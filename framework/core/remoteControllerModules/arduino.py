@@ -29,24 +29,106 @@
 #*   **
 #* ******************************************************************************
 
+import collections
+import threading
 import time
+from concurrent.futures import Future, TimeoutError
+
 import serial
 
+from framework.core.keyScheduler import keyScheduler
 from framework.core.logModule import logModule
 
+# raw: each key is written as is, without a reply
+# framed: keys are sent in numbered frames, each acknowledged once the IR code is sent
+PROTOCOLS = ("raw", "framed")
+
+def frameChecksum(body:str) -> str:
+    """Checksum of a frame body, the XOR of its bytes as two hex digits.
+    """
+    checksum = 0
+    for byte in body.encode():
+        checksum ^= byte
+    return "{:02X}".format(checksum)
+
+def encodeFrame(*fields) -> bytes:
+    """Encode a frame, e.g. encodeFrame("K", 7, "POWER") is b"$K,7,POWER*23\\n".
+
+    Frames are lines of comma separated fields, between "$" and "*" and the checksum:
+
+    - host "K,<seq>,<code>": send the IR code, seq counts 0 to 255 and wraps.
+    - host "P": ping, answered with a ready frame.
+    - board "R,<queue>": ready, sent on start up and for a ping, queue is how many keys it can hold.
+    - board "A,<seq>": the key was sent.
+    - board "N,<seq>,<reason>": the key wasn't sent, e.g. "busy" when the queue is full.
+
+    Returns:
+        bytes: The frame, including the line ending.
+    """
+    body = ",".join(str(field) for field in fields)
+    return "${}*{}\n".format(body, frameChecksum(body)).encode()
+
+def decodeFrame(line:bytes) -> list:
+    """Decode a frame.
+
+    Args:
+        line (bytes): The frame line.
+
+    Returns:
+        list: The fields, with the code or reason left whole, or None if the frame isn't valid.
+    """
+    line = line.decode(errors="replace").strip()
+    if not line.startswith("$") or "*" not in line:
+        return None
+    body, _, checksum = line[1:].rpartition("*")
+    if frameChecksum(body) != checksum.upper():
+        return None
+    return body.split(",", 2)
+
 class remoteArduino():
 
     def __init__( self, log:logModule, remoteConfig:dict() ):
         """intialise the arduino module
 
+        The serial port is kept open. Opening it resets the board, so keys wait
+        until it has started: for the framed protocol, until it reports ready,
+        otherwise until boot_timeout has passed since the port was opened.
+
         Args:
             log (logModule): log class
             remoteConfig (dict): remote configuration
         """
         self.log = log
         self.remoteConfig = remoteConfig
-        self.arduino = serial.Serial(port=self.remoteConfig.get("port"), baudrate=self.remoteConfig.get("baudrate"), timeout=300)
-        self.firstKeyPressInTc = True
+        self.protocol = self.remoteConfig.get("protocol", "raw")
+        if self.protocol not in PROTOCOLS:
+            raise ValueError("Arduino protocol [{}] not supported, use one of {}".format(self.protocol, PROTOCOLS))
+        # Keys sent before the first is acknowledged, keeping the board's queue full
+        self.window = int(self.remoteConfig.get("window", 4))
+        # Keys the board can queue, from its ready frame
+        self.boardQueue = None
+        self.ackTimeout = self.remoteConfig.get("ack_timeout", 2)
+        self.bootTimeout = self.remoteConfig.get("boot_timeout", 5)
+        self.arduino = serial.Serial(port=self.remoteConfig.get("port"), baudrate=self.remoteConfig.get("baudrate"), timeout=0.1)
+        self.openTime = time.monotonic()
+        self._ready = threading.Event()
+        self._pending = dict()
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._reader = None
+        if self.protocol == "framed":
+            self._reader = threading.Thread(target=self._readLoop, name="remoteArduino", daemon=True)
+            self._reader.start()
+
+    def close(self):
+        """Close the serial port
+        """
+        self._closed = True
+        if self._reader != None:
+            self._reader.join()
+            self._reader = None
+        self.arduino.close()
 
     def sendKey(self, key, repeat=1, delay=1):
         """Send IR key using arduino module
@@ -55,12 +137,142 @@ class remoteArduino():
             key (str) - Key to be sent to device#
             repeat (int) - Number of times the key has to be pressed. Defaults to 1
             delay (int) - wait time after pressing the key
-        """
-        if self.firstKeyPressInTc:
-            time.sleep(5)
-            self.firstKeyPressInTc = False
 
+        Returns:
+            bool: True if the key was sent, for the framed protocol once the board acknowledged it
+        """
+        if not self._waitForBoard():
+            return False
         for _ in range(repeat):
-            self.arduino.write(key.encode())
+            if self.protocol == "framed":
+                if not self._waitForAck(*self._submit(key)):
+                    return False
+            else:
+                self.arduino.write(key.encode())
             time.sleep(delay)
         return True
+
+    def sendKeys(self, codes:list, scheduler:keyScheduler=None):
+        """Send a sequence of keys.
+
+        With the framed protocol, up to `window` keys, or as many as the board
+        can queue if that's fewer, are sent before the first is acknowledged, so
+        the board always has the next key queued. No more
+        keys are sent once one fails, though keys already sent may still be.
+
+        Args:
+            codes (list): (code, holdMs, gapMs) per key.
+            scheduler (keyScheduler, optional): Times the presses. Defaults to None, a new scheduler.
+
+        Returns:
+            bool: True if every key was sent, for the framed protocol once the board acknowledged it
+        """
+        if scheduler == None:
+            scheduler = keyScheduler(self.log)
+        if not self._waitForBoard():
+            return False
+        if self.protocol != "framed":
+            return scheduler.run(codes, lambda code: self.arduino.write(code.encode()) > 0)
+        inFlight = collections.deque()
+        window = min(self.window, self.boardQueue) if self.boardQueue else self.window
+
+        def submit(code):
+            # Check the keys already acknowledged, and wait for the oldest while the window is full
+            while inFlight and (inFlight[0][1].done() or len(inFlight) >= window):
+                if not self._waitForAck(*inFlight.popleft()):
+                    return False
+            inFlight.append(self._submit(code))
+            return True
+
+        result = scheduler.run(codes, submit)
+        while inFlight:
+            result = self._waitForAck(*inFlight.popleft()) and result
+        return result
+
+    def _waitForBoard(self) -> bool:
+        """Wait for the board to start after the port was opened.
+        """
+        if self._ready.is_set():
+            return True
+        deadline = self.openTime + self.bootTimeout
+        if self.protocol != "framed":
+            time.sleep(max(0, deadline - time.monotonic()))
+            self._ready.set()
+            return True
+        # A board that was already running doesn't announce itself, so ping it until it answers
+        while not self._ready.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.log.error("remoteArduino: board not ready in [{}]s".format(self.bootTimeout))
+                return False
+            self.arduino.write(encodeFrame("P"))
+            self._ready.wait(min(0.25, remaining))
+        return True
+
+    def _submit(self, code:str) -> tuple:
+        """Send a key frame.
+
+        Returns:
+            tuple: The sequence number, and a Future set to True when the board acknowledges the key.
+        """
+        future = Future()
+        with self._lock:
+            sequence = self._sequence
+            self._sequence = (sequence + 1) % 256
+            self._pending[sequence] = (code, future)
+            try:
+                self.arduino.write(encodeFrame("K", sequence, code))
+            except (serial.SerialException, OSError) as e:
+                self.log.error("remoteArduino: writing [{}] failed: {}".format(code, e))
+                del self._pending[sequence]
+                future.set_result(False)
+        return sequence, future
+
+    def _waitForAck(self, sequence:int, future:Future) -> bool:
+        try:
+            return future.result(self.ackTimeout)
+        except TimeoutError:
+            with self._lock:
+                code, _ = self._pending.pop(sequence, (None, None))
+            self.log.error("remoteArduino: key [{}] not acknowledged in [{}]s".format(code, self.ackTimeout))
+            return False
+
+    def _readLoop(self):
+        """Read the board's frames, resolving the keys they acknowledge.
+        """
+        buffer = b""
+        while not self._closed:
+            try:
+                buffer += self.arduino.read_until(b"\n")
+            except (serial.SerialException, OSError) as e:
+                if not self._closed:
+                    self.log.error("remoteArduino: reading failed: {}".format(e))
+                break
+            if not buffer.endswith(b"\n"):
+                continue
+            line, buffer = buffer, b""
+            fields = decodeFrame(line)
+            if fields == None:
+                self.log.warn("remoteArduino: invalid frame [{}]".format(line.strip()))
+                continue
+            if fields[0] == "R":
+                if len(fields) > 1 and fields[1].isdigit() and int(fields[1]) > 0:
+                    self.boardQueue = int(fields[1])
+                self._ready.set()
+                continue
+            if fields[0] not in ("A", "N") or len(fields) < 2 or not fields[1].isdigit():
+                self.log.warn("remoteArduino: unexpected frame [{}]".format(line.strip()))
+                continue
+            with self._lock:
+                code, future = self._pending.pop(int(fields[1]), (None, None))
+            if future == None:
+                # Acknowledged after it timed out
+                continue
+            if fields[0] == "N":
+                self.log.error("remoteArduino: key [{}] failed: {}".format(code, fields[2] if len(fields) > 2 else ""))
+            future.set_result(fields[0] == "A")
+        # Nothing more will be acknowledged
+        with self._lock:
+            pending, self._pending = self._pending, dict()
+        for _, future in pending.values():
+            future.set_result(False)
@@ -30,6 +30,13 @@
 import time
 from framework.core.logModule import logModule
 from framework.core.commandModules.sshConsole import sshConsole
+from framework.core.keyScheduler import keyScheduler
+
+# Marks the end of each key in the helper's output, after the keySimulator exit status
+HELPER_ACK = "RAFT_KEY_DONE"
+# Runs on the DUT, reading "<key> <delay>" lines from stdin. Each key is acknowledged as soon as it is sent,
+# then the helper waits its delay before reading the next key.
+HELPER_SCRIPT = 'while read -r key delay; do keySimulator -k"$key"; echo "$?:' + HELPER_ACK + '"; sleep "${delay:-0}"; done'
 
 
 class remoteKeySimulator:
@@ -44,6 +51,10 @@ class remoteKeySimulator:
         self.log = log
         self.remoteConfig = remoteConfig
         self.prompt = self.remoteConfig.get("prompt", ':~$ ')
+        # "prompt" runs each key in the interactive shell, "helper" streams keys to a helper on the DUT
+        self.sendMode = self.remoteConfig.get("send_mode", "prompt")
+        self._helperIn = None
+        self._helperOut = None
 
         # Initialize SSH session
         self.session = sshConsole(
@@ -67,6 +78,9 @@ class remoteKeySimulator:
         Returns:
             bool: Result of the command verification.
         """
+        if self.sendMode == "helper":
+            return self.helperSendKeys([(key, delay)] * repeat)
+
         finalResult = True
 
         # Send the key command
@@ -80,3 +94,110 @@ class remoteKeySimulator:
                 finalResult = False
                 break
         return finalResult
+
+    def sendKeys(self, codes: list, scheduler: keyScheduler = None):
+        """Send a sequence of keys.
+
+        In helper mode the whole sequence is written to the helper at once, with the
+        presses planned by the scheduler, and timed on the DUT. Each press is recorded
+        in the scheduler's history when its acknowledgement arrives. keySimulator can't
+        hold keys, so a held key is auto-repeated.
+
+        Args:
+            codes (list): (key, holdMs, gapMs) per key.
+            scheduler (keyScheduler, optional): Plans and times the presses. Defaults to None, a new scheduler.
+
+        Returns:
+            bool: True if every key was sent, False on the first failure.
+        """
+        if scheduler == None:
+            scheduler = keyScheduler(self.log)
+        if self.sendMode == "helper":
+            presses, duration = scheduler.plan(codes)
+            ends = [offset for key, offset in presses[1:]] + [duration]
+            return self.helperSendKeys([(key, end - offset) for (key, offset), end in zip(presses, ends)], scheduler)
+        return scheduler.run(codes, lambda key: self.sendKey(key, 1, 0))
+
+    def helperSendKeys(self, keys: list, scheduler: keyScheduler = None):
+        """Send keys through the helper running on the DUT.
+
+        The keys are written to the helper in one go and run back to back on the DUT,
+        without a round trip or prompt match per key. Each key is confirmed by the
+        helper's acknowledgement line, which carries the keySimulator exit status.
+        Returns once the delay after the last key has passed. Setting the scheduler's
+        cancelEvent stops the helper, dropping the keys still queued on the DUT.
+
+        Args:
+            keys (list): (key, delay) per key press, with the delay after it in seconds.
+            scheduler (keyScheduler, optional): Records each press when its acknowledgement arrives. Defaults to None.
+
+        Returns:
+            bool: True if every key was sent, False on the first failure or when cancelled.
+        """
+        lines = "".join("{} {:g}\n".format(key, delay) for key, delay in keys)
+        start = time.monotonic()
+        for attempt in range(2):
+            try:
+                if self._helperIn == None:
+                    self.startHelper()
+                self._helperIn.write(lines.encode())
+                self._helperIn.flush()
+                break
+            except (OSError, EOFError) as e:
+                # Helper or connection gone, start it again once
+                self.stopHelper()
+                if attempt > 0:
+                    self.log.error(f"Failed to send keys to the keySimulator helper - {e}")
+                    return False
+        offset = 0
+        for key, delay in keys:
+            planned = start + offset
+            if scheduler != None and scheduler.cancelEvent.wait(max(0, planned - time.monotonic())):
+                # Drop the keys still queued on the DUT
+                self.log.info("Key sequence cancelled")
+                self.stopHelper()
+                return False
+            try:
+                # The helper waits the previous key's delay before sending this one
+                self._helperOut.channel.settimeout(planned - time.monotonic() + 10)
+                line = self._helperOut.readline()
+            except OSError:
+                line = ""
+            acknowledged = time.monotonic()
+            status = line.split(":")[0].strip()
+            if scheduler != None:
+                scheduler.record(key, planned, acknowledged, acknowledged, line.strip().endswith(HELPER_ACK) and status == "0")
+            if not line.strip().endswith(HELPER_ACK):
+                self.log.error(f"Failed to send key: {key}, keySimulator helper stopped responding")
+                self.stopHelper()
+                return False
+            if status != "0":
+                self.log.error(f"Failed to send key: {key}, keySimulator exit status [{status}]")
+                # The helper is restarted, rather than waiting for the keys still queued
+                self.stopHelper()
+                return False
+            offset += delay
+        # Wait out the delay after the last key, as the helper does
+        remaining = max(0, start + offset - time.monotonic())
+        if scheduler != None:
+            return not scheduler.cancelEvent.wait(remaining)
+        time.sleep(remaining)
+        return True
+
+    def startHelper(self):
+        """Start the key helper on the DUT, on its own exec channel.
+        """
+        self._helperIn, self._helperOut = self.session.exec_command(HELPER_SCRIPT)
+
+    def stopHelper(self):
+        """Stop the key helper. Closing its input ends the helper loop.
+        """
+        if self._helperIn == None:
+            return
+        try:
+            self._helperIn.close()
+            self._helperOut.channel.close()
+        except OSError:
+            pass
+        self._helperIn = None
+        self._helperOut = None
@@ -33,6 +33,8 @@ import time
 from framework.core.rcCodes import rcCode as rc
 from framework.core.logModule import logModule
 from framework.core.commandModules.telnetClass import telnet
+from framework.core.keyScheduler import keyScheduler
+from framework.core.powerModules.pduSessionPool import getPduSession
 import framework.core
 
 class remoteOlimex():
@@ -40,11 +42,19 @@ class remoteOlimex():
     def __init__( self, log:logModule, remoteController:dict ):
         self.log = log
         self.remoteController = remoteController
+        self.boardSession = None
+        # A persistent session is shared with the other users of the board when session_keepalive is set
+        keepalive = remoteController.get("session_keepalive", 0)
+        if keepalive:
+            self.boardSession = getPduSession(self.log, remoteController["ip"], remoteController["port"], keepalive=keepalive)
 
     def command(self, cmd:str):
+        if self.boardSession:
+            return "(OK)" in self.boardSession.command(cmd, "(OK)", 20)
         self.telnet=telnet(self.log, self.log.logPath ,'{}:{}'.format( self.remoteController["ip"], self.remoteController["port"] ), None, None)
         if False==self.telnet.connect():
             return False
+        self.telnet.is_open = True
         self.telnet.read_very_eager()
         if False==self.telnet.write(cmd):
             return False
@@ -65,3 +75,58 @@ class remoteOlimex():
             
         return True
 
+    def sendKeys(self, codes:list, scheduler:keyScheduler=None):
+        """Send a sequence of keys over one connection to the board.
+
+        The board has no hold, so a held key is auto-repeated by the scheduler.
+
+        Args:
+            codes (list): (code, holdMs, gapMs) per key.
+            scheduler (keyScheduler, optional): Times the presses. Defaults to None, a new scheduler.
+
+        Returns:
+            bool: True if every key was acknowledged, False on the first failure.
+        """
+        if self.boardSession:
+            return self.boardSession.run(self.sessionSendKeys, codes, scheduler)
+        self.telnet=telnet(self.log, self.log.logPath ,'{}:{}'.format( self.remoteController["ip"], self.remoteController["port"] ), None, None)
+        if False==self.telnet.connect():
+            return False
+        self.telnet.is_open = True
+        try:
+            return self.sessionSendKeys(self.telnet, codes, scheduler)
+        finally:
+            self.telnet.disconnect()
+
+    def sessionSendKeys(self, session:telnet, codes:list, scheduler:keyScheduler=None):
+        """Send a sequence of keys over an open session, waiting for each to be acknowledged.
+
+        Args:
+            session (telnet): The open session to the board.
+            codes (list): (code, holdMs, gapMs) per key.
+            scheduler (keyScheduler, optional): Times the presses. Defaults to None, a new scheduler.
+
+        Returns:
+            bool: True if every key was acknowledged, False on the first failure.
+        """
+        if scheduler == None:
+            scheduler = keyScheduler(self.log)
+        session.read_very_eager()
+        return scheduler.run(codes, lambda code: self.sessionSendKey(session, code))
+
+    def sessionSendKey(self, session:telnet, code:str):
+        """Send one key over an open session and wait for it to be acknowledged.
+
+        Args:
+            session (telnet): The open session to the board.
+            code (str): The key code.
+
+        Returns:
+            bool: True if the key was acknowledged.
+        """
+        if False==session.write('{}\n'.format( code )):
+            return False
+        if not "(OK)" in session.read_until("(OK)", 20):
+            self.log.error("sendKeys(), Command [{}] failed.".format( code ) )
+            return False
+        return True
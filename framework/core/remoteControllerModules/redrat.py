@@ -30,6 +30,7 @@
 #* ******************************************************************************
 
 import socket
+import threading
 import time
 
 from framework.core.logModule import logModule
@@ -37,9 +38,18 @@ from .remoteInterface import RemoteInterface
 
 class HubClient():
 
-    def __init__(self):
+    def __init__(self, timeout: float = 5):
+        """
+        Args:
+            timeout (float, optional): Seconds to wait for a reply from the hub. Defaults to 5.
+        """
         self._socket = socket.socket()
         self._is_open = False
+        self._timeout = timeout
+        # Bytes received after the end of the last reply
+        self._buffer = b''
+        # Held from sending a message until its reply is read, so users sharing the client don't interleave
+        self._lock = threading.Lock()
 
     def __del__(self):
         self.stop()
@@ -59,7 +69,7 @@ class HubClient():
                              This will also occur if the hub address/port is not actually a
                              RedRat Hub socker server.
         """
-        self._socket.settimeout(0.5)
+        self._socket.settimeout(self._timeout)
         self._socket.connect((hub_ip, hub_port))
         if netbox_id is not None:
             response = self.send_message('hubquery="list redrats"')
@@ -77,20 +87,55 @@ class HubClient():
     def send_message(self, message: str) -> str:
         """Send a message to the RedRatHub via the socket
 
+        Safe to call from several threads, each message is sent and its reply read
+        before the next message is sent.
+
         Args:
             message (str): The message to send.
 
         Returns:
             str: The response from the socket.
         """
-        self._socket.send(f'{message}\n'.encode())
-        response = ''
+        with self._lock:
+            self._socket.sendall(f'{message}\n'.encode())
+            return self.read_reply()
+
+    def read_reply(self) -> str:
+        """Read one reply from the RedRatHub.
+
+        A reply is a single line, e.g. "OK" or an error message, so it is returned
+        as soon as its line ends. Multi line replies are wrapped in lines holding
+        just "{" and "}". Bytes received after the reply are kept for the next one.
+
+        Returns:
+            str: The reply, or whatever was received before the timeout.
+
+        Raises:
+            ConnectionError: If the hub closes the connection.
+        """
+        reply = ''
         while True:
-            try:
-                response += self._socket.recv(64).decode()
-            except TimeoutError: 
+            line = self._read_line()
+            if line is None:
+                # Timed out, return the partial reply
+                break
+            reply += line
+            if line.strip() != '{' and (not reply.startswith('{') or line.strip() == '}'):
                 break
-        return response
+        return reply
+
+    def _read_line(self) -> None|str:
+        while b'\n' not in self._buffer:
+            try:
+                data = self._socket.recv(4096)
+            except TimeoutError:
+                data, self._buffer = self._buffer, b''
+                return data.decode() or None
+            if not data:
+                raise ConnectionError('RedRat Hub closed the connection')
+            self._buffer += data
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line.decode() + '\n'
 
 class remoteRedRat(RemoteInterface):
 
@@ -98,7 +143,7 @@ class remoteRedRat(RemoteInterface):
         super().__init__(log, config)
         self._hub_ip = config.get('hub_ip')
         self._hub_port = config.get('hub_port',5248)
-        self._client = HubClient()
+        self._client = HubClient(config.get('hub_timeout', 5))
         if id:=config.get('netbox_ip',None):
             self._netbox_id = id
             self._netbox_id_type = 'ip'
@@ -113,13 +158,52 @@ class remoteRedRat(RemoteInterface):
         self._client.start(self._hub_ip, hub_port=self._hub_port, netbox_id=self._netbox_id)
         self._output = config.get('output', 1)
 
+    @property
+    def hub(self) -> tuple:
+        """(ip, port) of the RedRat Hub."""
+        return (self._hub_ip, self._hub_port)
+
+    @property
+    def netbox(self) -> tuple:
+        """(id type, id) of the IR Netbox, e.g. ("ip", "192.168.0.2")."""
+        return (self._netbox_id_type, self._netbox_id)
+
+    @property
+    def output(self) -> str:
+        """IR output of the Netbox the device is on."""
+        return str(self._output)
+
+    @property
+    def client(self) -> HubClient:
+        """Connection to the RedRat Hub."""
+        return self._client
+
     def sendKey(self, code, repeat, delay):
-        msg = f'{self._netbox_id_type}="{self._netbox_id}" {code} output="{self._output}"'
         for _ in range(repeat):
-            if 'OK' not in self._client.send_message(msg):
-                self.log.error("sendKey(), Command [{}] failed.".format( code ) )
+            if not self.sendKeyToOutputs(code, [self._output]):
                 return False
             time.sleep( delay )
         return True
 
+    def sendKeyToOutputs(self, code, outputs: list, client: HubClient = None) -> bool:
+        """Send a key once to several outputs of the Netbox, in one hub command.
+
+        Args:
+            code (str): Mapped key code, e.g. 'dataset="SKY+" signal="POWER"'.
+            outputs (list): Netbox outputs to send to.
+            client (HubClient, optional): Hub connection to use, e.g. one shared by devices on the same hub.
+                                          Defaults to the device's own connection.
+
+        Returns:
+            bool: True if the hub accepted the command.
+        """
+        if client is None:
+            client = self._client
+        msg = f'{self._netbox_id_type}="{self._netbox_id}" {code} output="{",".join(str(output) for output in outputs)}"'
+        response = client.send_message(msg)
+        if 'OK' not in response:
+            self.log.error("sendKey(), Command [{}] failed: [{}]".format( code, response.strip() ) )
+            return False
+        return True
+
 
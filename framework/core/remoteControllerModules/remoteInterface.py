@@ -29,6 +29,7 @@
 #*
 #* ******************************************************************************
 from abc import abstractmethod
+from framework.core.keyScheduler import keyScheduler
 from framework.core.logModule import logModule
 
 class RemoteInterface():
@@ -55,4 +56,21 @@ class RemoteInterface():
         Returns:
             bool: true on success otherwise failure
         """
-        pass
\ No newline at end of file
+        pass
+
+    def sendKeys(self, codes:list, scheduler:keyScheduler=None):
+        """Send a sequence of keys
+
+        Remotes that can send a sequence in one operation override this. By default
+        each press is sent with sendKey, on the scheduler's timing.
+
+        Args:
+            codes (list): (keycode, holdMs, gapMs) per key
+            scheduler (keyScheduler, optional): Times the presses. Defaults to None, a new scheduler
+
+        Returns:
+            bool: true on success otherwise failure
+        """
+        if scheduler == None:
+            scheduler = keyScheduler(self.log)
+        return scheduler.run(codes, lambda code: self.sendKey(code, 1, 0))
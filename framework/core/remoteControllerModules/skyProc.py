@@ -31,6 +31,8 @@
 
 import time
 from framework.core.commandModules.telnetClass import telnet
+from framework.core.keyScheduler import keyScheduler
+from framework.core.powerModules.pduSessionPool import getPduSession
 
 class remoteSkyProc():
     
@@ -38,15 +40,23 @@ class remoteSkyProc():
         self.log = log
         self.ip = remoteController["ip"]
         self.port = remoteController["port"]
+        self.boardSession = None
+        # A persistent session is shared with the other users of the board when session_keepalive is set
+        keepalive = remoteController.get("session_keepalive", 0)
+        if keepalive:
+            self.boardSession = getPduSession(self.log, self.ip, self.port, keepalive=keepalive)
 
     def command(self, cmd):
-        self.telnet=telnet(self.log, '{}:{}'.format( self.ip, self.port ), None, None)
+        if self.boardSession:
+            return "(OK)" in self.boardSession.command(cmd, "(OK)")
+        self.telnet=telnet(self.log, "", self.ip, None, None, self.port)
         if False==self.telnet.connect():
             return False
+        self.telnet.is_open = True
         self.telnet.read_very_eager()
         if False==self.telnet.write(cmd):
             return False
-        if not b"(OK)" in self.telnet.read_until("(OK)"):
+        if not "(OK)" in self.telnet.read_until("(OK)"):
             return False
         self.telnet.disconnect()
         return True
@@ -56,5 +66,64 @@ class remoteSkyProc():
         # Run the key sendKey via the terminal
         command="echo " + str(code) + " > /proc/cdi_ir"
         for _ in range(repeat):
-            self.session.runTargetCommand(command, delay)
-        return True
\ No newline at end of file
+            if True != self.command(command):
+                self.log.error("sendKey(), Command [{}] failed.".format( code ) )
+                return False
+            time.sleep( delay )
+        return True
+
+    def sendKeys(self, codes:list, scheduler:keyScheduler=None):
+        """Send a sequence of keys over one connection.
+
+        Keys can't be held, so a held key is auto-repeated by the scheduler.
+
+        Args:
+            codes (list): (code, holdMs, gapMs) per key.
+            scheduler (keyScheduler, optional): Times the presses. Defaults to None, a new scheduler.
+
+        Returns:
+            bool: True if every key was acknowledged, False on the first failure.
+        """
+        if self.boardSession:
+            return self.boardSession.run(self.sessionSendKeys, codes, scheduler)
+        self.telnet=telnet(self.log, "", self.ip, None, None, self.port)
+        if False==self.telnet.connect():
+            return False
+        self.telnet.is_open = True
+        try:
+            return self.sessionSendKeys(self.telnet, codes, scheduler)
+        finally:
+            self.telnet.disconnect()
+
+    def sessionSendKeys(self, session, codes:list, scheduler:keyScheduler=None):
+        """Send a sequence of keys over an open session, waiting for each to be acknowledged.
+
+        Args:
+            session (telnet): The open session.
+            codes (list): (code, holdMs, gapMs) per key.
+            scheduler (keyScheduler, optional): Times the presses. Defaults to None, a new scheduler.
+
+        Returns:
+            bool: True if every key was acknowledged, False on the first failure.
+        """
+        if scheduler == None:
+            scheduler = keyScheduler(self.log)
+        session.read_very_eager()
+        return scheduler.run(codes, lambda code: self.sessionSendKey(session, code))
+
+    def sessionSendKey(self, session, code):
+        """Send one key over an open session and wait for it to be acknowledged.
+
+        Args:
+            session (telnet): The open session.
+            code (str): The key code.
+
+        Returns:
+            bool: True if the key was acknowledged.
+        """
+        if False==session.write("echo " + str(code) + " > /proc/cdi_ir"):
+            return False
+        if not "(OK)" in session.read_until("(OK)"):
+            self.log.error("sendKeys(), Command [{}] failed.".format( code ) )
+            return False
+        return True
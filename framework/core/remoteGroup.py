@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Remote group. Sends the same keys to many devices at once,
+#*   **          reporting the result and timing per device.
+#*   **
+#* ******************************************************************************
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.keyScheduler import keyScheduler
+from framework.core.logModule import logModule
+from framework.core.remoteControllerModules import remoteRedRat
+
+class remoteGroup():
+    """
+    Sends the same key, or key sequence, to every device in the group concurrently.
+
+    Devices are sent to in parallel, each on its own schedule, so a group of
+    eight takes about as long as one device. RedRat devices on the same hub
+    share one hub connection, and devices on the same IR Netbox that map a key
+    to the same code get a single hub command naming all their outputs.
+
+    Each send returns, per device, the result and the monotonic start and end
+    times; the last results are kept in `results`.
+    """
+
+    def __init__(self, log:logModule, members:dict):
+        """Initialise the group.
+
+        Args:
+            log (logModule): Log module.
+            members (dict): Remote of each device by name, as commonRemoteClass, or devices with a remoteController.
+        """
+        self.log = log
+        self.members = dict()
+        for name, member in members.items():
+            remote = member if isinstance(member, commonRemoteClass) else getattr(member, "remoteController", None)
+            if not isinstance(remote, commonRemoteClass):
+                raise ValueError("remoteGroup: device [{}] has no remote controller".format(name))
+            self.members[name] = remote
+        self.results = dict()
+
+    def sendKey(self, keycode, delay:int=1, repeat:int=1) -> dict:
+        """Send a key to every device, see commonRemoteClass.sendKey.
+
+        Args:
+            keycode (rcCode): Key to send.
+            delay (int, optional): Delay in seconds after each press. Defaults to 1.
+            repeat (int, optional): How many key presses. Defaults to 1.
+
+        Returns:
+            dict: Per device, "result" True if every press was sent, and "start", "end" and "duration" in seconds.
+        """
+        self.log.info("remoteGroup.sendKey[{}] delay:[{}] repeat:[{}] devices:{}".format(keycode.name, delay, repeat, list(self.members)))
+        return self.sendKeys([(keycode, 0, delay * 1000)] * repeat)
+
+    def sendKeys(self, sequence:list) -> dict:
+        """Send a key sequence to every device, see commonRemoteClass.sendKeys.
+
+        Args:
+            sequence (list): Keys to send, as (keycode, holdMs, gapMs) tuples, or keycodes.
+
+        Returns:
+            dict: Per device, "result" True if every key was sent, and "start", "end" and "duration" in seconds.
+        """
+        sequence = [item if isinstance(item, tuple) else (item, 0, 0) for item in sequence]
+        hubs = dict()
+        others = []
+        for name, remote in self.members.items():
+            if isinstance(remote.remoteController, remoteRedRat):
+                hubs.setdefault(remote.remoteController.hub, []).append(name)
+            else:
+                others.append(name)
+        results = dict()
+        with ThreadPoolExecutor(max_workers=len(hubs) + len(others) or 1, thread_name_prefix="remoteGroup") as executor:
+            futures = [executor.submit(self._sendHub, names, sequence, results) for names in hubs.values()]
+            futures += [executor.submit(self._sendMember, name, sequence, results) for name in others]
+        for future in futures:
+            future.result()
+        self.results = {name: results[name] for name in self.members}
+        self.logResults()
+        return self.results
+
+    def logResults(self):
+        """Write the result and time taken per device of the last send to the log.
+        """
+        for name, result in self.results.items():
+            message = "remoteGroup: [{}] {} in [{:.3f}]s".format(name, "sent" if result["result"] else "FAILED", result["duration"])
+            if result["result"]:
+                self.log.info(message)
+            else:
+                self.log.error(message)
+
+    def _sendMember(self, name:str, sequence:list, results:dict):
+        start = time.monotonic()
+        try:
+            result = self.members[name].sendKeys(sequence)
+        except Exception as e:
+            self.log.error("remoteGroup: [{}] failed: {}".format(name, e))
+            result = False
+        end = time.monotonic()
+        results[name] = {"result": result == True, "start": start, "end": end, "duration": end - start}
+
+    def _sendHub(self, names:list, sequence:list, results:dict):
+        """Send to the RedRat devices on one hub, over one connection.
+
+        The devices are sent each press together. Devices on one Netbox sharing a
+        code get one command, with their outputs combined. A device is dropped
+        from the rest of the sequence when a command for it fails.
+        """
+        remotes = {name: self.members[name] for name in names}
+        client = remotes[names[0]].remoteController.client
+        active = set(names)
+        start = time.monotonic()
+        ends = dict()
+
+        def sendPress(keycode):
+            commands = dict()
+            for name in names:
+                if name not in active:
+                    continue
+                code = remotes[name].remoteMap.getMappedKey(keycode.name)
+                if code == None:
+                    self.log.error("remoteGroup: [{}] key [{}] not mapped".format(name, keycode.name))
+                    active.discard(name)
+                    ends[name] = time.monotonic()
+                    continue
+                redrat = remotes[name].remoteController
+                commands.setdefault((redrat.netbox, code), []).append(name)
+            for (netbox, code), commandNames in commands.items():
+                redrat = remotes[commandNames[0]].remoteController
+                try:
+                    sent = redrat.sendKeyToOutputs(code, [remotes[name].remoteController.output for name in commandNames], client)
+                except (OSError, ConnectionError) as e:
+                    self.log.error("remoteGroup: hub {} failed: {}".format(redrat.hub, e))
+                    sent = False
+                if not sent:
+                    active.difference_update(commandNames)
+                    for name in commandNames:
+                        ends[name] = time.monotonic()
+            return len(active) > 0
+
+        # The schedule is planned once for the whole hub, from the first device's repeat interval
+        scheduler = keyScheduler(self.log, remotes[names[0]].scheduler.repeatInterval)
+        scheduler.run(sequence, sendPress)
+        end = time.monotonic()
+        for name in names:
+            finished = ends.get(name, end)
+            results[name] = {"result": name in active, "start": start, "end": finished, "duration": finished - start}
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Local simulators of lab hardware, used to test and benchmark
+#*   **          the framework modules without the hardware present. Run one
+#*   **          from the command line with python -m framework.core.simulators
+#*   **
+#* ******************************************************************************
+
+from .kasaSimulator import kasaSimulator
+from .pduSimulator import pduSimulator
+from .faults import faultInjector
+from .redratSimulator import redratHubSimulator
+from .sshSimulator import keySimulatorHost
+from .skyProcSimulator import skyProcSimulator
+from .arduinoSimulator import arduinoSimulator
+from .keyRecorder import keyRecorder
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Runs a simulator from the command line, for testing rack
+#*   **          configs and benchmarking offline, e.g.
+#*   **          python -m framework.core.simulators aos --port 2323 --latency 0.2 --fault-rate 0.1
+#*   **
+#* ******************************************************************************
+
+import argparse
+import sys
+import time
+
+from framework.core.simulators.arduinoSimulator import arduinoSimulator
+from framework.core.simulators.faults import FAULTS
+from framework.core.simulators.kasaSimulator import kasaSimulator
+from framework.core.simulators.pduSimulator import PROTOCOLS, pduSimulator
+from framework.core.simulators.redratSimulator import redratHubSimulator
+from framework.core.simulators.skyProcSimulator import skyProcSimulator
+from framework.core.simulators.sshSimulator import keySimulatorHost
+
+def createSimulator(args):
+    """Create the simulator chosen on the command line.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        pduSimulator|kasaSimulator|redratHubSimulator|skyProcSimulator|keySimulatorHost|arduinoSimulator:
+            The simulator, not yet started.
+    """
+    faults = {"faultRate": args.fault_rate, "fault": args.fault, "seed": args.seed}
+    if args.protocol == "hs100":
+        return kasaSimulator(args.host, args.port, latency=args.latency, power=args.power, **faults)
+    if args.protocol == "redrat":
+        return redratHubSimulator(args.host, args.port, latency=args.latency, **faults)
+    if args.protocol == "sky_proc":
+        return skyProcSimulator(args.host, args.port, latency=args.latency, **faults)
+    if args.protocol == "keysimulator":
+        return keySimulatorHost(args.host, args.port, args.username, args.password)
+    if args.protocol == "arduino":
+        return arduinoSimulator("framed", **faults)
+    return pduSimulator(args.protocol, args.host, args.port, args.outlets, args.username, args.password,
+                        latency=args.latency, **faults)
+
+def main(argv:list=None):
+    parser = argparse.ArgumentParser(prog="python -m framework.core.simulators",
+                                     description="Run a local PDU, smart plug or remote control simulator until interrupted")
+    parser.add_argument("protocol", choices=PROTOCOLS + ("hs100", "redrat", "sky_proc", "keysimulator", "arduino"),
+                        help="protocol to speak, olimex also accepts IR key codes")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=0, help="port to listen on (default: a free port)")
+    parser.add_argument("--outlets", type=int, default=8, help="number of PDU outlets (default: %(default)s)")
+    parser.add_argument("--username", default="apc", help="PDU or keysimulator login username (default: %(default)s)")
+    parser.add_argument("--password", default="apc", help="PDU or keysimulator login password (default: %(default)s)")
+    parser.add_argument("--power", type=float, default=None, help="hs100 power draw in Watts while on, adds an energy meter")
+    parser.add_argument("--latency", type=float, default=0, help="seconds to answer each command (default: %(default)s)")
+    parser.add_argument("--fault-rate", type=float, default=0, help="probability of failing each command (default: %(default)s)")
+    parser.add_argument("--fault", choices=FAULTS, default="drop", help="how failed commands fail (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for the failures")
+    args = parser.parse_args(argv)
+
+    simulator = createSimulator(args)
+    simulator.start()
+    if args.protocol == "arduino":
+        print("arduino simulator serial port {}".format(simulator.port), flush=True)
+    else:
+        print("{} simulator listening on {}:{}".format(args.protocol, simulator.host, simulator.port), flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+        keys = getattr(simulator, "keys", None)
+        if keys != None:
+            print("{} keys received".format(len(keys.getCodes())))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
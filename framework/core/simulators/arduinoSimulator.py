@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fake Arduino IR transmitter on a pseudo terminal, recording the
+#*   **          key codes written to its serial port.
+#*   **
+#* ******************************************************************************
+
+import collections
+import os
+import select
+import threading
+import time
+import tty
+
+from framework.core.remoteControllerModules.arduino import PROTOCOLS, decodeFrame, encodeFrame
+from framework.core.simulators.faults import faultInjector
+from framework.core.simulators.keyRecorder import keyRecorder
+
+class arduinoSimulator():
+    """
+    A local fake Arduino IR transmitter, on a pseudo terminal.
+
+    remoteArduino opens `port`, the pseudo terminal's device, as its serial
+    port. With the "raw" protocol keys are written without a separator, so
+    each read of the terminal, normally one write by remoteArduino, is
+    recorded as one code in `keys`.
+
+    With the "framed" protocol, see remoteControllerModules.arduino, the board
+    announces it is ready `bootTime` after starting and queues up to
+    `queueSize` keys. Each key takes `irTime` to transmit, is then recorded and
+    acknowledged. Keys that arrive while the queue is full are refused as
+    "busy". Keys can be failed by the fault injector in `faults`: "error"
+    refuses them, "drop" and "timeout" lose them without a reply.
+    """
+
+    def __init__(self, protocol:str="raw", irTime:float=0, queueSize:int=8, bootTime:float=0,
+                 faultRate:float=0, fault:str="drop", seed:int=None):
+        """Initialise the simulator.
+
+        Args:
+            protocol (str, optional): "raw" or "framed". Defaults to "raw".
+            irTime (float, optional): Seconds to transmit each framed key. Defaults to 0.
+            queueSize (int, optional): Framed keys the board can queue. Defaults to 8.
+            bootTime (float, optional): Seconds from starting until the board is ready. Defaults to 0.
+            faultRate (float, optional): Probability of failing each framed key. Defaults to 0.
+            fault (str, optional): How random failures fail, "drop", "error" or "timeout". Defaults to "drop".
+            seed (int, optional): Random seed for the failures. Defaults to None.
+
+        Raises:
+            ValueError: If the protocol or fault isn't supported.
+        """
+        if protocol not in PROTOCOLS:
+            raise ValueError("Protocol [{}] not supported".format(protocol))
+        self.protocol = protocol
+        self.irTime = irTime
+        self.queueSize = queueSize
+        self.bootTime = bootTime
+        self.faults = faultInjector(faultRate, fault, seed)
+        self.port = None
+        self.keys = keyRecorder()
+        self._master = None
+        self._slave = None
+        self._queue = collections.deque()
+        self._queueCondition = threading.Condition()
+        self._writeLock = threading.Lock()
+        self._stopEvent = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Create the pseudo terminal and start reading from it.
+        """
+        self._master, self._slave = os.openpty()
+        # No echo or line editing, the bytes are passed through as written
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._stopEvent.clear()
+        self._bootedAt = time.monotonic() + self.bootTime
+        self._threads = [threading.Thread(target=self._readLoop, daemon=True)]
+        if self.protocol == "framed":
+            self._threads.append(threading.Thread(target=self._transmitLoop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop reading and close the pseudo terminal.
+        """
+        if not self._threads:
+            return
+        self._stopEvent.set()
+        with self._queueCondition:
+            self._queueCondition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        os.close(self._master)
+        os.close(self._slave)
+
+    def _readLoop(self):
+        buffer = b""
+        if self.protocol == "framed":
+            if self._stopEvent.wait(self.bootTime):
+                return
+            self._write("R", self.queueSize)
+        while not self._stopEvent.is_set():
+            ready, _, _ = select.select([self._master], [], [], 0.1)
+            if not ready:
+                continue
+            try:
+                data = os.read(self._master, 4096)
+            except OSError:
+                return
+            if self.protocol != "framed":
+                if data:
+                    self.keys.record(data.decode(errors="replace"))
+                continue
+            buffer += data
+            while b"\n" in buffer:
+                line, _, buffer = buffer.partition(b"\n")
+                self._handleFrame(line)
+
+    def _handleFrame(self, line:bytes):
+        fields = decodeFrame(line)
+        if fields == None:
+            # A corrupted frame is lost, as its sequence number can't be trusted
+            return
+        if fields[0] == "P":
+            self._write("R", self.queueSize)
+            return
+        if fields[0] != "K" or len(fields) != 3:
+            return
+        sequence, code = fields[1], fields[2]
+        fault = self.faults.nextFault()
+        if fault in ("drop", "timeout"):
+            return
+        if fault == "error":
+            self._write("N", sequence, "error")
+            return
+        with self._queueCondition:
+            if len(self._queue) >= self.queueSize:
+                self._write("N", sequence, "busy")
+                return
+            self._queue.append((sequence, code))
+            self._queueCondition.notify_all()
+
+    def _transmitLoop(self):
+        while True:
+            with self._queueCondition:
+                while not self._queue and not self._stopEvent.is_set():
+                    self._queueCondition.wait()
+                if self._stopEvent.is_set():
+                    return
+                sequence, code = self._queue[0]
+            if self.irTime:
+                time.sleep(self.irTime)
+            self.keys.record(code)
+            with self._queueCondition:
+                self._queue.popleft()
+            self._write("A", sequence)
+
+    def _write(self, *fields):
+        with self._writeLock:
+            try:
+                os.write(self._master, encodeFrame(*fields))
+            except OSError:
+                pass
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fault injection shared by the simulators.
+#*   **
+#* ******************************************************************************
+
+import random
+import threading
+
+# drop: the connection is closed instead of answering
+# error: the request is answered with the protocol's error response
+# timeout: the request is never answered, the connection stays open
+FAULTS = ("drop", "error", "timeout")
+
+class faultInjector():
+    """
+    Decides which requests a simulator fails, and how.
+
+    Faults queued with failNext are used first, in order. Otherwise each
+    request fails with probability `rate`, using `fault`.
+    """
+
+    def __init__(self, rate:float=0, fault:str="drop", seed:int=None):
+        """Initialise the fault injector.
+
+        Args:
+            rate (float, optional): Probability of failing each request. Defaults to 0, never.
+            fault (str, optional): Fault used by random failures, one of FAULTS. Defaults to "drop".
+            seed (int, optional): Random seed, for repeatable runs. Defaults to None.
+
+        Raises:
+            ValueError: If the fault isn't supported.
+        """
+        self._checkFault(fault)
+        self.rate = rate
+        self.fault = fault
+        self.injected = {fault: 0 for fault in FAULTS}
+        self._queue = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def failNext(self, fault:str="drop", count:int=1):
+        """Fail the next requests.
+
+        Args:
+            fault (str, optional): One of FAULTS. Defaults to "drop".
+            count (int, optional): Number of requests to fail. Defaults to 1.
+
+        Raises:
+            ValueError: If the fault isn't supported.
+        """
+        self._checkFault(fault)
+        with self._lock:
+            self._queue.extend([fault] * count)
+
+    def nextFault(self):
+        """Get the fault for the next request.
+
+        Returns:
+            str: One of FAULTS, or None if the request should be handled normally.
+        """
+        with self._lock:
+            if self._queue:
+                fault = self._queue.pop(0)
+            elif self.rate and self._random.random() < self.rate:
+                fault = self.fault
+            else:
+                return None
+            self.injected[fault] += 1
+            return fault
+
+    def _checkFault(self, fault:str):
+        if fault not in FAULTS:
+            raise ValueError("Fault [{}] not supported, use one of {}".format(fault, FAULTS))
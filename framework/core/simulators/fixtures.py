@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : pytest fixtures starting simulators for a test, and stopping
+#*   **          them after it. Import into a conftest.py to use them, e.g.
+#*   **          from framework.core.simulators.fixtures import *
+#*   **
+#* ******************************************************************************
+
+import pytest
+
+from framework.core.powerModules.pduSessionPool import closePduSessions
+from framework.core.simulators.kasaSimulator import kasaSimulator
+from framework.core.simulators.pduSimulator import pduSimulator
+
+__all__ = ["simulatorFactory", "apcSimulator", "aosSimulator", "slpSimulator", "olimexSimulator", "hs100Simulator"]
+
+@pytest.fixture
+def simulatorFactory():
+    """Create started simulators, stopped when the test ends.
+
+    Call it with a protocol, "hs100" or one of the pduSimulator protocols, and
+    the simulator's keyword arguments, e.g. simulatorFactory("aos", latency=0.1).
+    """
+    simulators = []
+
+    def factory(protocol:str, **kwargs):
+        if protocol == "hs100":
+            simulator = kasaSimulator(**kwargs)
+        else:
+            simulator = pduSimulator(protocol, **kwargs)
+        simulator.start()
+        simulators.append(simulator)
+        return simulator
+
+    yield factory
+    # Pooled sessions would otherwise outlive the simulators they connect to
+    closePduSessions()
+    for simulator in simulators:
+        simulator.stop()
+
+@pytest.fixture
+def apcSimulator(simulatorFactory):
+    """A started APC menu console simulator."""
+    return simulatorFactory("apc")
+
+@pytest.fixture
+def aosSimulator(simulatorFactory):
+    """A started APC AOS command line simulator."""
+    return simulatorFactory("aos")
+
+@pytest.fixture
+def slpSimulator(simulatorFactory):
+    """A started SLP simulator."""
+    return simulatorFactory("slp")
+
+@pytest.fixture
+def olimexSimulator(simulatorFactory):
+    """A started Olimex relay board simulator."""
+    return simulatorFactory("olimex", username=None)
+
+@pytest.fixture
+def hs100Simulator(simulatorFactory):
+    """A started HS100 smart plug simulator."""
+    return simulatorFactory("hs100")
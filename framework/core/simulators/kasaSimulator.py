@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fake Kasa smart plug/strip. Speaks the TP-Link smart home
+#*   **          protocol over TCP: length prefixed JSON obfuscated with the
+#*   **          XOR autokey cipher, and answers legacy UDP discovery.
+#*   **
+#* ******************************************************************************
+
+import json
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+from framework.core.simulators.faults import faultInjector
+
+INITIALIZATION_VECTOR = 171
+DEVICE_ID = "8006A1B2C3D4E5F60718293A4B5C6D7E8F901234"
+
+def encrypt(plaintext:bytes) -> bytes:
+    """Obfuscate a message with the XOR autokey cipher.
+
+    Args:
+        plaintext (bytes): Message to obfuscate.
+
+    Returns:
+        bytes: The obfuscated message, without the length prefix.
+    """
+    key = INITIALIZATION_VECTOR
+    result = bytearray(len(plaintext))
+    for index, byte in enumerate(plaintext):
+        key = key ^ byte
+        result[index] = key
+    return bytes(result)
+
+def decrypt(ciphertext:bytes) -> bytes:
+    """Reverse the XOR autokey cipher.
+
+    Args:
+        ciphertext (bytes): Obfuscated message, without the length prefix.
+
+    Returns:
+        bytes: The plain message.
+    """
+    key = INITIALIZATION_VECTOR
+    result = bytearray(len(ciphertext))
+    for index, byte in enumerate(ciphertext):
+        result[index] = key ^ byte
+        key = byte
+    return bytes(result)
+
+
+class _kasaRequestHandler(socketserver.BaseRequestHandler):
+    """Handles a client connection. Connections are kept open for multiple requests,
+    as they are by a real device.
+    """
+
+    def setup(self):
+        self.server.connections.add(self.request)
+
+    def finish(self):
+        self.server.connections.discard(self.request)
+
+    def handle(self):
+        simulator = self.server.simulator
+        while True:
+            header = self._readExactly(4)
+            if header is None:
+                return
+            length = struct.unpack(">I", header)[0]
+            body = self._readExactly(length)
+            if body is None:
+                return
+            request = json.loads(decrypt(body))
+            fault = simulator.faults.nextFault()
+            if fault == "drop":
+                return
+            if fault == "timeout":
+                continue
+            if simulator.latency:
+                time.sleep(simulator.latency)
+            response = json.dumps(simulator.handleRequest(request, fault == "error")).encode()
+            self.request.sendall(struct.pack(">I", len(response)) + encrypt(response))
+
+    def _readExactly(self, length:int):
+        data = b""
+        while len(data) < length:
+            chunk = self.request.recv(length - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+
+class _kasaDiscoveryHandler(socketserver.BaseRequestHandler):
+    """Answers legacy UDP discovery, which uses the XOR cipher without the length prefix.
+    """
+
+    def handle(self):
+        data, sock = self.request
+        request = json.loads(decrypt(data))
+        response = json.dumps(self.server.simulator.handleRequest(request)).encode()
+        sock.sendto(encrypt(response), self.client_address)
+
+
+class _kasaServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        self.connections = set()
+        super().__init__(*args, **kwargs)
+
+    def server_close(self):
+        # Drop open connections too, as a device going offline would
+        for connection in list(self.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        super().server_close()
+
+
+class _kasaDiscoveryServer(socketserver.UDPServer):
+    allow_reuse_address = True
+
+
+class kasaSimulator():
+    """
+    A local fake Kasa plug, or power strip when outlets are given.
+
+    Supports the system get_sysinfo and set_relay_state commands, which are all
+    that is needed to switch and read outlets, and the time commands the kasa
+    CLI reads on every update. When a power draw is given the emeter
+    get_realtime command is supported too, as on a HS110. Any other command is
+    answered with a "module not support" error, as a real device does for
+    modules it lacks.
+
+    Requests can be failed by the fault injector in `faults`, see faultInjector.
+    """
+
+    def __init__(self, host:str="127.0.0.1", port:int=0, outlets:int=0, latency:float=0, model:str=None, power:float=None, voltage:float=230,
+                 faultRate:float=0, fault:str="drop", seed:int=None):
+        """Initialise the simulator.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on. Defaults to 0, a free port is chosen.
+            outlets (int, optional): Number of outlets for a power strip. Defaults to 0, a single plug.
+            latency (float, optional): Seconds the device takes to answer each request. Defaults to 0.
+            model (str, optional): Model reported by the device. Defaults to "HS100(UK)", "HS110(UK)" with
+                                   an energy meter, or "KP303(UK)" for a strip.
+            power (float, optional): Watts drawn by each outlet while on. Defaults to None, no energy meter.
+            voltage (float, optional): Mains voltage reported by the energy meter. Defaults to 230.
+            faultRate (float, optional): Probability of failing each request. Defaults to 0.
+            fault (str, optional): How random failures fail, "drop", "error" or "timeout". Defaults to "drop".
+            seed (int, optional): Random seed for the failures. Defaults to None.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.model = model or ("KP303(UK)" if outlets else "HS110(UK)" if power != None else "HS100(UK)")
+        self.power = power
+        self.voltage = voltage
+        self.faults = faultInjector(faultRate, fault, seed)
+        self.outlets = [False] * outlets
+        self.relayState = False
+        self.requestCount = 0
+        self._lock = threading.Lock()
+        self._servers = []
+
+    def start(self):
+        """Start listening for connections, and for discovery on the same UDP port.
+        """
+        server = _kasaServer((self.host, self.port), _kasaRequestHandler)
+        self.port = server.server_address[1]
+        self._servers = [server, _kasaDiscoveryServer((self.host, self.port), _kasaDiscoveryHandler)]
+        for server in self._servers:
+            server.simulator = self
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop listening for connections.
+        """
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+
+    def isOn(self, index:int=None) -> bool:
+        """Get the state of the device or one of its outlets.
+
+        Args:
+            index (int, optional): 0 based outlet index. Defaults to None, the whole device.
+
+        Returns:
+            bool: True if powered on.
+        """
+        if index is None:
+            return any(self.outlets) if self.outlets else self.relayState
+        return self.outlets[index]
+
+    def handleRequest(self, request:dict, error:bool=False) -> dict:
+        """Handle a decoded request.
+
+        Args:
+            request (dict): The request, e.g. {"system": {"get_sysinfo": {}}}.
+            error (bool, optional): Fail every command in the request. Defaults to False.
+
+        Returns:
+            dict: The response, in the same structure as the request.
+        """
+        childIds = request.get("context", {}).get("child_ids")
+        response = dict()
+        with self._lock:
+            self.requestCount += 1
+            for module, methods in request.items():
+                if module == "context":
+                    continue
+                response[module] = dict()
+                for method, args in methods.items():
+                    if error:
+                        response[module][method] = {"err_code": -1, "err_msg": "internal error"}
+                        continue
+                    response[module][method] = self._handleMethod(module, method, args or {}, childIds)
+        return response
+
+    def _handleMethod(self, module:str, method:str, args:dict, childIds:list) -> dict:
+        if module == "system" and method == "get_sysinfo":
+            return self._sysinfo()
+        if module == "system" and method == "set_relay_state":
+            state = bool(args.get("state"))
+            if not self.outlets:
+                self.relayState = state
+            elif childIds is None:
+                self.outlets = [state] * len(self.outlets)
+            else:
+                for childId in childIds:
+                    index = self._childIndex(childId)
+                    if index is None:
+                        return {"err_code": -14, "err_msg": "entry not exist"}
+                    self.outlets[index] = state
+            return {"err_code": 0}
+        if module == "time" and method == "get_time":
+            now = time.gmtime()
+            return {"year": now.tm_year, "month": now.tm_mon, "mday": now.tm_mday,
+                    "hour": now.tm_hour, "min": now.tm_min, "sec": now.tm_sec, "err_code": 0}
+        if module == "time" and method == "get_timezone":
+            # Timezone index 39 is GB
+            return {"index": 39, "err_code": 0}
+        if module == "emeter" and method == "get_realtime" and self.power != None:
+            return self._realtime(childIds)
+        return {"err_code": -1, "err_msg": "module not support"}
+
+    def _realtime(self, childIds:list) -> dict:
+        if childIds:
+            index = self._childIndex(childIds[0])
+            if index is None:
+                return {"err_code": -14, "err_msg": "entry not exist"}
+            outletsOn = int(self.outlets[index])
+        elif self.outlets:
+            outletsOn = sum(self.outlets)
+        else:
+            outletsOn = int(self.relayState)
+        power = self.power * outletsOn
+        return {"power_mw": int(power * 1000),
+                "voltage_mv": int(self.voltage * 1000),
+                "current_ma": int(power / self.voltage * 1000),
+                "total_wh": 0,
+                "err_code": 0}
+
+    def _childIndex(self, childId:str):
+        # Child ids can be given in full or as just the 2 digit index
+        for index in range(len(self.outlets)):
+            if childId in (DEVICE_ID + "%02d" % index, "%02d" % index):
+                return index
+        return None
+
+    def _sysinfo(self) -> dict:
+        sysinfo = {"sw_ver": "1.0.0 Build 200101 Rel.000000",
+                   "hw_ver": "1.0",
+                   "model": self.model,
+                   "deviceId": DEVICE_ID,
+                   "oemId": "FFF22CFF774A0B89F7624BFC6F50D5DE",
+                   "hwId": "22603EA5E716DEAEA6642A30BE87AFCB",
+                   "rssi": -50,
+                   "latitude_i": 0,
+                   "longitude_i": 0,
+                   "alias": "RAFT simulator",
+                   "mic_type": "IOT.SMARTPLUGSWITCH",
+                   "feature": "TIM:ENE" if self.power != None else "TIM",
+                   "mac": "50:C7:BF:00:00:01",
+                   "updating": 0,
+                   "led_off": 0,
+                   "err_code": 0}
+        if self.outlets:
+            sysinfo["child_num"] = len(self.outlets)
+            sysinfo["children"] = [{"id": DEVICE_ID + "%02d" % index,
+                                    "state": int(state),
+                                    "alias": "Plug %d" % (index + 1),
+                                    "on_time": 0,
+                                    "next_action": {"type": -1}}
+                                   for index, state in enumerate(self.outlets)]
+        else:
+            sysinfo["type"] = "IOT.SMARTPLUGSWITCH"
+            sysinfo["dev_name"] = "Smart Wi-Fi Plug"
+            sysinfo["relay_state"] = int(self.relayState)
+            sysinfo["on_time"] = 0
+            sysinfo["active_mode"] = "none"
+            sysinfo["icon_hash"] = ""
+            sysinfo["next_action"] = {"type": -1}
+        return sysinfo
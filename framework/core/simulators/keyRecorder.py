@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Records the key codes a simulator receives, with the time of each.
+#*   **
+#* ******************************************************************************
+
+import threading
+import time
+
+class keyRecorder():
+    """
+    The key codes a simulated remote control endpoint received, oldest first.
+
+    Each code is recorded with the time.monotonic() time it arrived, so the
+    timing of key presses can be compared with the times they were sent.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._condition = threading.Condition()
+
+    def record(self, code:str, timestamp:float=None):
+        """Record a received code.
+
+        Args:
+            code (str): The code.
+            timestamp (float, optional): time.monotonic() time it arrived. Defaults to None, now.
+        """
+        if timestamp == None:
+            timestamp = time.monotonic()
+        with self._condition:
+            self.records.append((timestamp, code))
+            self._condition.notify_all()
+
+    def getCodes(self) -> list:
+        """Get the received codes.
+
+        Returns:
+            list: The codes, oldest first.
+        """
+        with self._condition:
+            return [code for _, code in self.records]
+
+    def getRecords(self) -> list:
+        """Get the received codes with their arrival times.
+
+        Returns:
+            list: (timestamp, code) tuples, oldest first.
+        """
+        with self._condition:
+            return list(self.records)
+
+    def waitForCodes(self, count:int, timeout:float=5) -> bool:
+        """Wait until at least `count` codes have been received.
+
+        Args:
+            count (int): Number of codes.
+            timeout (float, optional): Seconds to wait. Defaults to 5.
+
+        Returns:
+            bool: True if the codes were received in time.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self.records) >= count, timeout)
+
+    def clear(self):
+        """Forget the received codes.
+        """
+        with self._condition:
+            self.records.clear()
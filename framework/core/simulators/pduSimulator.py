@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fake telnet PDUs. Line based simulations of the APC menu
+#*   **          console, APC AOS command line, SLP and Olimex relay boards.
+#*   **
+#* ******************************************************************************
+
+import socket
+import socketserver
+import threading
+import time
+
+from framework.core.simulators.faults import faultInjector
+from framework.core.simulators.keyRecorder import keyRecorder
+
+PROTOCOLS = ("apc", "aos", "slp", "olimex")
+
+# Login prompts and command prompt per protocol, None where there isn't one
+LOGIN_PROMPTS = {"apc": ("User Name : ", "Password  : "),
+                 "aos": ("User Name : ", "Password  : "),
+                 "slp": ("Username: ", "Password: "),
+                 "olimex": (None, None)}
+COMMAND_PROMPTS = {"apc": "", "aos": "apc>", "slp": "Switched CDU: ", "olimex": ""}
+ERROR_RESPONSES = {"apc": "Command not issued.\r\n", "aos": "E102: Parameter Error\r\n",
+                   "slp": "Command failed\r\n", "olimex": "(ERR)\r\n"}
+
+ESCAPE = "\x1b"
+APC_MENU_FOOTER = "\r\n     <ESC>- Back, <ENTER>- Refresh, <CTRL-L>- Event Log\r\n> "
+# APC menus: title and the entries selectable from each, which open the named menu
+APC_MENUS = {"main": ("Control Console", ["Device Manager", "Network", "System", "Logout"]),
+             "device": ("Device Manager", ["Phase Management", "Outlet Management", "Power Supply Status"]),
+             "outletManagement": ("Outlet Management", ["Outlet Control/Configuration", "Outlet Restriction"])}
+APC_SUBMENUS = {("main", "1"): "device", ("device", "2"): "outletManagement", ("outletManagement", "1"): "outlets"}
+APC_ACTIONS = {"1": ("Immediate On", "on"), "2": ("Immediate Off", "off"), "3": ("Immediate Reboot", "reboot")}
+
+
+class _dropConnection(Exception):
+    """Raised to close the client connection."""
+
+
+class _pduRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a telnet client connection. Connections stay open until the client closes them.
+    """
+
+    def setup(self):
+        super().setup()
+        self.server.connections.add(self.request)
+
+    def finish(self):
+        self.server.connections.discard(self.request)
+        super().finish()
+
+    def handle(self):
+        simulator = self.server.simulator
+        simulator._connected()
+        # Per connection state, e.g. the menu the APC console is showing
+        state = dict()
+        try:
+            if not self._login(simulator):
+                return
+            self._send(simulator.welcome(state))
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                fault = simulator.faults.nextFault()
+                if fault == "drop":
+                    return
+                if fault == "timeout":
+                    continue
+                if simulator.latency:
+                    time.sleep(simulator.latency)
+                self._send(simulator.handleCommand(line.decode(errors="replace").strip(), state, fault == "error"))
+        except (OSError, _dropConnection):
+            return
+
+    def _login(self, simulator) -> bool:
+        usernamePrompt, passwordPrompt = LOGIN_PROMPTS[simulator.protocol]
+        if simulator.username == None or usernamePrompt == None:
+            return True
+        self._send(usernamePrompt)
+        username = self.rfile.readline().decode(errors="replace").strip()
+        self._send(passwordPrompt)
+        password = self.rfile.readline().decode(errors="replace").strip()
+        if username != simulator.username or password != simulator.password:
+            self._send("\r\nUser Name or Password incorrect\r\n")
+            return False
+        self._send("\r\n")
+        return True
+
+    def _send(self, text:str):
+        if text:
+            self.wfile.write(text.encode())
+
+
+class _pduServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        self.connections = set()
+        super().__init__(*args, **kwargs)
+
+    def dropConnections(self):
+        for connection in list(self.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def server_close(self):
+        self.dropConnections()
+        super().server_close()
+
+
+class pduSimulator():
+    """
+    A local fake PDU, speaking a line based telnet protocol.
+
+    protocol "apc" is the APC menu console, navigated with numbered menu
+    entries and ESC, with YES to confirm an outlet command. "aos" is the APC
+    AOS command line, e.g. "olOn 1,3" answered with "E000: Success". "slp"
+    accepts "ON 1" and "OFF 1", answered with "Command successful". "olimex"
+    accepts "REL1=1", answered with "(OK)", and has no login. Any other olimex
+    command is an IR key code, as sent by remoteOlimex, recorded in `keys`
+    and answered with "(OK)".
+
+    Each command can be delayed by `latency`, and failed by the fault injector
+    in `faults`, see faultInjector.
+    """
+
+    def __init__(self, protocol:str, host:str="127.0.0.1", port:int=0, outlets:int=8, username:str="apc", password:str="apc",
+                 latency:float=0, faultRate:float=0, fault:str="drop", seed:int=None):
+        """Initialise the simulator.
+
+        Args:
+            protocol (str): One of "apc", "aos", "slp" or "olimex".
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on. Defaults to 0, a free port is chosen.
+            outlets (int, optional): Number of outlets. Defaults to 8.
+            username (str, optional): Login username. Defaults to "apc". None disables login.
+            password (str, optional): Login password. Defaults to "apc".
+            latency (float, optional): Seconds the PDU takes to answer each command. Defaults to 0.
+            faultRate (float, optional): Probability of failing each command. Defaults to 0.
+            fault (str, optional): How random failures fail, "drop", "error" or "timeout". Defaults to "drop".
+            seed (int, optional): Random seed for the failures. Defaults to None.
+
+        Raises:
+            ValueError: If the protocol or fault isn't supported.
+        """
+        if protocol not in PROTOCOLS:
+            raise ValueError("Protocol [{}] not supported".format(protocol))
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.faults = faultInjector(faultRate, fault, seed)
+        self.prompt = COMMAND_PROMPTS[protocol]
+        self.outlets = [False] * outlets
+        self.commands = []
+        self.keys = keyRecorder()
+        self.connectionCount = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self):
+        """Start listening for connections.
+        """
+        self._server = _pduServer((self.host, self.port), _pduRequestHandler)
+        self._server.simulator = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop listening and close open connections.
+        """
+        if self._server == None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def dropConnections(self):
+        """Close open connections, as a PDU timing out idle sessions does, but keep listening.
+        """
+        if self._server:
+            self._server.dropConnections()
+
+    def isOn(self, outlet:int) -> bool:
+        """Get the state of an outlet.
+
+        Args:
+            outlet (int): 1 based outlet number.
+
+        Returns:
+            bool: True if powered on.
+        """
+        return self.outlets[outlet-1]
+
+    def welcome(self, state:dict) -> str:
+        """Get the text shown once a client has logged in.
+
+        Args:
+            state (dict): The connection state.
+
+        Returns:
+            str: The banner and first prompt.
+        """
+        if self.protocol == "apc":
+            state["menu"] = ["main"]
+            return ("\r\nAmerican Power Conversion               Network Management Card AOS\r\n"
+                    "Communication Established\r\n" + self._apcMenu(state))
+        return self.prompt
+
+    def handleCommand(self, command:str, state:dict=None, error:bool=False) -> str:
+        """Handle a command line.
+
+        Args:
+            command (str): The command, without line endings.
+            state (dict, optional): The connection state. Defaults to None, a new connection.
+            error (bool, optional): Fail the command with the protocol's error response. Defaults to False.
+
+        Returns:
+            str: The response, including the prompt.
+        """
+        if state == None:
+            state = dict()
+        if self.protocol == "apc":
+            return self._apc(command, state, error)
+        if command == "":
+            return "\r\n" + self.prompt
+        with self._lock:
+            self.commands.append(command)
+            if error:
+                return ERROR_RESPONSES[self.protocol] + self.prompt
+            return getattr(self, "_" + self.protocol)(command) + self.prompt
+
+    def _connected(self):
+        with self._lock:
+            self.connectionCount += 1
+
+    def _setOutlets(self, outlets:list, state:bool) -> bool:
+        if any(outlet < 1 or outlet > len(self.outlets) for outlet in outlets):
+            return False
+        for outlet in outlets:
+            self.outlets[outlet-1] = state
+        return True
+
+    def _apc(self, command:str, state:dict, error:bool) -> str:
+        menu = state.setdefault("menu", ["main"])
+        confirm = state.pop("confirm", None)
+        if state.pop("continue", False):
+            # Any key continues back to the outlet menu
+            return self._apcMenu(state)
+        if confirm != None:
+            outlet, action = confirm
+            if command != "YES":
+                return "Command cancelled.\r\n" + self._apcMenu(state)
+            with self._lock:
+                self.commands.append("{} {}".format(action, outlet))
+                if error:
+                    result = ERROR_RESPONSES["apc"]
+                else:
+                    # A reboot leaves the outlet on
+                    self._setOutlets([outlet], action != "off")
+                    result = "Command successfully issued.\r\n"
+            state["continue"] = True
+            return "\r\n" + result + "\r\nPress <ENTER> to continue..."
+        if command == ESCAPE:
+            if len(menu) > 1:
+                menu.pop()
+            return self._apcMenu(state)
+        if command == "":
+            return self._apcMenu(state)
+        current = menu[-1]
+        if current == "main" and command == "4":
+            raise _dropConnection()
+        if (current, command) in APC_SUBMENUS:
+            menu.append(APC_SUBMENUS[(current, command)])
+        elif current == "outlets" and command.isdigit() and 1 <= int(command) <= len(self.outlets):
+            menu.append(int(command))
+        elif isinstance(current, int) and command in APC_ACTIONS:
+            title, action = APC_ACTIONS[command]
+            state["confirm"] = (current, action)
+            return ("\r\n        {}\r\n        --------------\r\n"
+                    "        This command will {} outlet {}.\r\n\r\n"
+                    "        Enter 'YES' to continue or <ENTER> to cancel : ").format(title, title.lower(), current)
+        return self._apcMenu(state)
+
+    def _apcMenu(self, state:dict) -> str:
+        current = state["menu"][-1]
+        if current == "outlets":
+            title = "Outlet Control/Configuration"
+            entries = ["Outlet {:<3} {}".format(outlet, "ON" if on else "OFF") for outlet, on in enumerate(self.outlets, 1)]
+        elif isinstance(current, int):
+            title = "Outlet {}".format(current)
+            entries = [APC_ACTIONS[key][0] for key in sorted(APC_ACTIONS)]
+            title += "\r\n        State : {}".format("ON" if self.outlets[current-1] else "OFF")
+        else:
+            title, entries = APC_MENUS[current]
+        lines = ["\r\n------- {} ---------------------------------------------\r\n".format(title)]
+        lines += ["     {}- {}\r\n".format(index, entry) for index, entry in enumerate(entries, 1)]
+        return "".join(lines) + APC_MENU_FOOTER
+
+    def _aos(self, command:str) -> str:
+        parts = command.split()
+        states = {"olOn": True, "olOff": False}
+        if len(parts) != 2 or parts[0] not in states:
+            return "E101: Command Not Found\r\n"
+        try:
+            outlets = self._parseOutlets(parts[1])
+        except ValueError:
+            return "E102: Parameter Error\r\n"
+        if not self._setOutlets(outlets, states[parts[0]]):
+            return "E102: Parameter Error\r\n"
+        return "E000: Success\r\n"
+
+    def _parseOutlets(self, outlets:str) -> list:
+        # AOS accepts lists and ranges, e.g. 1,3,5-7
+        result = []
+        for item in outlets.split(","):
+            first, _, last = item.partition("-")
+            result.extend(range(int(first), int(last or first) + 1))
+        return result
+
+    def _slp(self, command:str) -> str:
+        parts = command.split()
+        states = {"ON": True, "OFF": False}
+        if len(parts) != 2 or parts[0].upper() not in states or not parts[1].isdigit():
+            return "Invalid command\r\n"
+        if not self._setOutlets([int(parts[1])], states[parts[0].upper()]):
+            return "Invalid outlet\r\n"
+        return "Command successful\r\n"
+
+    def _olimex(self, command:str) -> str:
+        if not command.upper().startswith("REL"):
+            self.keys.record(command)
+            return "(OK)\r\n"
+        relay, _, state = command.partition("=")
+        if not relay.startswith("REL") or not relay[3:].isdigit() or state not in ("0", "1"):
+            return "(ERR)\r\n"
+        if not self._setOutlets([int(relay[3:])], state == "1"):
+            return "(ERR)\r\n"
+        return "(OK)\r\n"
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fake RedRat Hub. Speaks the hub's line based socket protocol,
+#*   **          answering IR signal commands for its netboxes with OK.
+#*   **
+#* ******************************************************************************
+
+import re
+import socket
+import socketserver
+import threading
+import time
+
+from framework.core.simulators.faults import faultInjector
+from framework.core.simulators.keyRecorder import keyRecorder
+
+DEFAULT_NETBOX = {"name": "IRNetBox IV 21089", "ip": "192.168.0.2", "mac": "70-B3-D5-FD-10-10"}
+# Arguments of a hub command, e.g. ip="192.168.0.2" dataset="SKY+" signal="POWER" output="1"
+ARGUMENT = re.compile(r'(\w+)="([^"]*)"')
+
+
+class _redratRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a client connection, one command per line. Connections stay open until the client closes them.
+    """
+
+    def setup(self):
+        super().setup()
+        self.server.connections.add(self.request)
+
+    def finish(self):
+        self.server.connections.discard(self.request)
+        super().finish()
+
+    def handle(self):
+        simulator = self.server.simulator
+        try:
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                fault = simulator.faults.nextFault()
+                if fault == "drop":
+                    return
+                if fault == "timeout":
+                    continue
+                if simulator.latency:
+                    time.sleep(simulator.latency)
+                self.wfile.write(simulator.handleMessage(line.decode(errors="replace").strip(), fault == "error").encode())
+        except OSError:
+            return
+
+
+class _redratServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        self.connections = set()
+        super().__init__(*args, **kwargs)
+
+    def server_close(self):
+        for connection in list(self.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        super().server_close()
+
+
+class redratHubSimulator():
+    """
+    A local fake RedRat Hub.
+
+    Answers 'hubquery="list redrats"' with its netboxes, as a multi line reply
+    wrapped in "{" and "}" lines, and IR signal commands addressed to one of
+    its netboxes by ip, mac or name with "OK". Anything else is answered with
+    an error line. Every command is kept in `commands`, and the IR signal
+    commands answered with "OK" are recorded in `keys`. Each command can be delayed by `latency`, and failed by the
+    fault injector in `faults`, see faultInjector.
+    """
+
+    def __init__(self, host:str="127.0.0.1", port:int=0, netboxes:list=None, latency:float=0,
+                 faultRate:float=0, fault:str="drop", seed:int=None):
+        """Initialise the simulator.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on. Defaults to 0, a free port is chosen.
+            netboxes (list, optional): Netboxes on the hub, as dicts of name, ip and mac. Defaults to one netbox.
+            latency (float, optional): Seconds the hub takes to answer each command. Defaults to 0.
+            faultRate (float, optional): Probability of failing each command. Defaults to 0.
+            fault (str, optional): How random failures fail, "drop", "error" or "timeout". Defaults to "drop".
+            seed (int, optional): Random seed for the failures. Defaults to None.
+        """
+        self.host = host
+        self.port = port
+        self.netboxes = netboxes if netboxes != None else [DEFAULT_NETBOX]
+        self.latency = latency
+        self.faults = faultInjector(faultRate, fault, seed)
+        self.commands = []
+        self.keys = keyRecorder()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self):
+        """Start listening for connections.
+        """
+        self._server = _redratServer((self.host, self.port), _redratRequestHandler)
+        self._server.simulator = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop listening and close open connections.
+        """
+        if self._server == None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def handleMessage(self, message:str, error:bool=False) -> str:
+        """Handle a command line.
+
+        Args:
+            message (str): The command, without the line ending.
+            error (bool, optional): Fail the command with an error reply. Defaults to False.
+
+        Returns:
+            str: The reply, including line endings.
+        """
+        arguments = dict(ARGUMENT.findall(message))
+        if arguments.get("hubquery") == "list redrats":
+            lines = ["[Name] {name} [IP] {ip} [MAC] {mac}".format(**netbox) for netbox in self.netboxes]
+            return "{\n" + "".join(line + "\n" for line in lines) + "}\n"
+        with self._lock:
+            self.commands.append(message)
+        if error:
+            return "Error sending IR signal\n"
+        if self._findNetbox(arguments) == None:
+            return "Error, no RedRat found\n"
+        if "signal" not in arguments:
+            return "Error, no signal given\n"
+        self.keys.record(message)
+        return "OK\n"
+
+    def _findNetbox(self, arguments:dict):
+        for netbox in self.netboxes:
+            if any(arguments.get(key) == netbox[key] for key in ("ip", "mac", "name")):
+                return netbox
+        return None
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Starts the simulator of each remote controller type, with the
+#*   **          commonRemote configuration to reach it, so remotes can be
+#*   **          tested and benchmarked without the hardware.
+#*   **
+#* ******************************************************************************
+
+import yaml
+
+from framework.core.rcCodes import rcCode as rc
+from framework.core.simulators.arduinoSimulator import arduinoSimulator
+from framework.core.simulators.pduSimulator import pduSimulator
+from framework.core.simulators.redratSimulator import ARGUMENT, DEFAULT_NETBOX, redratHubSimulator
+from framework.core.simulators.skyProcSimulator import skyProcSimulator
+from framework.core.simulators.sshSimulator import keySimulatorHost
+
+# Remote controller types with a simulator, as set in the remoteController type of a rack config
+REMOTE_TYPES = ("olimex", "sky_proc", "redrat", "keySimulator", "arduino")
+KEY_MAP_NAME = "simulator"
+
+def startRemoteSimulator(remoteType:str, latency:float=0) -> tuple:
+    """Start the simulator of a remote controller type.
+
+    Args:
+        remoteType (str): One of REMOTE_TYPES.
+        latency (float, optional): Seconds the simulator takes to answer each key, where it answers. Defaults to 0.
+
+    Returns:
+        tuple: The started simulator, and the remoteController config reaching it, without a key map.
+
+    Raises:
+        ValueError: If the type has no simulator.
+    """
+    if remoteType == "olimex":
+        simulator = pduSimulator("olimex", latency=latency)
+    elif remoteType == "sky_proc":
+        simulator = skyProcSimulator(latency=latency)
+    elif remoteType == "redrat":
+        simulator = redratHubSimulator(latency=latency)
+    elif remoteType == "keySimulator":
+        simulator = keySimulatorHost()
+    elif remoteType == "arduino":
+        simulator = arduinoSimulator("framed")
+    else:
+        raise ValueError("Remote type [{}] has no simulator, use one of {}".format(remoteType, REMOTE_TYPES))
+    simulator.start()
+    if remoteType == "arduino":
+        return simulator, {"type": "arduino", "port": simulator.port, "baudrate": 115200, "protocol": "framed"}
+    if remoteType == "redrat":
+        return simulator, {"type": "redrat", "hub_ip": simulator.host, "hub_port": simulator.port,
+                           "netbox_ip": DEFAULT_NETBOX["ip"]}
+    if remoteType == "keySimulator":
+        return simulator, {"type": "keySimulator", "ip": simulator.host, "port": simulator.port,
+                           "username": simulator.username, "password": simulator.password, "prompt": simulator.prompt}
+    return simulator, {"type": remoteType, "ip": simulator.host, "port": simulator.port}
+
+def writeKeyMap(path:str, remoteType:str) -> str:
+    """Write a key map file for a simulated remote, mapping every rcCode to its own name.
+
+    Args:
+        path (str): Key map file to write.
+        remoteType (str): One of REMOTE_TYPES.
+
+    Returns:
+        str: Name of the map in the file.
+    """
+    if remoteType == "redrat":
+        keyMap = {"name": KEY_MAP_NAME, "prefix": 'dataset="RAFT" ', "codes": {key: 'signal="{}"'.format(key) for key in rc.__members__}}
+    else:
+        keyMap = {"name": KEY_MAP_NAME, "codes": {key: key for key in rc.__members__}}
+    with open(path, "w") as keyMapFile:
+        yaml.safe_dump({"remoteMaps": {"remoteCommanderMap0": keyMap}}, keyMapFile)
+    return KEY_MAP_NAME
+
+def getReceivedKeys(simulator) -> list:
+    """Get the keys a simulator received, for a key map written by writeKeyMap.
+
+    Args:
+        simulator: A simulator started by startRemoteSimulator.
+
+    Returns:
+        list: (timestamp, rcCode name) tuples, oldest first.
+    """
+    records = simulator.keys.getRecords()
+    if isinstance(simulator, redratHubSimulator):
+        return [(timestamp, dict(ARGUMENT.findall(code)).get("signal")) for timestamp, code in records]
+    return records
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fake SkyProc box. Accepts the telnet shell commands remoteSkyProc
+#*   **          writes to /proc/cdi_ir, recording each key code.
+#*   **
+#* ******************************************************************************
+
+import re
+import socket
+import socketserver
+import threading
+import time
+
+from framework.core.simulators.faults import faultInjector
+from framework.core.simulators.keyRecorder import keyRecorder
+
+# The command remoteSkyProc sends for a key, e.g. echo 0x3c > /proc/cdi_ir
+KEY_COMMAND = re.compile(r"^echo\s+(\S+)\s*>\s*/proc/cdi_ir$")
+
+
+class _skyProcRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a client connection, one command per line. Connections stay open until the client closes them.
+    """
+
+    def setup(self):
+        super().setup()
+        self.server.connections.add(self.request)
+
+    def finish(self):
+        self.server.connections.discard(self.request)
+        super().finish()
+
+    def handle(self):
+        simulator = self.server.simulator
+        try:
+            self.wfile.write(simulator.prompt.encode())
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                command = line.decode(errors="replace").strip()
+                if command == "":
+                    self.wfile.write(("\r\n" + simulator.prompt).encode())
+                    continue
+                fault = simulator.faults.nextFault()
+                if fault == "drop":
+                    return
+                if fault == "timeout":
+                    continue
+                if simulator.latency:
+                    time.sleep(simulator.latency)
+                self.wfile.write(simulator.handleCommand(command, fault == "error").encode())
+        except OSError:
+            return
+
+
+class _skyProcServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        self.connections = set()
+        super().__init__(*args, **kwargs)
+
+    def server_close(self):
+        for connection in list(self.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        super().server_close()
+
+
+class skyProcSimulator():
+    """
+    A local fake SkyProc box, reached over telnet without a login.
+
+    "echo <code> > /proc/cdi_ir" records the code in `keys` and is answered
+    with "(OK)", other commands with an error. Each command can be delayed by
+    `latency`, and failed by the fault injector in `faults`, see faultInjector.
+    """
+
+    def __init__(self, host:str="127.0.0.1", port:int=0, prompt:str="# ", latency:float=0,
+                 faultRate:float=0, fault:str="drop", seed:int=None):
+        """Initialise the simulator.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on. Defaults to 0, a free port is chosen.
+            prompt (str, optional): Shell prompt. Defaults to "# ".
+            latency (float, optional): Seconds the box takes to answer each command. Defaults to 0.
+            faultRate (float, optional): Probability of failing each command. Defaults to 0.
+            fault (str, optional): How random failures fail, "drop", "error" or "timeout". Defaults to "drop".
+            seed (int, optional): Random seed for the failures. Defaults to None.
+        """
+        self.host = host
+        self.port = port
+        self.prompt = prompt
+        self.latency = latency
+        self.faults = faultInjector(faultRate, fault, seed)
+        self.keys = keyRecorder()
+        self._server = None
+
+    def start(self):
+        """Start listening for connections.
+        """
+        self._server = _skyProcServer((self.host, self.port), _skyProcRequestHandler)
+        self._server.simulator = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop listening and close open connections.
+        """
+        if self._server == None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def handleCommand(self, command:str, error:bool=False) -> str:
+        """Handle a command line.
+
+        Args:
+            command (str): The command, without line endings.
+            error (bool, optional): Fail the command. Defaults to False.
+
+        Returns:
+            str: The response, including the prompt.
+        """
+        match = KEY_COMMAND.match(command)
+        if match == None:
+            return "sh: {}: not found\r\n{}".format(command.split()[0], self.prompt)
+        if error:
+            return "sh: write error: Input/output error\r\n" + self.prompt
+        self.keys.record(match.group(1))
+        return "(OK)\r\n" + self.prompt
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : core.simulators
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Fake DUT SSH server. Runs shell and exec requests with the
+#*   **          local shell, with a keySimulator command that records the
+#*   **          keys it is given.
+#*   **
+#* ******************************************************************************
+
+import os
+import socket
+import stat
+import subprocess
+import tempfile
+import threading
+
+import paramiko
+
+from framework.core.simulators.keyRecorder import keyRecorder
+
+KEY_SIMULATOR_SCRIPT = """#!/bin/sh
+# Passes the key, e.g. -kOK, to the simulator to record
+echo "$@" > "{fifo}"
+"""
+# Written to the key fifo to end the reader, the stub never writes it
+STOP_KEY = b"\x00"
+
+
+class _sshServer(paramiko.ServerInterface):
+    """Accepts the simulator's credentials, and session, shell and exec channels.
+    """
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        if username == self.simulator.username and password == self.simulator.password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED_OPEN_REQUEST
+
+    def check_channel_pty_request(self, channel, term, width, height, pixelwidth, pixelheight, modes):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        self.simulator._run(channel, ["sh", "-i"])
+        return True
+
+    def check_channel_exec_request(self, channel, command):
+        self.simulator._run(channel, ["sh", "-c", command.decode()])
+        return True
+
+
+class keySimulatorHost():
+    """
+    A local fake DUT, reached over SSH, with a keySimulator command.
+
+    Interactive shells run "sh -i" with `prompt` as the prompt, and exec
+    requests run their command with "sh -c", both on this host. The
+    keySimulator command found on the path passes its key to the simulator,
+    which records it in `keys`, e.g. "OK" for "keySimulator -kOK". Stand-ins
+    for other DUT commands can be put on the path with addCommand.
+    """
+
+    def __init__(self, host:str="127.0.0.1", port:int=0, username:str="root", password:str="", prompt:str=":~$ "):
+        """Initialise the simulator.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on. Defaults to 0, a free port is chosen.
+            username (str, optional): Login username. Defaults to "root".
+            password (str, optional): Login password. Defaults to "".
+            prompt (str, optional): Shell prompt. Defaults to ":~$ ".
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.prompt = prompt
+        self.connectionCount = 0
+        self.keys = keyRecorder()
+        self._hostKey = paramiko.RSAKey.generate(2048)
+        self._directory = None
+        self._socket = None
+        self._transports = []
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start listening for connections.
+        """
+        self._directory = tempfile.TemporaryDirectory()
+        keyFifo = os.path.join(self._directory.name, "keys.fifo")
+        os.mkfifo(keyFifo)
+        # Opened for writing too, so the reader doesn't see the end of the file between keys
+        self._keyFifo = os.fdopen(os.open(keyFifo, os.O_RDWR), "rb", buffering=0)
+        threading.Thread(target=self._recordKeys, args=(self._keyFifo,), daemon=True).start()
+        self.addCommand("keySimulator", KEY_SIMULATOR_SCRIPT.format(fifo=keyFifo))
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, self.port))
+        self._socket.listen()
+        self.port = self._socket.getsockname()[1]
+        threading.Thread(target=self._acceptLoop, daemon=True).start()
+
+    def stop(self):
+        """Stop listening, close open connections and end their commands.
+        """
+        if self._socket == None:
+            return
+        self._socket.close()
+        self._socket = None
+        with self._lock:
+            for transport in self._transports:
+                transport.close()
+            for process in self._processes:
+                if process.poll() == None:
+                    process.kill()
+        os.write(self._keyFifo.fileno(), STOP_KEY + b"\n")
+        self._directory.cleanup()
+
+    def addCommand(self, name:str, script:str):
+        """Add a command to the path of the shell and exec requests, replacing any with the same name.
+
+        Must be called after start.
+
+        Args:
+            name (str): Command name, e.g. "cec-client".
+            script (str): Script run for the command, starting with its #! line.
+        """
+        commandPath = os.path.join(self._directory.name, name)
+        with open(commandPath, "w") as scriptFile:
+            scriptFile.write(script)
+        os.chmod(commandPath, os.stat(commandPath).st_mode | stat.S_IEXEC)
+
+    def getKeys(self) -> list:
+        """Get the keys sent with keySimulator, oldest first.
+
+        Returns:
+            list: The key of each keySimulator run, e.g. "OK" for "keySimulator -kOK".
+        """
+        return self.keys.getCodes()
+
+    def _recordKeys(self, keyFifo):
+        try:
+            while True:
+                line = keyFifo.readline().strip()
+                if line == STOP_KEY:
+                    break
+                line = line.decode(errors="replace")
+                self.keys.record(line[2:] if line.startswith("-k") else line)
+        finally:
+            keyFifo.close()
+
+    def _acceptLoop(self):
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(self._hostKey)
+            with self._lock:
+                self.connectionCount += 1
+                self._transports.append(transport)
+            try:
+                transport.start_server(server=_sshServer(self))
+            except (paramiko.SSHException, EOFError):
+                transport.close()
+                continue
+            # Channels are served by the transport's thread, accept them so they aren't queued
+            threading.Thread(target=self._acceptChannels, args=(transport,), daemon=True).start()
+
+    def _acceptChannels(self, transport):
+        # Keep the channels referenced, a channel closes when it is garbage collected
+        channels = []
+        while transport.is_active():
+            channel = transport.accept(1)
+            if channel != None:
+                channels.append(channel)
+
+    def _run(self, channel, command:list):
+        """Run a command with its input and output connected to the channel.
+        """
+        environment = dict(os.environ)
+        environment["PATH"] = self._directory.name + os.pathsep + environment.get("PATH", "")
+        environment["PS1"] = self.prompt
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   env=environment, cwd=self._directory.name, bufsize=0)
+        with self._lock:
+            self._processes.append(process)
+        threading.Thread(target=self._pumpInput, args=(channel, process), daemon=True).start()
+        threading.Thread(target=self._pumpOutput, args=(channel, process), daemon=True).start()
+
+    def _pumpInput(self, channel, process):
+        try:
+            while True:
+                data = channel.recv(4096)
+                if not data:
+                    break
+                process.stdin.write(data)
+        except OSError:
+            pass
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+
+    def _pumpOutput(self, channel, process):
+        try:
+            while True:
+                data = process.stdout.read(4096)
+                if not data:
+                    break
+                channel.sendall(data)
+            status = process.wait()
+            # A command ended by a signal exits with 128 plus the signal, as in a shell
+            channel.send_exit_status(status if status >= 0 else 128 - status)
+        except OSError:
+            # The channel was closed, as sshd does the command's next write fails with SIGPIPE
+            process.stdout.close()
+        channel.close()
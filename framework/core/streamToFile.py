@@ -1,19 +1,38 @@
 #!/usr/bin/env python3
 
 from io import IOBase, SEEK_CUR
-from threading import Thread
+from threading import Event, Lock, Thread
 from os import path
 import time
 
+from framework.core.logModule import logModule
+
 
 class StreamToFile():
 
-    def __init__(self, outputPath):
+    def __init__(self, outputPath, log: logModule = None):
+        if log is None:
+            log = logModule(self.__class__.__name__)
+        self._log = log
         self._filePath = outputPath
         self._fileHandle = None
         self._activeThread = None
         self._readLine = 0
         self._stopThread = False
+        self._lineCallbacks = []
+        self._fileLock = Lock()
+        self._newData = Event()
+
+    def addLineCallback(self, callback) -> None:
+        """
+        Registers a callable that is given every line written from the input stream.
+
+        Callbacks are run on the streaming thread, so they should return quickly.
+
+        Args:
+            callback (callable): Function taking a single line (str) as its argument.
+        """
+        self._lineCallbacks.append(callback)
 
     def writeStreamToFile(self, inputStream: IOBase) -> None:
         """
@@ -41,6 +60,9 @@ class StreamToFile():
             AttributeError: If the specified thread cannot be found.
         """
         self._stopThread = True
+        if self._activeThread is None:
+            # Never started
+            return
         while self._activeThread.is_alive():
             self._activeThread.join()
 
@@ -56,37 +78,54 @@ class StreamToFile():
             chunk = streamIn.readline()
             if chunk == '':
                 break
-            ioOut.write(chunk)
+            with self._fileLock:
+                ioOut.write(chunk)
+            self._newData.set()
+            for callback in self._lineCallbacks:
+                try:
+                    callback(chunk)
+                except Exception as e:
+                    # A misbehaving callback must not stop the stream being logged
+                    self._log.error(f'Line callback {getattr(callback, "__qualname__", callback)} failed: {e}')
 
     def readUntil(self, searchString:str, retries: int = 5) -> None:
         """
         Read lines from a file until a specific search string is found, with a specified
         number of retries.
 
+        Each retry waits up to one second for new output, but returns as soon as new
+        lines are written, so the search isn't delayed by polling.
+
         Args:
           searchString (str): The string that will be search for.
-          retries (int): The maximum number of times the method will attempt to find the `searchString`.
+          retries (int): The maximum time, in seconds, the method will attempt to find the `searchString`.
                           Defaults to 5
 
         Returns:
             list : list of strings including the search line. Empty list when search not found.
         """
         result = []
-        retry = 0
-        max_retries = retries
-        while retry != max_retries and len(result) == 0:
+        deadline = time.monotonic() + retries
+        while len(result) == 0:
+            self._newData.clear()
             read_line = self._readLine
-            self._fileHandle.seek(0)
-            out_lines = self._fileHandle.readlines()
+            with self._fileLock:
+                self._fileHandle.seek(0)
+                out_lines = self._fileHandle.readlines()
             write_line = len(out_lines)
             if read_line == write_line:
-                time.sleep(1)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._newData.wait(min(remaining, 1))
             else:
                 while read_line < write_line and len(result) == 0:
                     if searchString in out_lines[read_line]:
                         result = out_lines[:read_line]
                     read_line+=1
-            retry += 1
+                if len(result) == 0 and time.monotonic() >= deadline:
+                    self._readLine = read_line
+                    break
             self._readLine = read_line
         return result
 
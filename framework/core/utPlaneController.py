@@ -21,23 +21,74 @@
 # *
 #* ******************************************************************************
 
+import http.client
+import json
 import os
+import socket
 import sys
 
+import yaml
+
 dir_path = os.path.dirname(os.path.realpath(__file__))
 sys.path.append(dir_path)
 sys.path.append(os.path.join(dir_path, "..", "..", ".."))
 
 from framework.core.logModule import logModule
 
+KVP_ENDPOINT = "/api/postKVP"
+
+class utPlaneHttpConnection(http.client.HTTPConnection):
+    """
+    HTTPConnection to the ut-controller that can be carried over an SSH port-forward.
+
+    When an sshConsole session is given, each connection is opened as a direct-tcpip
+    channel through the session's SSH transport to the control port on the device.
+    Otherwise a plain socket is opened to the host and port.
+    """
+
+    def __init__(self, host: str, port: int, session: object = None, timeout: float = 10):
+        """
+        Initializes the connection.
+
+        Args:
+            host (str): Host to connect to. For tunnelled connections, this is the host
+                        as seen from the device, usually "localhost".
+            port (int): Port the ut-controller is listening on.
+            session (sshConsole, optional): SSH session to tunnel the connection through.
+                                            Defaults to None, for a direct socket.
+            timeout (float, optional): Socket timeout in seconds. Defaults to 10.
+        """
+        super().__init__(host, port, timeout=timeout)
+        self._session = session
+
+    def connect(self):
+        if self._session is None:
+            super().connect()
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return
+        if not self._session.is_open:
+            self._session.open()
+        transport = self._session.console.get_transport()
+        self.sock = transport.open_channel("direct-tcpip",
+                                           (self.host, self.port),
+                                           ("127.0.0.1", 0),
+                                           timeout=self.timeout)
+        self.sock.settimeout(self.timeout)
+
 class utPlaneController():
     """
     UT Plane Controller class for managing communication with the ut-controller.
 
     This class provides an interface to interact with the ut-controller running on a device.
-    It facilitates sending commands and YAML configuration files to the controller via HTTP requests
-    using curl commands. The controller operates over a configurable port (default: 8080) and uses
-    the session object to execute commands on the target device.
+    It facilitates sending commands and YAML configuration files to the controller via HTTP requests.
+    The controller operates over a configurable port (default: 8080) and supports three transports:
+
+    - "shell": curl commands are typed into the interactive shell of the session (default).
+    - "tunnel": HTTP requests are sent from the host through an SSH port-forward on the session.
+    - "http": HTTP requests are sent from the host directly to the device address.
+
+    The "tunnel" and "http" transports keep a single keep-alive connection open between
+    messages and return the parsed response from the ut-controller.
 
     Typical usage involves:
     1. Creating an instance with an active session and optional port/log configuration
@@ -48,14 +99,20 @@ class utPlaneController():
         session (object): Active session object for device communication
         port (int): Port number where ut-controller service is listening (default: 8080)
         log (logModule): Logger instance for recording controller activities and debugging
+        transport (str): Transport used to reach the ut-controller (default: "shell")
 
     Example:
         >>> controller = utPlaneController(session, port=8080)
         >>> controller.sendMessage("/path/on/dut/to/test_config.yaml")
         >>> controller.sendMessage("yaml string directly")
+        >>> tunnelled = utPlaneController(session, transport="tunnel")
+        >>> tunnelled.sendMessages(["yaml string 1", "yaml string 2"])
     """
 
-    def __init__(self, session:object, port: int = 8080, log: logModule = None):
+    TRANSPORTS = ("shell", "tunnel", "http")
+
+    def __init__(self, session:object, port: int = 8080, log: logModule = None,
+                 transport: str = "shell", address: str = None, timeout: float = 10):
         """
         Initializes UT Plane Controller class.
 
@@ -63,11 +120,20 @@ class utPlaneController():
             session (class): The session object to communicate with the device
             port (int): The port number for the controller
             log (class, optional): Parent log class. Defaults to None.
+            transport (str, optional): One of "shell", "tunnel" or "http". Defaults to "shell".
+            address (str, optional): Address of the device for the "http" transport.
+                                     Defaults to the address of the session.
+            timeout (float, optional): Timeout in seconds for HTTP requests. Defaults to 10.
+
+        Raises:
+            ValueError: If the session is None or the transport is unknown.
         """
 
         # Validate session
         if session is None:
             raise ValueError("session cannot be None")
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"Unknown ut-controller transport [{transport}]")
 
         self.log = log
         if log is None:
@@ -76,10 +142,98 @@ class utPlaneController():
 
         self.session = session
         self.port = port
+        self.transport = transport
+        self._connection = None
+        if transport == "tunnel":
+            self._connection = utPlaneHttpConnection("localhost", port, session=session, timeout=timeout)
+        elif transport == "http":
+            address = address or getattr(session, "address", None)
+            if not address:
+                raise ValueError("address is required for the http transport")
+            self._connection = utPlaneHttpConnection(address, port, timeout=timeout)
+
+    def postKVP(self, yamlInput: str) -> dict:
+        """
+        Posts a YAML document to the ut-controller over the persistent HTTP connection.
+
+        The connection is reopened and the request retried once if the keep-alive
+        connection has been closed by the ut-controller.
+
+        Args:
+            yamlInput (str): The YAML string to post.
+
+        Returns:
+            dict: The response, in the format:
+                {"status": 200,
+                 "reason": "OK",
+                 "body": "raw response body",
+                 "data": parsed JSON/YAML body, or None if it can't be parsed}
+
+        Raises:
+            RuntimeError: If the controller wasn't created with an HTTP transport.
+        """
+        if self._connection is None:
+            raise RuntimeError("postKVP requires the tunnel or http transport")
+        body = yamlInput.encode("utf-8")
+        headers = {"Content-Type": "application/x-yaml",
+                   "Connection": "keep-alive"}
+        for attempt in range(2):
+            try:
+                self._connection.request("POST", KVP_ENDPOINT, body=body, headers=headers)
+                response = self._connection.getresponse()
+                responseBody = response.read().decode("utf-8", errors="replace")
+                break
+            except (http.client.HTTPException, OSError):
+                self._connection.close()
+                if attempt == 1:
+                    raise
+        if response.will_close:
+            self._connection.close()
+        return {"status": response.status,
+                "reason": response.reason,
+                "body": responseBody,
+                "data": self._parseResponse(responseBody)}
+
+    def sendMessages(self, yamlInputs: list) -> list:
+        """
+        Sends a batch of YAML documents to the ut-controller.
+
+        With an HTTP transport all documents are posted back to back on the same
+        keep-alive connection. With the shell transport the curl commands are written
+        to the shell in a single write.
+
+        Args:
+            yamlInputs (list): List of YAML strings.
+
+        Returns:
+            list: A bool per document, True if it was sent successfully.
+        """
+        if self._connection is None:
+            commands = [self._curlCommand(yamlInput) for yamlInput in yamlInputs]
+            try:
+                result = self.session.write(commands)
+            except Exception as e:
+                self.log.error(f"Failed to send messages to ut-controller: {str(e)}")
+                result = False
+            return [bool(result)] * len(yamlInputs)
+        results = []
+        for yamlInput in yamlInputs:
+            results.append(self._sendHttp(yamlInput))
+        self.log.debug(f"Sent [{results.count(True)}/{len(results)}] messages to ut-controller on port {self.port}")
+        return results
+
+    def close(self) -> None:
+        """Closes the persistent HTTP connection, if there is one.
+        """
+        if self._connection is not None:
+            self._connection.close()
 
     def sendMessage(self, yamlInput: str, isFile: bool = False) -> bool:
         """
-        Sends a command to the ut-controller via curl.
+        Sends a command to the ut-controller.
+
+        Files are always sent with curl through the shell, as the path refers to a
+        file on the target device.
 
         Args:
             yamlInput (str): Either a YAML string or path to a YAML file.
@@ -94,16 +248,10 @@ class utPlaneController():
                 self.log.error("Invalid input provided")
                 return False
 
-            if isFile:
-                # It's a file path on target device - use --data-binary with file reference
-                yaml_content = yamlInput
-                cmd = f'curl -X POST -H "Content-Type: application/x-yaml" --data-binary @"{yaml_content}" "http://localhost:{self.port}/api/postKVP"'
-            else:
-                # It's a direct YAML string - escape quotes and send inline
-                yaml_content = yamlInput.replace('"', '\\"')
-                cmd = f'curl -X POST -H "Content-Type: application/x-yaml" --data-binary "{yaml_content}" "http://localhost:{self.port}/api/postKVP"'
+            if self._connection is not None and not isFile:
+                return self._sendHttp(yamlInput)
 
-            result = True
+            cmd = self._curlCommand(yamlInput, isFile)
 
             # Send command
             result = self.session.write(cmd)
@@ -114,3 +262,63 @@ class utPlaneController():
         except Exception as e:
             self.log.error(f"Failed to send message to ut-controller: {str(e)}")
             return False
+
+    def _sendHttp(self, yamlInput: str) -> bool:
+        """
+        Posts a YAML string over the HTTP connection and checks the response status.
+
+        Args:
+            yamlInput (str): The YAML string to post.
+
+        Returns:
+            bool: True if the ut-controller accepted the message, False otherwise.
+        """
+        try:
+            response = self.postKVP(yamlInput)
+        except Exception as e:
+            self.log.error(f"Failed to send message to ut-controller: {str(e)}")
+            return False
+        if 200 <= response["status"] < 300:
+            return True
+        self.log.error(f"ut-controller rejected message: [{response['status']}] {response['body']}")
+        return False
+
+    def _curlCommand(self, yamlInput: str, isFile: bool = False) -> str:
+        """
+        Builds the curl command line to post to the ut-controller from the device shell.
+
+        Args:
+            yamlInput (str): Either a YAML string or path to a YAML file.
+            isFile (bool): Flag indicating if yamlInput is a file path. Defaults to False.
+
+        Returns:
+            str: The curl command.
+        """
+        if isFile:
+            # It's a file path on target device - use --data-binary with file reference
+            return f'curl -X POST -H "Content-Type: application/x-yaml" --data-binary @"{yamlInput}" "http://localhost:{self.port}{KVP_ENDPOINT}"'
+        # It's a direct YAML string - escape quotes and send inline
+        yaml_content = yamlInput.replace('"', '\\"')
+        return f'curl -X POST -H "Content-Type: application/x-yaml" --data-binary "{yaml_content}" "http://localhost:{self.port}{KVP_ENDPOINT}"'
+
+    @staticmethod
+    def _parseResponse(body: str):
+        """
+        Parses a ut-controller response body.
+
+        Args:
+            body (str): The response body.
+
+        Returns:
+            object: The parsed JSON or YAML data. None if the body can't be parsed.
+        """
+        if not body:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            pass
+        try:
+            return yaml.safe_load(body)
+        except yaml.YAMLError:
+            return None
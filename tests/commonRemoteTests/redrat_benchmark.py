@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : redrat_benchmark.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Benchmarks remoteRedRat key presses against the local RedRat
+#*   **          Hub simulator.
+#*   **
+#*   ** python tests/commonRemoteTests/redrat_benchmark.py --keys 100 --latency 0.01
+#* ******************************************************************************
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.remoteControllerModules.redrat import remoteRedRat
+from framework.core.simulators.redratSimulator import DEFAULT_NETBOX, redratHubSimulator
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark remoteRedRat key presses")
+    parser.add_argument("--keys", type=int, default=100, help="key presses to send")
+    parser.add_argument("--latency", type=float, default=0, help="simulated hub latency in seconds")
+    args = parser.parse_args()
+
+    simulator = redratHubSimulator(latency=args.latency)
+    simulator.start()
+    try:
+        remote = remoteRedRat(logModule("redratBenchmark"), {"hub_ip": "127.0.0.1", "hub_port": simulator.port,
+                                                            "netbox_ip": DEFAULT_NETBOX["ip"]})
+        times = []
+        for _ in range(args.keys):
+            start = time.perf_counter()
+            if remote.sendKey('dataset="SKY+" signal="OK"', 1, 0) != True:
+                raise RuntimeError("sendKey failed")
+            times.append((time.perf_counter() - start) * 1000)
+        print("{} keys  mean {:.2f}ms  median {:.2f}ms  max {:.2f}ms  total {:.2f}s".format(
+            args.keys, statistics.mean(times), statistics.median(times), max(times), sum(times) / 1000))
+    finally:
+        simulator.stop()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : remote_benchmark.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Sends every key of a remote's key map to its local simulator,
+#*   **          as sendAllKeys.py does with the hardware, and reports the send
+#*   **          time and the time for each key to arrive.
+#*   **
+#*   ** python tests/commonRemoteTests/remote_benchmark.py olimex --latency 0.01
+#* ******************************************************************************
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+from framework.core.simulators.remoteSimulators import REMOTE_TYPES, getReceivedKeys, startRemoteSimulator, writeKeyMap
+
+def summary(name:str, values:list) -> str:
+    return "{:<8} mean {:.2f}ms  median {:.2f}ms  p90 {:.2f}ms  max {:.2f}ms".format(
+        name, statistics.mean(values), statistics.median(values), statistics.quantiles(values, n=10)[-1], max(values))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send every mapped key to a simulated remote controller")
+    parser.add_argument("remote", choices=REMOTE_TYPES, help="remote controller type")
+    parser.add_argument("--gap", type=float, default=50, help="milliseconds between keys (default: %(default)s)")
+    parser.add_argument("--latency", type=float, default=0, help="simulated latency of each key in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        log = logModule("remoteBenchmark")
+        log.setFilename(tempDir + "/", "benchmark.log")
+        simulator, config = startRemoteSimulator(args.remote, args.latency)
+        remote = None
+        try:
+            keyMapFile = os.path.join(tempDir, "keymap.yml")
+            config.update({"config": keyMapFile, "map": writeKeyMap(keyMapFile, args.remote), "keymap_cache": None})
+            remote = commonRemoteClass(log, config)
+            keys = list(remote.getKeyMap()["codes"].keys())
+            for key in keys:
+                if remote.sendKey(rc[key], delay=args.gap / 1000) != True:
+                    raise RuntimeError("sendKey [{}] failed".format(key))
+            if not simulator.keys.waitForCodes(len(keys), 10):
+                raise RuntimeError("Only [{}] of [{}] keys received".format(len(simulator.keys.getCodes()), len(keys)))
+            received = getReceivedKeys(simulator)
+            if [code for _, code in received] != keys:
+                raise RuntimeError("Keys received out of order")
+            presses = remote.getKeyTimings()[-len(keys):]
+            send = [(press["sent"] - press["actual"]) * 1000 for press in presses]
+            arrive = [(timestamp - press["actual"]) * 1000 for press, (timestamp, _) in zip(presses, received)]
+            print("{} keys sent to {}".format(len(keys), args.remote))
+            print(summary("send", send))
+            print(summary("arrive", arrive))
+        finally:
+            if remote != None and args.remote == "keySimulator":
+                remote.remoteController.session.close()
+            if remote != None and args.remote == "arduino":
+                remote.remoteController.close()
+            simulator.stop()
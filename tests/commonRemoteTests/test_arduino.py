@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_arduino.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the Arduino IR transmitter's raw and framed protocols
+#*   **          against the Arduino simulator.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.remoteControllerModules.arduino import decodeFrame, encodeFrame, remoteArduino
+from framework.core.simulators.arduinoSimulator import arduinoSimulator
+
+class TestArduino(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("arduinoTest")
+
+    def remote(self, simulator, **config):
+        simulator.start()
+        self.addCleanup(simulator.stop)
+        config.update({"port": simulator.port, "baudrate": 115200})
+        remote = remoteArduino(self.log, config)
+        self.addCleanup(remote.close)
+        return remote
+
+    def test_frames(self):
+        """
+        Test frames decode to their fields, and corrupted frames are rejected.
+        """
+        frame = encodeFrame("K", 12, "dataset,POWER")
+        self.assertEqual(decodeFrame(frame), ["K", "12", "dataset,POWER"])
+        self.assertIsNone(decodeFrame(frame.replace(b"POWER", b"POWEr")))
+
+    def test_raw_boot_wait(self):
+        """
+        Test raw keys wait for the board to start once, from when the port was opened.
+        """
+        simulator = arduinoSimulator()
+        remote = self.remote(simulator, boot_timeout=0.3)
+        start = time.monotonic()
+        self.assertTrue(remote.sendKey("POWER", 1, 0.05))
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        start = time.monotonic()
+        self.assertTrue(remote.sendKey("OK", 1, 0))
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertTrue(simulator.keys.waitForCodes(2, 1))
+        self.assertEqual(simulator.keys.getCodes(), ["POWER", "OK"])
+
+    def test_framed_pipelined(self):
+        """
+        Test framed keys are sent ahead of their acks, at the speed of the IR transmission.
+        """
+        simulator = arduinoSimulator("framed", irTime=0.02, bootTime=0.2)
+        remote = self.remote(simulator, protocol="framed", window=4)
+        self.assertTrue(remote.sendKey("POWER", 1, 0))
+        codes = [("KEY{}".format(key), 0, 0) for key in range(20)]
+        start = time.monotonic()
+        self.assertTrue(remote.sendKeys(codes))
+        # One key at a time, waiting for each ack, would take at least as long as transmitting them
+        self.assertLess(time.monotonic() - start, 20 * 0.02 + 0.15)
+        self.assertEqual(simulator.keys.getCodes(), ["POWER"] + [code for code, _, _ in codes])
+
+    def test_framed_board_queue(self):
+        """
+        Test no more keys are in flight than the board can queue, whatever the window.
+        """
+        simulator = arduinoSimulator("framed", irTime=0.02, queueSize=2)
+        remote = self.remote(simulator, protocol="framed", window=4)
+        codes = [("KEY{}".format(key), 0, 0) for key in range(10)]
+        self.assertTrue(remote.sendKeys(codes))
+        self.assertEqual(remote.boardQueue, 2)
+        self.assertEqual(simulator.keys.getCodes(), [code for code, _, _ in codes])
+
+    def test_framed_failures(self):
+        """
+        Test refused and lost keys fail.
+        """
+        simulator = arduinoSimulator("framed")
+        remote = self.remote(simulator, protocol="framed", ack_timeout=0.3)
+        simulator.faults.failNext("error")
+        self.assertFalse(remote.sendKey("POWER", 1, 0))
+        simulator.faults.failNext("drop")
+        start = time.monotonic()
+        self.assertFalse(remote.sendKeys([("UP", 0, 0), ("DOWN", 0, 0)]))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(remote.sendKey("OK", 1, 0))
+        self.assertEqual(simulator.keys.getCodes()[-1], "OK")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_commonRemote.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests commonRemoteClass.sendKeys sends key sequences in one
+#*   **          operation per remote.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+from framework.core.simulators.pduSimulator import pduSimulator
+from framework.core.simulators.redratSimulator import DEFAULT_NETBOX, redratHubSimulator
+
+REDRAT_KEYMAP = os.path.join(path, "examples", "configs", "example_redrat_keymap.yml")
+
+class TestCommonRemote(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("commonRemoteTest")
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.log.setFilename(self.tempDir.name + "/", "test.log")
+        self.cacheDir = os.path.join(self.tempDir.name, "cache")
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_redrat_sequence(self):
+        """
+        Test a sequence is mapped and sent in order, waiting the gap after each key.
+        """
+        simulator = redratHubSimulator()
+        simulator.start()
+        self.addCleanup(simulator.stop)
+        remote = commonRemoteClass(self.log, {"type": "redrat", "hub_ip": "127.0.0.1", "hub_port": simulator.port,
+                                              "netbox_ip": DEFAULT_NETBOX["ip"], "map": "XfinityXR2", "config": REDRAT_KEYMAP,
+                                              "keymap_cache": self.cacheDir})
+        start = time.monotonic()
+        self.assertTrue(remote.sendKeys([(rc.ARROW_DOWN, 0, 100), (rc.SELECT, 0, 0), rc.CHANNEL_UP]))
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertEqual([command.split('signal=')[1].split()[0] for command in simulator.commands],
+                         ['"Down"', '"OK"', '"Chan+"'])
+
+    def test_unmapped_key(self):
+        """
+        Test a sequence with an unmapped key fails before any key is sent.
+        """
+        simulator = redratHubSimulator()
+        simulator.start()
+        self.addCleanup(simulator.stop)
+        remote = commonRemoteClass(self.log, {"type": "redrat", "hub_ip": "127.0.0.1", "hub_port": simulator.port,
+                                              "netbox_ip": DEFAULT_NETBOX["ip"], "map": "XfinityXR2", "config": REDRAT_KEYMAP,
+                                              "keymap_cache": self.cacheDir})
+        self.assertFalse(remote.sendKeys([rc.SELECT, rc.THREE_D]))
+        self.assertEqual(simulator.commands, [])
+
+    def test_olimex_one_connection(self):
+        """
+        Test an Olimex board receives the whole sequence over one connection.
+        """
+        board = pduSimulator("olimex")
+        board.start()
+        self.addCleanup(board.stop)
+        remote = commonRemoteClass(self.log, {"type": "olimex", "ip": "127.0.0.1", "port": board.port})
+        self.assertTrue(remote.sendKeys([rc.ARROW_UP, rc.ARROW_UP, rc.SELECT]))
+        self.assertEqual(board.connectionCount, 1)
+        self.assertEqual(board.keys.getCodes(), ["ARROW_UP", "ARROW_UP", "SELECT"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_keyLatencyBenchmark.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests key to screen latency is measured against a synthetic
+#*   **          video source that responds to keys after a set delay.
+#*   **
+#* ******************************************************************************
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import numpy as np
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.keyLatencyBenchmark import keyLatencyBenchmark
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+
+class syntheticScreen():
+    """
+    A 200 frames per second video source. Each key draws a box `latency`
+    seconds after it is sent, at `box` (left, top, right, bottom).
+    """
+
+    def __init__(self, latency:float=0.1, box:tuple=(40, 40, 120, 100)):
+        self.latency = latency
+        self.box = box
+        self.pending = []
+        self.lock = threading.Lock()
+        self.frame = np.zeros((180, 320, 3), dtype=np.uint8)
+
+    def sendKey(self, keycode, delay=0):
+        with self.lock:
+            self.pending.append(time.monotonic() + self.latency)
+        return True
+
+    def read(self):
+        time.sleep(0.005)
+        with self.lock:
+            while self.pending and self.pending[0] <= time.monotonic():
+                self.pending.pop(0)
+                left, top, right, bottom = self.box
+                self.frame = self.frame.copy()
+                self.frame[top:bottom, left:right] = 255 - self.frame[top:bottom, left:right]
+            return True, self.frame
+
+class TestKeyLatencyBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("keyLatencyBenchmarkTest")
+        self.outputPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.outputPath)
+
+    def test_latency(self):
+        """
+        Test each press is timed to the first changed frame, and the report is written.
+        """
+        screen = syntheticScreen(latency=0.1)
+        benchmark = keyLatencyBenchmark(screen, screen, region=(0, 0, 160, 120), log=self.log,
+                                        settleTime=0.05, outputPath=self.outputPath)
+        latencies = benchmark.run(rc.GUIDE, presses=5)
+        self.assertEqual(len(latencies), 5)
+        for latency in latencies:
+            self.assertGreaterEqual(latency, 0.1)
+            self.assertLess(latency, 0.15)
+        report = benchmark.getReport()["GUIDE"]
+        self.assertEqual(report["detected"], 5)
+        self.assertLessEqual(report["min"], report["median"])
+        with open(os.path.join(self.outputPath, "key_latency_benchmark.csv")) as csvFile:
+            self.assertEqual(len(csvFile.readlines()), 6)
+
+    def test_change_outside_region(self):
+        """
+        Test changes outside the watched region are ignored.
+        """
+        screen = syntheticScreen(latency=0.05, box=(200, 120, 300, 170))
+        benchmark = keyLatencyBenchmark(screen, screen, region=(0, 0, 160, 120), log=self.log,
+                                        timeout=0.5, settleTime=0.05, outputPath=self.outputPath)
+        benchmark.start()
+        try:
+            self.assertEqual(benchmark.measure(rc.GUIDE, presses=2), [None, None])
+        finally:
+            benchmark.stop()
+        self.assertEqual(benchmark.getReport()["GUIDE"]["detected"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
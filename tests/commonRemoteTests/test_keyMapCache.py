@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_keyMapCache.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests key maps are compiled to wire codes, validated against
+#*   **          rcCode and cached by file contents.
+#*   **
+#* ******************************************************************************
+
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.keyMapCache import compileKeyMaps, loadKeyMaps
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+
+KEYMAP = """remoteMaps:
+  remoteCommanderMap0:
+    name: "prefixed"
+    prefix: "dataset=\\"Test\\" "
+    codes:
+      SELECT: "signal=\\"OK\\""
+      ARROW_UP: "signal=\\"Up\\""
+      NOT_A_KEY: "signal=\\"Nothing\\""
+  remoteCommanderMap1:
+    name: "plain"
+    codes:
+      SELECT: "OK"
+      POWER:
+"""
+
+class TestKeyMapCache(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("keyMapCacheTest")
+        self.tempDir = tempfile.mkdtemp()
+        self.cacheDir = os.path.join(self.tempDir, "cache")
+        self.keymapFile = os.path.join(self.tempDir, "keymap.yml")
+        with open(self.keymapFile, "w") as keymap:
+            keymap.write(KEYMAP)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def test_compile(self):
+        """
+        Test prefixes are applied, and codes that aren't valid are left out.
+        """
+        maps = compileKeyMaps({"map0": {"name": "prefixed", "prefix": "p:", "codes": {"SELECT": "OK", "BAD": "x", "POWER": None}},
+                               "map1": {"codes": {"SELECT": "OK"}}}, self.log)
+        self.assertEqual(len(maps), 1)
+        self.assertEqual(maps[0]["wireCodes"], {"SELECT": "p:OK"})
+        self.assertEqual(maps[0]["codes"]["BAD"], "x")
+
+    def test_cache(self):
+        """
+        Test the compiled maps are cached, and recompiled when the file changes.
+        """
+        maps = loadKeyMaps(self.keymapFile, self.cacheDir, self.log)
+        self.assertEqual(len(os.listdir(self.cacheDir)), 1)
+        self.assertEqual(loadKeyMaps(self.keymapFile, self.cacheDir, self.log), maps)
+        self.assertEqual(maps[1]["wireCodes"], {"SELECT": "OK"})
+        with open(self.keymapFile, "a") as keymap:
+            keymap.write("      ARROW_DOWN: \"Down\"\n")
+        changed = loadKeyMaps(self.keymapFile, self.cacheDir, self.log)
+        self.assertEqual(changed[1]["wireCodes"], {"SELECT": "OK", "ARROW_DOWN": "Down"})
+        self.assertEqual(len(os.listdir(self.cacheDir)), 2)
+
+    def test_cache_not_json(self):
+        """
+        Test a cache file that isn't JSON, e.g. a pickle, is recompiled rather than loaded.
+        """
+        maps = loadKeyMaps(self.keymapFile, self.cacheDir, self.log)
+        cachePath = os.path.join(self.cacheDir, os.listdir(self.cacheDir)[0])
+        with open(cachePath, "wb") as cacheFile:
+            pickle.dump(maps, cacheFile)
+        self.assertEqual(loadKeyMaps(self.keymapFile, self.cacheDir, self.log), maps)
+        with open(cachePath) as cacheFile:
+            self.assertEqual(json.load(cacheFile), maps)
+
+    def test_cache_not_written(self):
+        """
+        Test maps JSON can't hold, e.g. with a YAML date, are still loaded and leave no partial cache file.
+        """
+        with open(self.keymapFile, "a") as keymap:
+            keymap.write("    date: 2026-10-19\n")
+        maps = loadKeyMaps(self.keymapFile, self.cacheDir, self.log)
+        self.assertEqual(maps[1]["wireCodes"], {"SELECT": "OK"})
+        self.assertEqual(os.listdir(self.cacheDir), [])
+
+    def test_remote_mapping(self):
+        """
+        Test commonRemote sends the compiled codes of the selected map.
+        """
+        remote = commonRemoteClass(self.log, {"type": "none", "config": self.keymapFile, "map": "prefixed",
+                                              "keymap_cache": self.cacheDir})
+        self.assertEqual(remote.remoteMap.getMappedKey(rc.SELECT.name), 'dataset="Test" signal="OK"')
+        self.assertIsNone(remote.remoteMap.getMappedKey(rc.POWER.name))
+        self.assertFalse(remote.sendKey(rc.POWER, delay=0))
+        remote.setKeyMap("plain")
+        self.assertEqual(remote.getKeyMap()["name"], "plain")
+        self.assertEqual(remote.remoteMap.getMappedKey(rc.SELECT.name), "OK")
+
+if __name__ == '__main__':
+    unittest.main()
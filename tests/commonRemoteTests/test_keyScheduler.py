@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_keyScheduler.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests key presses are planned on the monotonic clock, so slow
+#*   **          sends don't make the key timing drift.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.keyScheduler import keyScheduler
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+
+class TestKeyScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("keySchedulerTest")
+
+    def test_plan_hold(self):
+        """
+        Test a held key auto-repeats until released, and the gap follows the release.
+        """
+        scheduler = keyScheduler(self.log, repeatInterval=0.1)
+        presses, duration = scheduler.plan([("UP", 0, 200), ("OK", 350, 100), ("DOWN", 0, 0)])
+        self.assertEqual([code for code, offset in presses], ["UP", "OK", "OK", "OK", "OK", "DOWN"])
+        for (code, offset), expected in zip(presses, [0, 0.2, 0.3, 0.4, 0.5, 0.65]):
+            self.assertAlmostEqual(offset, expected)
+        self.assertAlmostEqual(duration, 0.65)
+
+    def test_no_drift(self):
+        """
+        Test the time each send takes doesn't delay the following presses.
+        """
+        scheduler = keyScheduler(self.log)
+        sent = []
+
+        def send(code):
+            sent.append(time.monotonic())
+            time.sleep(0.03)
+            return True
+
+        start = time.monotonic()
+        self.assertTrue(scheduler.run([("OK", 0, 50)] * 10, send))
+        # Sleeping after each send would take 10 x (30 + 50)ms
+        self.assertLess(time.monotonic() - start, 0.65)
+        self.assertAlmostEqual(sent[-1] - sent[0], 0.45, delta=0.04)
+        self.assertEqual(len(scheduler.history), 10)
+        self.assertLess(scheduler.getStats()["late_max_ms"], 40)
+
+    def test_failure_stops(self):
+        """
+        Test the sequence stops at the first failed press, which is recorded.
+        """
+        scheduler = keyScheduler(self.log)
+        self.assertFalse(scheduler.run([("UP", 0, 0), ("BAD", 0, 0), ("DOWN", 0, 0)], lambda code: code != "BAD"))
+        self.assertEqual([(press["code"], press["result"]) for press in scheduler.history], [("UP", True), ("BAD", False)])
+
+    def test_common_remote_timings(self):
+        """
+        Test commonRemoteClass.sendKey plans repeats from the first press, and records them.
+        """
+        remote = commonRemoteClass(self.log, {"type": "none"})
+        self.assertTrue(remote.sendKey(rc.SELECT, delay=0.05, repeat=4))
+        timings = remote.getKeyTimings()
+        self.assertEqual([press["code"] for press in timings], ["SELECT"] * 4)
+        for index, press in enumerate(timings):
+            self.assertAlmostEqual(press["planned"] - timings[0]["planned"], index * 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
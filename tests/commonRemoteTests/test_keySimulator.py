@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_keySimulator.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the keySimulator remote's prompt and helper send modes
+#*   **          against a fake DUT reached over SSH.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.keyScheduler import keyScheduler
+from framework.core.logModule import logModule
+from framework.core.remoteControllerModules.keySimulator import remoteKeySimulator
+from framework.core.simulators.sshSimulator import keySimulatorHost
+
+class TestKeySimulator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.host = keySimulatorHost()
+        cls.host.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.host.stop()
+
+    def setUp(self):
+        self.log = logModule("keySimulatorTest")
+        self.sentBefore = len(self.host.getKeys())
+
+    def remote(self, **config):
+        config.update({"ip": "127.0.0.1", "port": self.host.port, "username": "root", "password": ""})
+        remote = remoteKeySimulator(self.log, config)
+        self.addCleanup(remote.session.close)
+        return remote
+
+    def sentKeys(self, count:int=0):
+        # Prompt mode can return on the prompt of its leading blank line, before the last key has run
+        self.host.keys.waitForCodes(self.sentBefore + count, 2)
+        return self.host.getKeys()[self.sentBefore:]
+
+    def test_prompt_mode(self):
+        """
+        Test keys are sent through the interactive shell by default.
+        """
+        remote = self.remote()
+        self.assertTrue(remote.sendKey("OK", 2, 0))
+        self.assertEqual(self.sentKeys(2), ["OK", "OK"])
+
+    def test_helper_mode(self):
+        """
+        Test the helper sends repeats and sequences, confirmed without prompt matching.
+        """
+        remote = self.remote(send_mode="helper")
+        start = time.monotonic()
+        self.assertTrue(remote.sendKey("OK", 20, 0))
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(remote.sendKeys([("UP", 0, 0), ("DOWN", 0, 100)]))
+        self.assertEqual(self.sentKeys(), ["OK"] * 20 + ["UP", "DOWN"])
+
+    def test_helper_timings(self):
+        """
+        Test helper presses are recorded as they are acknowledged, and the last gap is waited out.
+        """
+        remote = self.remote(send_mode="helper")
+        scheduler = keyScheduler(self.log)
+        start = time.monotonic()
+        self.assertTrue(remote.sendKeys([("UP", 0, 100), ("DOWN", 0, 100)], scheduler))
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual([(press["code"], press["result"]) for press in scheduler.history], [("UP", True), ("DOWN", True)])
+        self.assertAlmostEqual(scheduler.history[1]["planned"] - scheduler.history[0]["planned"], 0.1)
+        # DOWN is acknowledged once the helper has waited the gap after UP
+        self.assertGreaterEqual(scheduler.history[1]["actual"] - scheduler.history[0]["actual"], 0.05)
+
+    def test_helper_cancelled(self):
+        """
+        Test setting the cancelEvent stops a helper sequence, dropping the keys still queued.
+        """
+        remote = self.remote(send_mode="helper")
+        scheduler = keyScheduler(self.log)
+        timer = threading.Timer(0.25, scheduler.cancelEvent.set)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        start = time.monotonic()
+        self.assertFalse(remote.sendKeys([("OK", 0, 100)] * 10, scheduler))
+        self.assertLess(time.monotonic() - start, 0.6)
+        time.sleep(0.3)
+        self.assertLess(len(self.sentKeys()), 10)
+
+    def test_helper_restarted(self):
+        """
+        Test the helper is started again when it has exited.
+        """
+        remote = self.remote(send_mode="helper")
+        self.assertTrue(remote.sendKey("OK", 1, 0))
+        remote._helperIn.close()
+        remote._helperOut.channel.close()
+        self.assertTrue(remote.sendKey("BACK", 1, 0))
+        self.assertEqual(self.sentKeys(), ["OK", "BACK"])
+
+if __name__ == '__main__':
+    unittest.main()
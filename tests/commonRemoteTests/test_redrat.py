@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_redrat.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the RedRat Hub client reads each framed reply as soon as
+#*   **          it ends, against the local RedRat Hub simulator.
+#*   **
+#* ******************************************************************************
+
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.remoteControllerModules.redrat import HubClient, remoteRedRat
+from framework.core.simulators.redratSimulator import DEFAULT_NETBOX, redratHubSimulator
+
+class TestRedRat(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("redratTest")
+        self.simulator = redratHubSimulator()
+        self.simulator.start()
+
+    def tearDown(self):
+        self.simulator.stop()
+
+    def remote(self, **config):
+        config.update({"hub_ip": "127.0.0.1", "hub_port": self.simulator.port, "netbox_ip": DEFAULT_NETBOX["ip"]})
+        return remoteRedRat(self.log, config)
+
+    def test_keys_not_delayed(self):
+        """
+        Test each key returns as soon as the hub replies, rather than after a read timeout.
+        """
+        remote = self.remote()
+        start = time.monotonic()
+        for _ in range(20):
+            self.assertTrue(remote.sendKey('dataset="SKY+" signal="OK"', 1, 0))
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(self.simulator.commands), 20)
+        self.assertIn('ip="{}" dataset="SKY+" signal="OK" output="1"'.format(DEFAULT_NETBOX["ip"]), self.simulator.commands)
+
+    def test_error_reply(self):
+        """
+        Test an error reply fails the key immediately.
+        """
+        remote = self.remote()
+        self.simulator.faults.failNext("error")
+        start = time.monotonic()
+        self.assertFalse(remote.sendKey('dataset="SKY+" signal="OK"', 1, 0))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(remote.sendKey('dataset="SKY+" signal="OK"', 1, 0))
+
+    def test_unknown_netbox(self):
+        """
+        Test connecting fails when the netbox isn't on the hub.
+        """
+        with self.assertRaises(ConnectionError):
+            remoteRedRat(self.log, {"hub_ip": "127.0.0.1", "hub_port": self.simulator.port, "netbox_name": "missing"})
+
+    def test_timeout(self):
+        """
+        Test a reply that never comes times out with an empty reply.
+        """
+        remote = self.remote(hub_timeout=0.2)
+        self.simulator.faults.failNext("timeout")
+        self.assertFalse(remote.sendKey('dataset="SKY+" signal="OK"', 1, 0))
+
+    def test_shared_client(self):
+        """
+        Test threads sharing a client each get the reply to their own messages.
+        """
+        self.simulator.latency = 0.002
+        client = HubClient()
+        client.start("127.0.0.1", self.simulator.port)
+        self.addCleanup(client.stop)
+        command = 'ip="{}" dataset="SKY+" signal="OK" output="1"'.format(DEFAULT_NETBOX["ip"])
+        checks = {'hubquery="list redrats"': lambda reply: reply.startswith("{") and reply.strip().endswith("}"),
+                  command: lambda reply: reply == "OK\n"}
+        replies = []
+        def send(message):
+            for _ in range(20):
+                replies.append(checks[message](client.send_message(message)))
+        threads = [threading.Thread(target=send, args=(message,)) for message in checks for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(replies), 80)
+        self.assertTrue(all(replies))
+
+    def test_buffered_replies(self):
+        """
+        Test bytes after the end of a reply are kept for the next reply.
+        """
+        client = HubClient()
+        client._socket, hub = socket.socketpair()
+        client._socket.settimeout(1)
+        hub.sendall(b"OK\n{\nline 1\nline 2\n}\nError")
+        self.assertEqual(client.read_reply(), "OK\n")
+        self.assertEqual(client.read_reply(), "{\nline 1\nline 2\n}\n")
+        hub.sendall(b" sending IR signal\n")
+        self.assertEqual(client.read_reply(), "Error sending IR signal\n")
+        hub.close()
+        client._socket.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_remoteGroup.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests a remote group sends to every device concurrently, with
+#*   **          RedRat devices fanned out over one hub connection.
+#*   **
+#* ******************************************************************************
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+from framework.core.remoteGroup import remoteGroup
+from framework.core.simulators.redratSimulator import DEFAULT_NETBOX, redratHubSimulator
+
+KEYMAP = os.path.join(path, "examples", "configs", "example_redrat_keymap.yml")
+SECOND_NETBOX = {"name": "IRNetBox IV 21090", "ip": "192.168.0.3", "mac": "70-B3-D5-FD-10-11"}
+
+class TestRemoteGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("remoteGroupTest")
+        self.cacheDir = tempfile.mkdtemp()
+        self.hubs = []
+
+    def tearDown(self):
+        for hub in self.hubs:
+            hub.stop()
+        shutil.rmtree(self.cacheDir)
+
+    def hub(self, **kwargs):
+        hub = redratHubSimulator(netboxes=[DEFAULT_NETBOX, SECOND_NETBOX], **kwargs)
+        hub.start()
+        self.hubs.append(hub)
+        return hub
+
+    def redrat(self, hub, netbox:dict, output:int):
+        return commonRemoteClass(self.log, {"type": "redrat", "hub_ip": "127.0.0.1", "hub_port": hub.port,
+                                            "netbox_ip": netbox["ip"], "output": output, "map": "XfinityXR2",
+                                            "config": KEYMAP, "keymap_cache": self.cacheDir})
+
+    def sent(self, hub):
+        return [command for command in hub.commands if "hubquery" not in command]
+
+    def test_fan_out(self):
+        """
+        Test devices on one netbox share a command, and every device's result is reported.
+        """
+        hub = self.hub()
+        group = remoteGroup(self.log, {"slot1": self.redrat(hub, DEFAULT_NETBOX, 1),
+                                       "slot2": self.redrat(hub, DEFAULT_NETBOX, 2),
+                                       "slot3": self.redrat(hub, SECOND_NETBOX, 1),
+                                       "slot4": commonRemoteClass(self.log, {"type": "none"})})
+        results = group.sendKey(rc.SELECT, delay=0, repeat=2)
+        self.assertEqual(sorted(results), ["slot1", "slot2", "slot3", "slot4"])
+        self.assertTrue(all(result["result"] for result in results.values()))
+        signal = 'dataset="XfinityXR2" signal="OK"'
+        self.assertEqual(self.sent(hub), ['ip="{}" {} output="1,2"'.format(DEFAULT_NETBOX["ip"], signal),
+                                          'ip="{}" {} output="1"'.format(SECOND_NETBOX["ip"], signal)] * 2)
+
+    def test_failure_per_device(self):
+        """
+        Test a failed command fails only the devices it was sent for.
+        """
+        hub = self.hub()
+        group = remoteGroup(self.log, {"slot1": self.redrat(hub, DEFAULT_NETBOX, 1),
+                                       "slot2": self.redrat(hub, SECOND_NETBOX, 1)})
+        hub.faults.failNext("error")
+        results = group.sendKeys([rc.ARROW_UP, rc.ARROW_DOWN])
+        self.assertFalse(results["slot1"]["result"])
+        self.assertTrue(results["slot2"]["result"])
+        self.assertEqual(len(self.sent(hub)), 3)
+
+    def test_unmapped_key(self):
+        """
+        Test a device whose key isn't mapped is failed and logged.
+        """
+        hub = self.hub()
+        group = remoteGroup(self.log, {"slot1": self.redrat(hub, DEFAULT_NETBOX, 1),
+                                       "slot2": self.redrat(hub, DEFAULT_NETBOX, 2)})
+        with self.assertLogs("remoteGroupTest", level="ERROR") as logs:
+            results = group.sendKey(rc.THREE_D, delay=0)
+        self.assertFalse(any(result["result"] for result in results.values()))
+        self.assertTrue(any("[slot1] key [THREE_D] not mapped" in record.getMessage() for record in logs.records))
+        self.assertEqual(self.sent(hub), [])
+
+    def test_concurrent(self):
+        """
+        Test devices on different hubs are sent to at the same time.
+        """
+        members = {"slot{}".format(slot): self.redrat(self.hub(latency=0.2), DEFAULT_NETBOX, 1) for slot in range(4)}
+        group = remoteGroup(self.log, members)
+        start = time.monotonic()
+        results = group.sendKey(rc.POWER, delay=0)
+        self.assertLess(time.monotonic() - start, 0.6)
+        for result in results.values():
+            self.assertTrue(result["result"])
+            self.assertGreaterEqual(result["duration"], 0.2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_remoteSimulators.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests every remote controller type sends its keys to its
+#*   **          simulator, in order and after they were sent.
+#*   **
+#* ******************************************************************************
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+from framework.core.simulators.remoteSimulators import REMOTE_TYPES, getReceivedKeys, startRemoteSimulator, writeKeyMap
+
+KEYS = [rc.POWER, rc.SELECT, rc.ARROW_UP, rc.NUM_1]
+
+class TestRemoteSimulators(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("remoteSimulatorsTest")
+        self.tempDir = tempfile.mkdtemp()
+        self.log.setFilename(self.tempDir + "/", "test.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def sendKeys(self, remoteType:str):
+        simulator, config = startRemoteSimulator(remoteType)
+        self.addCleanup(simulator.stop)
+        keyMapFile = os.path.join(self.tempDir, "keymap.yml")
+        config.update({"config": keyMapFile, "map": writeKeyMap(keyMapFile, remoteType),
+                       "keymap_cache": os.path.join(self.tempDir, "cache")})
+        remote = commonRemoteClass(self.log, config)
+        if remoteType == "keySimulator":
+            self.addCleanup(remote.remoteController.session.close)
+        if remoteType == "arduino":
+            self.addCleanup(remote.remoteController.close)
+        start = time.monotonic()
+        self.assertTrue(remote.sendKeys(KEYS))
+        self.assertTrue(simulator.keys.waitForCodes(len(KEYS), 5))
+        received = getReceivedKeys(simulator)
+        self.assertEqual([code for _, code in received], [key.name for key in KEYS])
+        times = [timestamp for timestamp, _ in received]
+        self.assertGreaterEqual(times[0], start)
+        self.assertEqual(times, sorted(times))
+
+    def test_remote_types(self):
+        """
+        Test each remote type's keys are received by its simulator.
+        """
+        for remoteType in REMOTE_TYPES:
+            with self.subTest(remoteType=remoteType):
+                self.sendKeys(remoteType)
+
+if __name__ == '__main__':
+    unittest.main()
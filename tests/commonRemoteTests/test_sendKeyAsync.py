@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_sendKeyAsync.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests keys queued with sendKeyAsync are sent in order in the
+#*   **          background, and can be cancelled.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.commonRemote import commonRemoteClass
+from framework.core.logModule import logModule
+from framework.core.rcCodes import rcCode as rc
+
+class TestSendKeyAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("sendKeyAsyncTest")
+        self.remote = commonRemoteClass(self.log, {"type": "none"})
+
+    def tearDown(self):
+        self.remote.cancelKeys()
+
+    def test_background_order(self):
+        """
+        Test queued keys return at once, then run in order, calling back when done.
+        """
+        done = threading.Event()
+        start = time.monotonic()
+        first = self.remote.sendKeyAsync(rc.SELECT, delay=0.1, repeat=2)
+        second = self.remote.sendKeysAsync([(rc.ARROW_UP, 0, 50), rc.ARROW_DOWN], callback=lambda future: done.set())
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertTrue(done.wait(2))
+        self.assertTrue(first.result())
+        self.assertTrue(second.result())
+        self.assertEqual([press["code"] for press in self.remote.getKeyTimings()], ["SELECT", "SELECT", "ARROW_UP", "ARROW_DOWN"])
+
+    def test_cancel(self):
+        """
+        Test cancelKeys stops the running key and cancels the queued keys.
+        """
+        running = self.remote.sendKeyAsync(rc.SELECT, delay=0.1, repeat=50)
+        queued = self.remote.sendKeyAsync(rc.ARROW_UP)
+        time.sleep(0.25)
+        start = time.monotonic()
+        self.assertEqual(self.remote.cancelKeys(), 1)
+        self.assertFalse(running.result(1))
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertTrue(queued.cancelled())
+        self.assertLess(len(self.remote.getKeyTimings()), 10)
+        # Keys sent after a cancel aren't affected by it
+        self.assertTrue(self.remote.sendKey(rc.SELECT, delay=0))
+
+    def test_cancel_racing_completion(self):
+        """
+        Test cancelKeys made as a queued key finishes leaves later keys working.
+        """
+        for attempt in range(50):
+            self.remote.sendKeyAsync(rc.SELECT, delay=0)
+            time.sleep(attempt % 5 / 10000)
+            self.remote.cancelKeys()
+            self.remote.waitForKeys(1)
+            self.assertTrue(self.remote.sendKey(rc.SELECT, delay=0))
+
+    def test_cancel_leaves_sync_keys(self):
+        """
+        Test cancelKeys doesn't stop keys sent with sendKey on another thread.
+        """
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.remote.sendKey(rc.SELECT, delay=0.05, repeat=6)))
+        thread.start()
+        running = self.remote.sendKeyAsync(rc.ARROW_UP, delay=0.05, repeat=6)
+        time.sleep(0.1)
+        self.remote.cancelKeys()
+        thread.join(2)
+        self.assertFalse(running.result(1))
+        self.assertEqual(results, [True])
+
+    def test_wait_for_keys(self):
+        """
+        Test waitForKeys waits for the queue to be sent.
+        """
+        self.remote.sendKeyAsync(rc.SELECT, delay=0.05, repeat=3)
+        self.remote.sendKeyAsync(rc.ARROW_DOWN, delay=0)
+        self.assertTrue(self.remote.waitForKeys(2))
+        self.assertEqual(len(self.remote.getKeyTimings()), 4)
+
+if __name__ == '__main__':
+    unittest.main()
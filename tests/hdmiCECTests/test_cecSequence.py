@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_cecSequence.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests CECInterface.sendSequence reports the messages that
+#*   **          failed to send.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.streamToFile import StreamToFile
+from framework.core.hdmicecModules.abstractCECController import CECInterface
+
+class failingCECController(CECInterface):
+    """
+    Records sent messages. Sending opCode 0x44 returns False, sending 0x45 raises.
+    """
+
+    def __init__(self, logger, streamLogger):
+        super().__init__('/dev/null', logger, streamLogger)
+        self.sent = []
+
+    def sendMessage(self, sourceAddress, destAddress, opCode, payload=None, deviceType=None):
+        if opCode == '0x45':
+            raise OSError('adaptor disconnected')
+        if opCode == '0x44':
+            return False
+        self.sent.append(opCode)
+
+    def listDevices(self, refresh=False):
+        return []
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+class TestCECSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempDir.cleanup)
+        self.log = logModule('cecSequence')
+        stream = StreamToFile(os.path.join(self.tempDir.name, 'cec.log'), log=self.log)
+        self.cec = failingCECController(self.log, stream)
+
+    def test_failed_messages(self):
+        """
+        Test messages that fail to send, or raise, have no sent time.
+        """
+        results = self.cec.sendSequence([('1', '0', '0x04', None, 0),
+                                         ('1', '0', '0x44', ['0x01'], 10),
+                                         ('1', '0', '0x45', ['0x01'], 10),
+                                         ('1', '0', '0x36', None, 10)])
+        self.assertEqual(self.cec.sent, ['0x04', '0x36'])
+        self.assertEqual([result['sent'] is not None for result in results], [True, False, False, True])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_cecTopology.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the CEC topology is updated correctly from scans and
+#*   **          observed cec-client traffic.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.hdmicecModules.cecTopology import CECTopology
+
+SCAN_RESULT = [{'logical address': '0',
+                'physical address': '0.0.0.0',
+                'name': 'TV',
+                'osd string': 'TV',
+                'vendor': 'Samsung',
+                'CEC version': '1.4',
+                'power status': 'on',
+                'language': 'eng',
+                'active source': False}]
+
+class TestCECTopology(unittest.TestCase):
+
+    def setUp(self):
+        self.topology = CECTopology(ttl=300)
+
+    def test_stale_until_scanned(self):
+        """
+        Test the topology is stale until a scan has been recorded.
+        """
+        self.assertTrue(self.topology.isStale())
+        self.topology.updateFromScan(SCAN_RESULT)
+        self.assertFalse(self.topology.isStale())
+        self.topology.invalidate()
+        self.assertTrue(self.topology.isStale())
+
+    def test_parse_traffic_line(self):
+        """
+        Test cec-client TRAFFIC lines are split into source, destination, opCode and payload.
+        """
+        frame = CECTopology.parseTrafficLine('TRAFFIC: [          6307]\t>> 4f:84:10:00:04')
+        self.assertEqual(frame, ('4', 'F', 0x84, [0x10, 0x00, 0x04]))
+        frame = CECTopology.parseTrafficLine('TRAFFIC: [          6307]\t<< 14')
+        self.assertEqual(frame, ('1', '4', None, []))
+        self.assertIsNone(CECTopology.parseTrafficLine('DEBUG:   [          6307]\twaiting for input'))
+
+    def test_incremental_updates(self):
+        """
+        Test observed traffic adds and updates devices without a rescan.
+        """
+        self.topology.updateFromScan(SCAN_RESULT)
+        self.topology.processLine('TRAFFIC: [  1]\t>> 4f:84:10:00:04')
+        self.topology.processLine('TRAFFIC: [  2]\t>> 40:47:50:6c:61:79:65:72')
+        self.topology.processLine('TRAFFIC: [  3]\t>> 4f:82:10:00')
+        self.topology.processLine('TRAFFIC: [  4]\t>> 40:36')
+        devices = self.topology.listDevices()
+        self.assertEqual([device['logical address'] for device in devices], ['0', '4'])
+        tv, player = devices
+        self.assertEqual(player['physical address'], '1.0.0.0')
+        self.assertEqual(player['name'], 'Player')
+        self.assertTrue(player['active source'])
+        self.assertFalse(tv['active source'])
+        self.assertEqual(tv['power status'], 'standby')
+
+    def test_unregistered_source_ignored(self):
+        """
+        Test frames from the unregistered address don't create devices.
+        """
+        self.topology.processLine('TRAFFIC: [  1]\t>> ff:84:ff:ff:04')
+        self.assertEqual(self.topology.listDevices(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_remoteCECClient.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the remote cec-client runs on its own SSH exec channel,
+#*   **          against the SSH simulator with a stand-in cec-client.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.streamToFile import StreamToFile
+from framework.core.hdmicecModules import remoteCECClient
+from framework.core.hdmicecModules.remoteCECClient import RemoteCECClient
+from framework.core.simulators.sshSimulator import keySimulatorHost
+
+ADAPTOR = "/dev/ttyACM0"
+
+# Lists the adaptor for -l, otherwise echoes each command it's given until "q".
+# stdbuf reports the buffering it set up in _STDBUF_O.
+CEC_CLIENT = """#!/bin/sh
+if [ "$1" = "-l" ]; then
+    printf 'Found devices: 1\\n\\ndevice:              1\\ncom port:            {adaptor}\\nvendor id:           2548\\ntype:                Pulse-Eight USB-CEC Adapter\\n'
+    exit 0
+fi
+echo "opening a connection to the CEC adapter..."
+echo "stdout buffering [$_STDBUF_O]"
+while read command; do
+    echo "command: $command"
+    if [ "$command" = "q" ]; then
+        {quit}
+    fi
+done
+"""
+
+class TestRemoteCECClient(unittest.TestCase):
+
+    def setUp(self):
+        self.host = keySimulatorHost()
+        self.host.start()
+        self.addCleanup(self.host.stop)
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempDir.cleanup)
+        self.log = logModule('remoteCECClient')
+        self.stream = StreamToFile(os.path.join(self.tempDir.name, 'cec.log'), log=self.log)
+
+    def client(self, quit:str="exit 0"):
+        self.host.addCommand("cec-client", CEC_CLIENT.format(adaptor=ADAPTOR, quit=quit))
+        return RemoteCECClient(ADAPTOR, self.log, self.stream, "127.0.0.1", port=self.host.port,
+                               username=self.host.username, password=self.host.password, prompt=self.host.prompt)
+
+    def test_streamed_output(self):
+        """
+        Test cec-client is run line buffered, and its output streams into the log as it's written.
+        """
+        cec = self.client()
+        self.addCleanup(cec.stop)
+        self.assertTrue(self.stream.readUntil('stdout buffering [L]', 5))
+
+    def test_write_command(self):
+        """
+        Test messages are written to the stdin of cec-client.
+        """
+        cec = self.client()
+        self.addCleanup(cec.stop)
+        cec.sendMessage('1', '0', '0x04')
+        cec.sendSequence([('1', 'F', '0x82', ['0x10', '0x00'], 0), ('1', '0', '0x36', None, 10)])
+        self.assertTrue(self.stream.readUntil('command: tx 10:04', 5))
+        self.assertTrue(self.stream.readUntil('command: tx 10:36', 5))
+        with open(os.path.join(self.tempDir.name, 'cec.log')) as logFile:
+            commands = [line.strip() for line in logFile if line.startswith('command:')]
+        self.assertEqual(commands, ['command: tx 10:04', 'command: tx 1f:82:10:00', 'command: tx 10:36'])
+
+    def test_stop(self):
+        """
+        Test stop quits cec-client, which closes its channel.
+        """
+        cec = self.client()
+        start = time.monotonic()
+        cec.stop()
+        self.assertLess(time.monotonic() - start, remoteCECClient.STOP_TIMEOUT)
+        self.assertEqual(cec._stdout.channel.recv_exit_status(), 0)
+        self.assertTrue(cec._stdout.channel.closed)
+
+    def test_stop_closes_channel(self):
+        """
+        Test stop closes the channel of a cec-client that doesn't quit.
+        """
+        cec = self.client(quit=":")
+        with mock.patch.object(remoteCECClient, "STOP_TIMEOUT", 0.5):
+            start = time.monotonic()
+            cec.stop()
+        self.assertLess(time.monotonic() - start, 3)
+        self.assertTrue(cec._stdout.channel.closed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_simulatedCECController.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the HDMICECController against the simulated CEC bus,
+#*   **          so no CEC hardware is required.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.hdmiCECController import HDMICECController
+
+DEVICE_NETWORK = """
+hdmiCEC:
+  device_map:
+    - name: TV
+      type: tv
+      physical_address: 0.0.0.0
+      vendor_id: 00F0E0
+      children:
+        - name: Player
+          type: playback
+          physical_address: 1.0.0.0
+          active_source: true
+        - name: Soundbar
+          type: audio
+          physical_address: 2.0.0.0
+          power_status: standby
+"""
+
+class TestSimulatedCECController(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        configPath = os.path.join(self.tempDir.name, 'device_network.yml')
+        with open(configPath, 'w') as f:
+            f.write(DEVICE_NETWORK)
+        self.log = logModule('simulatedCEC')
+        self.log.logPath = self.tempDir.name + os.sep
+        self.cec = HDMICECController(self.log, {'type': 'simulated-cec-client',
+                                                'device_network_configuration': configPath})
+
+    def tearDown(self):
+        self.cec.stop()
+        self.tempDir.cleanup()
+
+    def test_list_devices(self):
+        """
+        Test the configured devices are given logical addresses from their types.
+        """
+        devices = self.cec.listDevices()
+        self.assertEqual([device['logical address'] for device in devices], ['0', '4', '5'])
+        self.assertEqual(devices[1]['name'], 'Player')
+        self.assertTrue(devices[1]['active source'])
+        self.assertEqual(devices[2]['power status'], 'standby')
+
+    def test_device_responses(self):
+        """
+        Test the simulated devices respond to standard requests.
+        """
+        self.cec.sendMessage('0', '4', '0x8F')
+        self.assertTrue(self.cec.checkMessageReceived('4', '0', '0x90', timeout=2, payload=['0x00']))
+        self.cec.sendMessage('4', '0', '0x8C')
+        self.assertTrue(self.cec.checkMessageReceived('0', 'F', '0x87', timeout=2, payload=['0x00', '0xF0', '0xE0']))
+        self.cec.sendMessage('0', '5', '0x8F')
+        self.assertTrue(self.cec.checkMessageReceived('5', '0', '0x90', timeout=2, payload=['0x01']))
+
+    def test_unsupported_opcode_aborted(self):
+        """
+        Test directed messages that aren't supported are answered with a feature abort.
+        """
+        self.cec.sendMessage('0', '4', '0xA0')
+        self.assertTrue(self.cec.checkMessageReceived('4', '0', '0x00', timeout=2, payload=['0xA0', '0x00']))
+
+    def test_standby(self):
+        """
+        Test a broadcast standby puts every device into standby.
+        """
+        self.cec.sendMessage('1', 'F', '0x36')
+        self.cec.sendMessage('0', '4', '0x8F')
+        self.assertTrue(self.cec.checkMessageReceived('4', '0', '0x90', timeout=2, payload=['0x01']))
+        self.assertEqual({device['power status'] for device in self.cec.listDevices()}, {'standby'})
+
+    def test_send_sequence(self):
+        """
+        Test a sequence is sent in order with the requested gaps.
+        """
+        results = self.cec.sendSequence([('1', '0', '0x04', None, 0),
+                                         ('1', 'F', '0x86', ['0x10', '0x00'], 50),
+                                         ('1', '4', '0x44', ['0x01'], 50),
+                                         ('1', '4', '0x45', None, 50)])
+        self.assertEqual([result['opCode'] for result in results], ['0x04', '0x86', '0x44', '0x45'])
+        self.assertEqual([result['planned'] for result in results], [0, 50, 100, 150])
+        for result in results:
+            self.assertGreaterEqual(result['sent'], result['planned'])
+            self.assertLess(result['sent'], result['planned'] + 25)
+        self.assertTrue(self.cec.checkMessageReceived('4', 'F', '0x82', timeout=2, payload=['0x10', '0x00']))
+
+    def test_send_sequence_bus_timing(self):
+        """
+        Test frames sent back to back are limited by the CEC bus timings.
+        """
+        self.cec.stop()
+        self.cec.controller._busTiming = True
+        self.cec.start()
+        results = self.cec.sendSequence([('1', '4', '0x44', ['0x01'], 0)] * 3)
+        # Start bit, three bytes and the signal free time is ~84ms per frame
+        gaps = [later['sent'] - earlier['sent'] for earlier, later in zip(results, results[1:])]
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 80)
+
+
+if __name__ == '__main__':
+    unittest.main()
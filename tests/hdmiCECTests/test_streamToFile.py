@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_streamToFile.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the line callbacks of the CEC stream logger.
+#*   **
+#* ******************************************************************************
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.streamToFile import StreamToFile
+
+class TestStreamToFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempDir.cleanup)
+        self.log = logModule('streamToFileTest')
+        self.stream = StreamToFile(os.path.join(self.tempDir.name, 'stream.log'), log=self.log)
+
+    def test_failing_callback(self):
+        """
+        Test a failing callback is logged, and doesn't stop the stream or the other callbacks.
+        """
+        lines = []
+        def brokenCallback(line):
+            raise ValueError('bad line')
+        self.stream.addLineCallback(brokenCallback)
+        self.stream.addLineCallback(lines.append)
+        with self.assertLogs('streamToFileTest', level='ERROR') as logs:
+            self.stream.writeStreamToFile(io.StringIO('first\nsecond\n'))
+            self.stream.stopStreamedLog()
+        self.assertEqual(lines, ['first\n', 'second\n'])
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn('bad line', logs.records[0].getMessage())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : kasa_benchmark.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Benchmarks the powerKasa backends against the local Kasa
+#*   **          simulator.
+#*   **
+#*   ** python tests/powerTests/kasa_benchmark.py --cycles 10
+#* ******************************************************************************
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerModules.kasaControl import powerKasa
+from framework.core.simulators.kasaSimulator import kasaSimulator
+
+def benchmark(kasa:powerKasa, cycles:int):
+    """Time alternate powerOn and powerOff calls.
+
+    Args:
+        kasa (powerKasa): The power module to benchmark.
+        cycles (int): Number of on/off cycles.
+
+    Returns:
+        list: Time of each call in milliseconds.
+    """
+    times = []
+    for _ in range(cycles):
+        for method in (kasa.powerOn, kasa.powerOff):
+            start = time.perf_counter()
+            if method() != True:
+                raise RuntimeError("{} failed".format(method.__name__))
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the powerKasa backends")
+    parser.add_argument("--cycles", type=int, default=10, help="on/off cycles per backend")
+    parser.add_argument("--latency", type=float, default=0, help="simulated device latency in seconds")
+    args = parser.parse_args()
+
+    log = logModule("kasaBenchmark")
+    simulator = kasaSimulator(latency=args.latency)
+    simulator.start()
+    try:
+        for backend in ("cli", "library"):
+            kasa = powerKasa(log, "127.0.0.1", backend=backend, port=simulator.port)
+            times = benchmark(kasa, args.cycles)
+            print("{:8} mean {:9.2f}ms  median {:9.2f}ms  max {:9.2f}ms".format(
+                backend, statistics.mean(times), statistics.median(times), max(times)))
+    finally:
+        simulator.stop()
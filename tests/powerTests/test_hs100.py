@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_hs100.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the HS100 power module and asyncio client against
+#*   **          simulated plugs.
+#*   **
+#* ******************************************************************************
+
+import os
+import struct
+import sys
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerModules.asyncLoop import getAsyncLoop
+from framework.core.powerModules.hs100 import powerHS100
+from framework.core.powerModules.hs100Async import decrypt, encrypt, hs100AsyncController
+from framework.core.simulators.kasaSimulator import kasaSimulator
+from framework.core.simulators.kasaSimulator import encrypt as referenceEncrypt
+
+class TestHS100(unittest.TestCase):
+
+    def setUp(self):
+        self.simulators = [kasaSimulator(power=10 * (index + 1)) for index in range(3)]
+        for simulator in self.simulators:
+            simulator.start()
+
+    def tearDown(self):
+        for simulator in self.simulators:
+            simulator.stop()
+
+    def test_cipher(self):
+        """
+        Test the vectorised cipher matches the byte by byte reference.
+        """
+        message = b'{"system":{"get_sysinfo":{}}}'
+        self.assertEqual(encrypt(message), struct.pack(">I", len(message)) + referenceEncrypt(message))
+        self.assertEqual(decrypt(referenceEncrypt(message)), message)
+        self.assertEqual(encrypt(b""), b"\x00\x00\x00\x00")
+        self.assertEqual(decrypt(b""), b"")
+
+    def test_persistent_connection(self):
+        """
+        Test the power module reuses one connection, and reconnects when it's dropped.
+        """
+        simulator = self.simulators[0]
+        plug = powerHS100(logModule("hs100Test"), "127.0.0.1", simulator.port)
+        self.assertTrue(plug.powerOn())
+        self.assertTrue(plug.getState())
+        self.assertTrue(plug.powerOff())
+        self.assertFalse(simulator.isOn())
+        self.assertEqual(plug.client.connectCount, 1)
+        simulator.stop()
+        simulator.start()
+        self.assertTrue(plug.powerOn())
+        self.assertEqual(plug.client.connectCount, 2)
+        self.assertEqual(plug.getPowerLevel(), 10)
+
+    def test_fan_out(self):
+        """
+        Test many plugs are switched and read concurrently.
+        """
+        controller = hs100AsyncController(["127.0.0.1:{}".format(simulator.port) for simulator in self.simulators])
+        results = controller.setState(True)
+        self.assertEqual(list(results.values()), [True, True, True])
+        self.assertTrue(all(simulator.isOn() for simulator in self.simulators))
+        readings = controller.getRealtime()
+        self.assertEqual([reading["power"] for reading in readings.values()], [10, 20, 30])
+
+        async def stream():
+            return [sample async for sample in controller.streamRealtime(interval=0.01, count=3)]
+        samples = getAsyncLoop().run(stream(), 5)
+        self.assertEqual(len(samples), 3)
+        self.assertEqual(samples[-1]["readings"][("127.0.0.1", self.simulators[2].port)]["voltage"], 230)
+        controller.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_kasaControl.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the in process python-kasa backend of powerKasa against
+#*   **          the local Kasa simulator.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerModules.kasaControl import powerKasa
+from framework.core.simulators.kasaSimulator import kasaSimulator
+
+class TestKasaLibraryBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("kasaTest")
+        self.simulators = []
+
+    def tearDown(self):
+        for simulator in self.simulators:
+            simulator.stop()
+
+    def startSimulator(self, outlets=0):
+        simulator = kasaSimulator(outlets=outlets)
+        simulator.start()
+        self.simulators.append(simulator)
+        return simulator
+
+    def test_plug(self):
+        """
+        Test a plug is switched and already switched plugs only need one request.
+        """
+        simulator = self.startSimulator()
+        kasa = powerKasa(self.log, "127.0.0.1", backend="library", port=simulator.port)
+        self.assertTrue(kasa.powerOn())
+        self.assertTrue(simulator.isOn())
+        self.assertTrue(kasa.is_on)
+        count = simulator.requestCount
+        self.assertTrue(kasa.powerOn())
+        self.assertEqual(simulator.requestCount, count + 1)
+        self.assertTrue(kasa.powerOff())
+        self.assertFalse(simulator.isOn())
+
+    def test_strip_outlet(self):
+        """
+        Test only the configured outlet of a strip is switched.
+        """
+        simulator = self.startSimulator(outlets=3)
+        kasa = powerKasa(self.log, "127.0.0.1", args="--index 1", options="--type strip", backend="library", port=simulator.port)
+        self.assertTrue(kasa.powerOn())
+        self.assertEqual(simulator.outlets, [False, True, False])
+        self.assertTrue(kasa.reboot())
+        self.assertEqual(simulator.outlets, [False, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
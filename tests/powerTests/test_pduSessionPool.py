@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_pduSessionPool.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests PDUs share one persistent telnet session between
+#*   **          outlets, and reconnect when the session is dropped.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerControl import powerControlClass
+from framework.core.powerModules.pduSessionPool import closePduSessions
+from framework.core.simulators.pduSimulator import pduSimulator
+
+class TestPduSessionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("pduSessionPoolTest")
+
+    def tearDown(self):
+        closePduSessions()
+        self.simulator.stop()
+
+    def startSimulator(self, protocol, username="apc", password="apc"):
+        self.simulator = pduSimulator(protocol, username=username, password=password)
+        self.simulator.start()
+
+    def powerControl(self, **config):
+        config.update({"ip": "127.0.0.1", "port": self.simulator.port, "retryCount": 0, "session_keepalive": 60})
+        return powerControlClass(self.log, config)
+
+    def test_aos_outlets_share_session(self):
+        """
+        Test outlets on the same AOS PDU share one login.
+        """
+        self.startSimulator("aos")
+        outlet1 = self.powerControl(type="apcAos", username="apc", password="apc", outlet=1)
+        outlet2 = self.powerControl(type="apcAos", username="apc", password="apc", outlet=2)
+        for _ in range(3):
+            self.assertTrue(outlet1.powerOn())
+            self.assertTrue(outlet2.powerOn())
+            self.assertTrue(outlet1.powerOff())
+        self.assertFalse(self.simulator.isOn(1))
+        self.assertTrue(self.simulator.isOn(2))
+        self.assertEqual(self.simulator.connectionCount, 1)
+
+    def test_slp(self):
+        """
+        Test outlets on the same SLP PDU share one login.
+        """
+        self.startSimulator("slp", username="admn", password="admn")
+        outlet = self.powerControl(type="SLP", username="admn", password="admn", outlet_id=3)
+        self.assertTrue(outlet.powerOn())
+        self.assertTrue(self.simulator.isOn(3))
+        other = self.powerControl(type="SLP", username="admn", password="admn", outlet_id=4)
+        self.assertTrue(other.powerOn())
+        self.assertEqual(self.simulator.connectionCount, 1)
+
+    def test_reconnect_after_drop(self):
+        """
+        Test a session dropped by the PDU is reopened by the next command.
+        """
+        self.startSimulator("olimex", username=None)
+        relay = self.powerControl(type="olimex", relay=1)
+        self.assertTrue(relay.powerOn())
+        self.simulator.dropConnections()
+        self.assertTrue(relay.powerOff())
+        self.assertFalse(self.simulator.isOn(1))
+        self.assertEqual(self.simulator.connectionCount, 2)
+
+    def test_pipelined_group(self):
+        """
+        Test a group of SLP outlets is switched with pipelined commands in one session.
+        """
+        self.startSimulator("slp", username="admn", password="admn")
+        outlets = [self.powerControl(type="SLP", username="admn", password="admn", outlet_id=outlet) for outlet in [2, 4, 6]]
+        self.assertTrue(powerControlClass.powerGroup(outlets, True))
+        self.assertEqual(self.simulator.commands, ["ON 2", "ON 4", "ON 6"])
+        self.assertEqual(self.simulator.connectionCount, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_powerControl.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the powerControlClass outlet state cache.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerControl import powerControlClass
+from framework.core.simulators.kasaSimulator import kasaSimulator
+
+class TestPowerStateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.simulator = kasaSimulator()
+        self.simulator.start()
+        self.power = powerControlClass(logModule("powerControlTest"),
+                                       {"type": "kasa",
+                                        "ip": "127.0.0.1",
+                                        "port": self.simulator.port,
+                                        "backend": "library",
+                                        "retryCount": 0,
+                                        "state_cache_ttl": 60})
+
+    def tearDown(self):
+        self.simulator.stop()
+
+    def test_redundant_commands_skipped(self):
+        """
+        Test switching to the cached state doesn't query the switch.
+        """
+        self.assertTrue(self.power.powerOn())
+        count = self.simulator.requestCount
+        self.assertTrue(self.power.powerOn())
+        self.assertTrue(self.power.getState())
+        self.assertEqual(self.simulator.requestCount, count)
+
+    def test_refresh(self):
+        """
+        Test a refresh reads a state changed outside the framework.
+        """
+        self.assertTrue(self.power.powerOn())
+        self.simulator.relayState = False
+        self.assertTrue(self.power.getState())
+        self.assertFalse(self.power.getState(refresh=True))
+        self.assertTrue(self.power.powerOn())
+        self.assertTrue(self.simulator.isOn())
+
+    def test_failure_invalidates(self):
+        """
+        Test a failed command discards the cached state.
+        """
+        self.assertTrue(self.power.powerOn())
+        self.simulator.stop()
+        with self.assertRaises(Exception):
+            self.power.powerOff()
+        self.assertIsNone(self.power.getCachedState())
+
+
+if __name__ == '__main__':
+    unittest.main()
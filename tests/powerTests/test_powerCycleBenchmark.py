@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_powerCycleBenchmark.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the power cycle to ready benchmark times each boot
+#*   **          stage from the console and network probes.
+#*   **
+#* ******************************************************************************
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerControl import powerControlClass
+from framework.core.powerCycleBenchmark import powerCycleBenchmark
+
+BOOT_LOG = [(0.05, "\x00"),
+            (0.10, "U-Boot 2021.01\r\n"),
+            (0.20, "Starting kernel ...\r\n"),
+            (0.30, "Linux version 5.15\r\nrdk lo"),
+            (0.40, "gin: ")]
+
+class bootConsole():
+    """Console that replays a boot log, timed from the read that drains it before power on."""
+
+    def __init__(self):
+        self.start = None
+
+    def read_all(self):
+        now = time.monotonic()
+        if self.start == None:
+            self.start = now
+            self.sent = 0
+            return ""
+        output = ""
+        while self.sent < len(BOOT_LOG) and now - self.start >= BOOT_LOG[self.sent][0]:
+            output += BOOT_LOG[self.sent][1]
+            self.sent += 1
+        return output
+
+class TestPowerCycleBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("powerCycleBenchmarkTest")
+        self.power = powerControlClass(self.log, {"type": "none"})
+        self.sshServer = socket.socket()
+        self.sshServer.bind(("127.0.0.1", 0))
+
+    def tearDown(self):
+        self.sshServer.close()
+
+    def startSsh(self, delay):
+        def serve():
+            time.sleep(delay)
+            self.sshServer.listen()
+            connection, _ = self.sshServer.accept()
+            connection.sendall(b"SSH-2.0-OpenSSH_8.4\r\n")
+            connection.close()
+        threading.Thread(target=serve, daemon=True).start()
+
+    def test_stage_times(self):
+        """
+        Test each stage is timed from power on, and a missed stage is reported.
+        """
+        benchmark = powerCycleBenchmark(self.power, bootConsole(), host="127.0.0.1", log=self.log,
+                                        probes=("ssh",), sshPort=self.sshServer.getsockname()[1],
+                                        consoleMilestones={"bootloader": "U-Boot", "kernel": "Linux version",
+                                                           "login": "login:", "shell": r"\$ "},
+                                        offTime=0, timeout=1)
+        self.startSsh(0.5)
+        result = benchmark.runCycle()
+        self.assertAlmostEqual(result["console"], 0.05, delta=0.05)
+        self.assertAlmostEqual(result["bootloader"], 0.10, delta=0.05)
+        self.assertAlmostEqual(result["kernel"], 0.30, delta=0.05)
+        self.assertAlmostEqual(result["login"], 0.40, delta=0.05)
+        self.assertIsNone(result["shell"])
+        self.assertAlmostEqual(result["ssh"], 0.5, delta=0.1)
+
+    def test_report(self):
+        """
+        Test the report gives the distribution over cycles and is written as CSV.
+        """
+        benchmark = powerCycleBenchmark(self.power, log=self.log, offTime=0)
+        benchmark.results = [{"power_on": 0.1}, {"power_on": 0.3}, {"power_on": 0.2}]
+        report = benchmark.getReport()
+        self.assertEqual(report["power_on"]["reached"], 3)
+        self.assertAlmostEqual(report["power_on"]["median"], 0.2)
+        self.assertAlmostEqual(report["power_on"]["max"], 0.3)
+        with tempfile.TemporaryDirectory() as directory:
+            cyclesPath, summaryPath = benchmark.save(directory)
+            with open(cyclesPath) as csvFile:
+                self.assertEqual(csvFile.read().splitlines(), ["cycle,power_on", "1,0.100", "2,0.300", "3,0.200"])
+            with open(summaryPath) as csvFile:
+                self.assertEqual(csvFile.read().splitlines()[1], "power_on,3,3,0.100,0.200,0.200,0.280,0.300")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_powerSimulators.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the power modules against the local PDU and smart plug
+#*   **          simulators, including their recovery from injected faults.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerControl import powerControlClass
+from framework.core.powerModules.pduSessionPool import closePduSessions
+from framework.core.simulators.__main__ import main
+from framework.core.simulators.faults import faultInjector
+from framework.core.simulators.kasaSimulator import kasaSimulator
+from framework.core.simulators.pduSimulator import pduSimulator
+
+class TestPowerSimulators(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("powerSimulatorsTest")
+        self.simulator = None
+
+    def tearDown(self):
+        closePduSessions()
+        if self.simulator:
+            self.simulator.stop()
+
+    def startSimulator(self, protocol, **kwargs):
+        if protocol == "hs100":
+            self.simulator = kasaSimulator(**kwargs)
+        else:
+            self.simulator = pduSimulator(protocol, **kwargs)
+        self.simulator.start()
+        return self.simulator
+
+    def powerControl(self, **config):
+        config.update({"ip": "127.0.0.1", "port": self.simulator.port})
+        config.setdefault("retryCount", 0)
+        return powerControlClass(self.log, config)
+
+    def test_apc_menu(self):
+        """
+        Test the APC module navigates the menu console to switch an outlet.
+        """
+        self.startSimulator("apc")
+        outlet = self.powerControl(type="apc", username="apc", password="apc", outlet=3)
+        self.assertTrue(outlet.powerOn())
+        self.assertTrue(self.simulator.isOn(3))
+        self.assertTrue(outlet.powerOff())
+        self.assertFalse(self.simulator.isOn(3))
+        self.assertEqual(self.simulator.commands, ["on 3", "off 3"])
+
+    def test_apc_menu_pooled(self):
+        """
+        Test a pooled APC session returns to the top menu between operations.
+        """
+        self.startSimulator("apc")
+        outlet1 = self.powerControl(type="apc", username="apc", password="apc", outlet=1, session_keepalive=60)
+        outlet2 = self.powerControl(type="apc", username="apc", password="apc", outlet=2, session_keepalive=60)
+        self.assertTrue(outlet1.powerOn())
+        self.assertTrue(outlet2.powerOn())
+        self.assertTrue(outlet1.powerOff())
+        self.assertFalse(self.simulator.isOn(1))
+        self.assertTrue(self.simulator.isOn(2))
+        self.assertEqual(self.simulator.connectionCount, 1)
+
+    def test_aos_error(self):
+        """
+        Test a PDU error response fails the command.
+        """
+        self.startSimulator("aos")
+        self.simulator.faults.failNext("error")
+        outlet = self.powerControl(type="apcAos", username="apc", password="apc", outlet=1)
+        self.assertFalse(outlet.powerOn())
+        self.assertFalse(self.simulator.isOn(1))
+        self.assertTrue(outlet.powerOn())
+        self.assertTrue(self.simulator.isOn(1))
+
+    def test_aos_drop_retried(self):
+        """
+        Test powerControl retries a command when the PDU drops the connection.
+        """
+        self.startSimulator("aos")
+        self.simulator.faults.failNext("drop")
+        outlet = self.powerControl(type="apcAos", username="apc", password="apc", outlet=1, retryCount=1, retryDelay=0)
+        self.assertTrue(outlet.powerOn())
+        self.assertTrue(self.simulator.isOn(1))
+        self.assertEqual(self.simulator.faults.injected["drop"], 1)
+        self.assertEqual(self.simulator.connectionCount, 2)
+
+    def test_dropped_session_reconnects(self):
+        """
+        Test a pooled session dropped mid command reconnects and sends it again.
+        """
+        self.startSimulator("slp", username="admn", password="admn")
+        outlet = self.powerControl(type="SLP", username="admn", password="admn", outlet_id=1, session_keepalive=60)
+        self.assertTrue(outlet.powerOn())
+        self.simulator.faults.failNext("drop")
+        self.assertTrue(outlet.powerOff())
+        self.assertFalse(self.simulator.isOn(1))
+        self.assertEqual(self.simulator.connectionCount, 2)
+
+    def test_hs100_dropped_connection(self):
+        """
+        Test the HS100 client reconnects when the plug drops its connection.
+        """
+        self.startSimulator("hs100")
+        plug = self.powerControl(type="hs100")
+        self.assertTrue(plug.powerOn())
+        self.simulator.faults.failNext("drop")
+        self.assertTrue(plug.powerOff())
+        self.assertFalse(self.simulator.isOn())
+
+    def test_latency(self):
+        """
+        Test the simulator delays each answer by its latency.
+        """
+        self.startSimulator("olimex", latency=0.2)
+        relay = self.powerControl(type="olimex", relay=1)
+        start = time.monotonic()
+        self.assertTrue(relay.powerOn())
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_fault_rate(self):
+        """
+        Test random faults are injected at the configured rate, repeatably with a seed.
+        """
+        first = faultInjector(0.25, "timeout", seed=1)
+        second = faultInjector(0.25, "timeout", seed=1)
+        faults = [first.nextFault() for _ in range(1000)]
+        self.assertEqual(faults, [second.nextFault() for _ in range(1000)])
+        self.assertTrue(200 < first.injected["timeout"] < 300)
+        self.assertRaises(ValueError, faultInjector, 0.1, "corrupt")
+
+    def test_cli_arguments(self):
+        """
+        Test the command line rejects unknown protocols.
+        """
+        with self.assertRaises(SystemExit):
+            main(["unknown"])
+
+
+def test_aos_fixture(aosSimulator):
+    """
+    Test the pytest fixture starts a simulator the power modules can use.
+    """
+    outlet = powerControlClass(logModule("powerSimulatorsTest"), {"type": "apcAos", "ip": "127.0.0.1", "port": aosSimulator.port,
+                                                                  "username": "apc", "password": "apc", "outlet": 2, "retryCount": 0})
+    assert outlet.powerOn()
+    assert aosSimulator.isOn(2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_powerTelemetry.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests background power telemetry sampling against a
+#*   **          simulated Kasa plug with an energy meter.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerControl import powerControlClass
+from framework.core.powerTelemetry import powerTelemetrySampler
+from framework.core.simulators.kasaSimulator import kasaSimulator
+
+class TestPowerTelemetry(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("powerTelemetryTest")
+        self.simulator = kasaSimulator(power=6, voltage=240)
+        self.simulator.start()
+        self.power = powerControlClass(self.log, {"type": "kasa",
+                                                  "ip": "127.0.0.1",
+                                                  "port": self.simulator.port,
+                                                  "backend": "library",
+                                                  "retryCount": 0})
+        self.sampler = powerTelemetrySampler(self.power, self.log, rate=50, capacity=40,
+                                             channels=("power", "voltage", "current"))
+
+    def tearDown(self):
+        self.sampler.stop()
+        self.simulator.stop()
+
+    def test_tagged_stats(self):
+        """
+        Test samples are tagged, and the stats follow the outlet state.
+        """
+        self.sampler.setTag("off")
+        self.sampler.start()
+        time.sleep(0.2)
+        # Samples taken while switching are tagged apart, as they may read either state
+        self.sampler.setTag("switching")
+        self.power.powerOn()
+        self.sampler.setTag("on")
+        time.sleep(0.3)
+        self.sampler.stop()
+        on = self.sampler.getStats(tag="on")
+        self.assertGreater(on["samples"], 5)
+        self.assertAlmostEqual(on["power_mean"], 6, places=1)
+        self.assertEqual(on["voltage_peak"], 240)
+        self.assertAlmostEqual(on["current_mean"], 0.025, places=3)
+        self.assertAlmostEqual(on["energy_wh"], 6 * on["duration"] / 3600, places=6)
+        self.assertEqual(self.sampler.getStats(tag="off")["power_peak"], 0)
+
+    def test_ring_buffer(self):
+        """
+        Test only the latest samples are kept, oldest first.
+        """
+        for _ in range(50):
+            self.sampler.sample()
+        samples = self.sampler.getSamples()
+        self.assertEqual(len(samples["time"]), 40)
+        self.assertTrue(np.all(np.diff(samples["time"]) >= 0))
+
+    def test_failed_reading(self):
+        """
+        Test a failed reading is recorded as NaN, and the channel is read again on the next sample.
+        """
+        failures = [RuntimeError("device busy")]
+        def readPower():
+            if failures:
+                raise failures.pop()
+            return 5
+        self.sampler._readers["power"] = readPower
+        self.sampler.sample()
+        self.sampler.sample()
+        power = self.sampler.getSamples()["power"]
+        self.assertTrue(np.isnan(power[0]))
+        self.assertEqual(power[1], 5)
+
+    def test_save(self):
+        """
+        Test the samples are written as CSV and NPZ columns.
+        """
+        self.sampler.setTag("idle")
+        for _ in range(3):
+            self.sampler.sample()
+        with tempfile.TemporaryDirectory() as directory:
+            csvPath, npzPath = self.sampler.save(directory)
+            with open(csvPath) as csvFile:
+                lines = csvFile.read().splitlines()
+            self.assertEqual(lines[0], "time,power,voltage,current,step,tag")
+            self.assertEqual(len(lines), 4)
+            self.assertTrue(lines[1].endswith(",idle"))
+            with np.load(npzPath) as data:
+                self.assertEqual(list(data["power"]), [0, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
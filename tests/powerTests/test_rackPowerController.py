@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_rackPowerController.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests rack wide power operations run concurrently and are
+#*   **          staggered between slots sharing a power switch.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import time
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.simulators.pduSimulator import pduSimulator
+from framework.core.rackController import rack, rackSlot
+from framework.core.rackPowerController import DEFAULT_REBOOT_DELAY, rackPowerController
+
+def slotConfig(name, switchIp):
+    return {"name": name,
+            "devices": [{"dut": {"ip": "127.0.0.1",
+                                 "powerSwitch": {"type": "none", "ip": switchIp, "retryCount": 0}}}]}
+
+class TestRackPowerController(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("rackPowerTest")
+        self.rack = rack(self.log)
+        self.rack.slot = []
+        self.rack.rawConfig = {"name": "rack1", "power_stagger": 0.2}
+        for index, switchIp in enumerate(["10.0.0.1", "10.0.0.1", "10.0.0.2", "10.0.0.3"]):
+            self.rack.addSlot(rackSlot(slotConfig("slot%d" % (index+1), switchIp), self.log))
+        self.rackPower = rackPowerController(self.rack, self.log)
+
+    def test_reboot_concurrent(self):
+        """
+        Test a rack wide reboot takes about the time of one slot.
+        """
+        start = time.monotonic()
+        results = self.rackPower.reboot()
+        elapsed = time.monotonic() - start
+        self.assertEqual(sorted(results.keys()), ["slot1", "slot2", "slot3", "slot4"])
+        self.assertTrue(all(result["result"] for result in results.values()))
+        # Each reboot takes ~1s, the only extra time is the stagger on the shared switch
+        self.assertLess(elapsed, 2)
+
+    def test_stagger_shared_switch(self):
+        """
+        Test only slots sharing a power switch are staggered.
+        """
+        results = self.rackPower.powerOn()
+        self.assertEqual([results[name]["delay"] for name in ["slot1", "slot2", "slot3", "slot4"]], [0, 0.2, 0, 0])
+        self.assertGreaterEqual(results["slot2"]["start"], 0.2)
+        results = self.rackPower.powerOff()
+        self.assertEqual({result["delay"] for result in results.values()}, {0})
+
+    def test_select_slots(self):
+        """
+        Test slots can be selected by name or index.
+        """
+        results = self.rackPower.powerOn(["slot1", 3])
+        self.assertEqual(sorted(results.keys()), ["slot1", "slot3"])
+        with self.assertRaises(ValueError):
+            self.rackPower.powerOn(["slot9"])
+        for index in [0, -1, 5]:
+            with self.assertRaises(ValueError):
+                self.rackPower.powerOn([index])
+
+
+class TestRackPowerGroups(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("rackPowerGroupTest")
+        self.simulator = pduSimulator("aos")
+        self.simulator.start()
+        self.rack = rack(self.log)
+        self.rack.slot = []
+        self.rack.rawConfig = {"name": "rack1"}
+        for outlet in [1, 3, 5]:
+            config = slotConfig("slot%d" % outlet, "127.0.0.1")
+            config["devices"][0]["dut"]["powerSwitch"] = {"type": "apcAos", "ip": "127.0.0.1", "port": self.simulator.port,
+                                                          "username": "apc", "password": "apc", "outlet": outlet,
+                                                          "retryCount": 0}
+            self.rack.addSlot(rackSlot(config, self.log))
+        self.rackPower = rackPowerController(self.rack, self.log)
+
+    def tearDown(self):
+        self.simulator.stop()
+
+    def test_coalesced_command(self):
+        """
+        Test slots on one AOS PDU are switched with a single multi-outlet command.
+        """
+        results = self.rackPower.powerOn()
+        self.assertTrue(all(result["result"] for result in results.values()))
+        self.assertEqual(self.simulator.commands, ["olOn 1,3,5"])
+        self.assertEqual(self.simulator.outlets[:5], [True, False, True, False, True])
+        self.simulator.commands.clear()
+        results = self.rackPower.reboot(["slot1", "slot3"])
+        self.assertEqual(self.simulator.commands, ["olOff 1,3", "olOn 1,3"])
+        # The outlets are left off for the reboot delay between the two commands
+        self.assertGreaterEqual(results["slot1"]["duration"], self.rackPower.rebootDelay)
+
+    def test_reboot_delay(self):
+        """
+        Test the grouped reboot delay is configurable, but never shorter than the default.
+        """
+        self.rack.rawConfig["reboot_delay"] = 1.5
+        self.assertEqual(rackPowerController(self.rack, self.log).rebootDelay, 1.5)
+        self.assertEqual(rackPowerController(self.rack, self.log, rebootDelay=0).rebootDelay, DEFAULT_REBOOT_DELAY)
+
+
+if __name__ == '__main__':
+    unittest.main()
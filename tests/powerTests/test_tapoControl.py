@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_tapoControl.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the in process python-kasa backend of powerTapo against
+#*   **          the local Kasa simulator.
+#*   **
+#* ******************************************************************************
+
+import os
+import sys
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.powerModules import tapoControl
+from framework.core.powerModules.tapoControl import powerTapo
+from framework.core.simulators.kasaSimulator import kasaSimulator
+
+class TestTapoLibraryBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("tapoTest")
+        self.simulator = kasaSimulator(outlets=3)
+        self.simulator.start()
+
+    def tearDown(self):
+        self.simulator.stop()
+
+    def createTapo(self, outlet):
+        return powerTapo(self.log, "127.0.0.1", outlet=outlet, backend="library", port=self.simulator.port, timeout=2)
+
+    def test_outlets_share_device(self):
+        """
+        Test outlets of the same strip share one discovered device.
+        """
+        first = self.createTapo(0)
+        second = self.createTapo(2)
+        self.assertEqual(len([key for key in tapoControl._LIBRARY_DEVICES if key[1] == self.simulator.port]), 1)
+        self.assertTrue(first.powerOn())
+        self.assertTrue(second.powerOn())
+        self.assertTrue(first.powerOff())
+        self.assertEqual(self.simulator.outlets, [False, False, True])
+
+    def test_outlet_states(self):
+        """
+        Test every outlet state is read in one call.
+        """
+        tapo = self.createTapo(1)
+        self.assertTrue(tapo.powerOn())
+        self.assertEqual(tapo.getOutletStates(), [False, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#** ******************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2026 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+#*
+#*   ** Project      : RAFT
+#*   ** @addtogroup  : tests
+#*   ** @file        : test_utPlaneController.py
+#*   ** @date        : 19/10/2026
+#*   **
+#*   ** @brief : Tests the HTTP transport of the utPlaneController against a
+#*   **          local HTTP server standing in for the ut-controller.
+#*   **
+#* ******************************************************************************
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+import threading
+import unittest
+
+# Add the directory containing the framework package to the Python path
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.append(path)
+
+from framework.core.logModule import logModule
+from framework.core.utPlaneController import KVP_ENDPOINT, utPlaneController
+
+class utControllerHandler(BaseHTTPRequestHandler):
+    """
+    Records each posted document with the client address it came from.
+    Documents containing "fail" are rejected with a 500.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        self.server.requests.append((self.client_address, self.path, body))
+        status = 500 if "fail" in body else 200
+        response = b'{"result": "error"}' if status != 200 else b'{"result": "ok"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+        if self.server.dropConnection:
+            # Close without telling the client, as a restarted ut-controller would
+            self.server.dropConnection = False
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+class TestUtPlaneController(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logModule("utPlaneTest")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), utControllerHandler)
+        self.server.requests = []
+        self.server.dropConnection = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        # The http transport doesn't use the session, it only has to be given
+        self.controller = utPlaneController(object(), port=self.server.server_address[1], log=self.log,
+                                            transport="http", address="127.0.0.1", timeout=2)
+        self.addCleanup(self.controller.close)
+
+    def connections(self):
+        return len({address for address, _, _ in self.server.requests})
+
+    def test_keep_alive(self):
+        """
+        Test messages are posted to the KVP endpoint on one kept alive connection.
+        """
+        self.assertTrue(self.controller.sendMessage("HdmiCec:\n  command: one\n"))
+        response = self.controller.postKVP("HdmiCec:\n  command: two\n")
+        self.assertEqual(response["status"], 200)
+        self.assertEqual(response["data"], {"result": "ok"})
+        self.assertEqual([path for _, path, _ in self.server.requests], [KVP_ENDPOINT] * 2)
+        self.assertEqual(self.connections(), 1)
+
+    def test_dropped_connection(self):
+        """
+        Test a message is sent again on a new connection when the server dropped the old one.
+        """
+        self.server.dropConnection = True
+        self.assertTrue(self.controller.sendMessage("first"))
+        self.assertTrue(self.controller.sendMessage("second"))
+        self.assertEqual([body for _, _, body in self.server.requests], ["first", "second"])
+        self.assertEqual(self.connections(), 2)
+
+    def test_batch(self):
+        """
+        Test a batch is posted in order on one connection, with a result per message.
+        """
+        documents = ["message: {}".format(index) for index in range(5)]
+        self.assertEqual(self.controller.sendMessages(documents), [True] * 5)
+        self.assertEqual([body for _, _, body in self.server.requests], documents)
+        self.assertEqual(self.connections(), 1)
+
+    def test_error_status(self):
+        """
+        Test a message the ut-controller rejects fails, without affecting the rest of the batch.
+        """
+        self.assertFalse(self.controller.sendMessage("fail"))
+        self.assertEqual(self.controller.sendMessages(["ok", "fail", "ok"]), [True, False, True])
+        self.assertEqual(self.controller.postKVP("fail")["status"], 500)
+
+if __name__ == '__main__':
+    unittest.main()